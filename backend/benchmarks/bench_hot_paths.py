@@ -0,0 +1,143 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/benchmarks/bench_hot_paths.py
+Description: pytest-benchmark suite of the backend hot paths, the results are stored as JSON to compare
+the changes for regressions.
+
+Usage (from backend, `pipenv install --dev`; DATABASE_URL set and schema pushed for the DB benchmarks):
+    # Store a baseline (benchmarks/results/<machine>/0001_<commit>.json)
+    pytest benchmarks/bench_hot_paths.py --benchmark-storage=benchmarks/results --benchmark-autosave
+    # Compare with the latest stored run, failing if a median is more than 10% slower
+    pytest benchmarks/bench_hot_paths.py --benchmark-storage=benchmarks/results --benchmark-autosave \
+        --benchmark-compare --benchmark-compare-fail=median:10%
+
+Compare runs of the same machine only. The size of the seeded dataset is set by BENCHMARK_FACILITIES and
+BENCHMARK_REVIEWS_PER_DEVICE (see benchmarks/conftest.py).
+"""
+
+import base64
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+
+import pytest
+from benchmarks.response_benchmark import latest_reviews_payload
+from PIL import Image
+from src.config import APP_SECRET_KEY
+from src.core import db
+from src.libs.auth import validate_auth_token
+from src.logger import FormatterJSON
+from src.models.reviews import build_device_query, get_checking_reviews_info
+from src.schemas.reviews import ReviewListResponseSchema, ReviewListSchema
+from src.services.aitrios_service import decrypt_customer_details
+from src.services.facility_service import FacilityService
+from src.services.image_service import normalize_base64_image
+from src.utils import encrypt_data
+
+LOG_FORMAT = "[%(levelname)s]\t%(asctime)s\t%(message)s\n"
+LATE_MINUTES = 10
+
+
+@pytest.mark.parametrize(
+    "facility_name, status",
+    [(None, None), ("Sakura", None), (None, "2"), ("Tower Plaza", "01")],
+    ids=["no-filter", "facility-name", "status", "facility-name-status"],
+)
+def test_build_device_query(benchmark, seeded_customer, facility_name, status):
+    parameters = ReviewListSchema(customer_id=seeded_customer.id, facility_name=facility_name, status=status, page=1)
+    benchmark(build_device_query, db, seeded_customer.id, parameters)
+
+
+def test_get_checking_reviews_info(benchmark, seeded_customer):
+    info = benchmark(get_checking_reviews_info, db, seeded_customer.admin_id, seeded_customer.id, LATE_MINUTES)
+    assert info["current"] > 0
+
+
+def test_formatter_json_format(benchmark):
+    formatter = FormatterJSON(LOG_FORMAT)
+    record = logging.LogRecord("caat-backend", logging.INFO, __file__, 1, "GET /reviews 200 %s", ("ok",), None)
+    record.ErrorCode = "-"
+    record.DbQueryCount = 3
+    record.DbQueryTimeMs = 1.25
+    benchmark(formatter.format, record)
+
+
+@pytest.mark.parametrize("size", [(640, 480), (1920, 1080)], ids=["vga", "full-hd"])
+def test_normalize_base64_image(benchmark, size):
+    rng = random.Random(42)
+    image = Image.frombytes("RGB", size, rng.randbytes(size[0] * size[1] * 3))
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    data_url = "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+    assert benchmark(normalize_base64_image, data_url).startswith("data:image/")
+
+
+def test_decrypt_customer_details(benchmark):
+    customer = {
+        "client_id": encrypt_data("0oa1b2c3d4e5f6g7h8i9"),
+        "client_secret": encrypt_data("s" * 40),
+        "application_id": encrypt_data("00000000-0000-0000-0000-000000000000"),
+        "base_url": "https://console.aitrios.sony-semicon.com/api/v1",
+    }
+    # decrypt_customer_details decrypts in place
+    benchmark(lambda: decrypt_customer_details(dict(customer)))
+
+
+@pytest.mark.parametrize("page_size", [20, 100])
+def test_review_list_response_serialization(benchmark, page_size):
+    body = latest_reviews_payload(random.Random(42), page_size, 0)
+    data = body["data"]
+    benchmark(
+        lambda: ReviewListResponseSchema(
+            data=data, page=1, total=page_size, page_size=page_size, size=page_size
+        ).make_response()
+    )
+
+
+def test_generate_qr_code(benchmark, tmp_path):
+    service = FacilityService(
+        facility_id=1,
+        customer_id=1,
+        secret_key=APP_SECRET_KEY,
+        start_time="2024-01-01T00:00:00+0000",
+        exp="2099-12-31T23:59:59+0000",
+        url="https://caat.example.com",
+    )
+    payload = f"{service.url}?token={service.generate_jwt_token()}"
+
+    assert benchmark(service.generate_qr_code, payload, str(tmp_path / "qr.png"))
+
+
+def test_validate_auth_token(benchmark, app, seeded_customer):
+    facility = db.facility.find_first(where={"customer_id": seeded_customer.id})
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    service = FacilityService(
+        facility_id=facility.id,
+        customer_id=seeded_customer.id,
+        secret_key=APP_SECRET_KEY,
+        start_time=(now - timedelta(minutes=1)).strftime("%Y-%m-%dT%H:%M:%S%z"),
+        exp=(now + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S%z"),
+    )
+    view = validate_auth_token(lambda payload: payload)
+
+    with app.test_request_context(headers={"Authorization": f"Bearer {service.generate_jwt_token()}"}):
+        payload = benchmark(view)
+    assert payload["facility_id"] == facility.id
@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/benchmarks/conftest.py
+Description: Fixtures of the pytest-benchmark suite (benchmarks/bench_hot_paths.py).
+
+The DB benchmarks run against the database of DATABASE_URL (a local Postgres with the schema pushed)
+and are skipped without it. The benchmark customer is created once per run and removed at the end.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from benchmarks.facility_search_benchmark import BATCH_SIZE, cleanup, seed
+from flask import Flask
+from src.core import db
+from src.schemas.reviews import DeviceReviewAllowedEnums
+
+BENCHMARK_FACILITIES = int(os.getenv("BENCHMARK_FACILITIES", "2000"))
+BENCHMARK_REVIEWS_PER_DEVICE = int(os.getenv("BENCHMARK_REVIEWS_PER_DEVICE", "5"))
+BENCHMARK_SEED = 42
+REQUESTING = DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value
+REVIEWED = [DeviceReviewAllowedEnums.REJECTED.value, DeviceReviewAllowedEnums.APPROVED.value]
+
+
+def seed_reviews(customer_id: int, reviews_per_device: int, seed_value: int) -> None:
+    """
+    Method to create the reviews of the benchmark devices, the latest review of a third of them is pending
+    """
+    rng = random.Random(seed_value)
+    now = datetime.now(timezone.utc)
+    devices = db.device.find_many(where={"facility": {"customer_id": customer_id}}, order={"id": "asc"})
+    rows = []
+    for device in devices:
+        pending = rng.random() < 1 / 3
+        for index in range(reviews_per_device):
+            latest = index == reviews_per_device - 1
+            age_minutes = rng.randint(0, 120) + 180 * (reviews_per_device - 1 - index)
+            rows.append(
+                {
+                    "customer_id": customer_id,
+                    "facility_id": device.facility_id,
+                    "device_id": device.id,
+                    "result": REQUESTING if latest and pending else rng.choice(REVIEWED),
+                    # Latest reviews within the last two hours, around the `late_minutes` threshold
+                    "created_at_utc": now - timedelta(minutes=age_minutes),
+                }
+            )
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.review.create_many(data=rows[start : start + BATCH_SIZE])
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Flask application providing the request context of the benchmarks
+    """
+    return Flask(__name__)
+
+
+@pytest.fixture(scope="session")
+def seeded_customer():
+    """
+    Customer with BENCHMARK_FACILITIES facilities (one device each) and their reviews, yields
+    the customer record
+    """
+    if not os.getenv("DATABASE_URL"):
+        pytest.skip("DATABASE_URL is not set")
+
+    db.connect()
+    customer_id = seed(db, BENCHMARK_FACILITIES, BENCHMARK_SEED)
+    try:
+        seed_reviews(customer_id, BENCHMARK_REVIEWS_PER_DEVICE, BENCHMARK_SEED)
+        yield db.customer.find_unique(where={"id": customer_id})
+    finally:
+        db.review.delete_many(where={"customer_id": customer_id})
+        cleanup(db, customer_id)
+        db.disconnect()
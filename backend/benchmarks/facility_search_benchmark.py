@@ -0,0 +1,167 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/benchmarks/facility_search_benchmark.py
+Description: Latency of the facility filters of build_device_query on a 50k facility dataset.
+
+Usage (from backend, DATABASE_URL set, schema pushed):
+    python -m benchmarks.facility_search_benchmark --facilities 50000 --cleanup
+
+Run once before and once after applying the search indexes to compare.
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+
+from prisma import Prisma
+from src.models.facility_search import FacilitySearch, get_facility_search
+from src.models.reviews import build_device_query
+from src.schemas.reviews import ReviewListSchema
+
+PREFECTURES = ["東京都", "大阪府", "北海道", "愛知県", "福岡県", "神奈川県", "京都府", "沖縄県"]
+MUNICIPALITIES = ["Chiyoda", "Minato", "Shibuya", "Kita", "Naka", "Chuo", "Higashi", "Nishi", "Minami"]
+WORDS = ["Sakura", "Central", "Station", "Tower", "Plaza", "Harbor", "Garden", "River", "Hill", "Park"]
+BATCH_SIZE = 1000
+
+# (facility_name, prefecture, municipality)
+QUERIES = [
+    ("Sakura", None, None),
+    ("Tower Plaza", None, None),
+    ("Facility-0049", None, None),
+    (None, "東京都", None),
+    (None, None, "Shibuya"),
+    ("Garden", "大阪府", "Kita"),
+    ("NoSuchFacility", None, None),
+]
+
+
+def seed(db: Prisma, facilities: int, seed_value: int) -> int:
+    """
+    Method to create a benchmark customer with the given number of facilities (one device each)
+    Returns:
+        int: customer ID
+    """
+    rng = random.Random(seed_value)
+    suffix = uuid.uuid4().hex[:8]
+    admin = db.admin.create(data={"login_id": f"bench_{suffix}", "admin_password": "-"})
+    customer = db.customer.create(
+        data={"customer_uuid": str(uuid.uuid4()), "admin_id": admin.id, "customer_name": f"bench_{suffix}"}
+    )
+    facility_type = db.facility_type.create(data={"name": f"bench_{suffix}", "admin_id": admin.id})
+    device_type = db.device_type.create(data={"name": f"bench_{suffix}", "admin_id": admin.id, "sample_image_blob": ""})
+
+    for start in range(0, facilities, BATCH_SIZE):
+        db.facility.create_many(
+            data=[
+                {
+                    "facility_name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} Facility-{index:05d}",
+                    "prefecture": rng.choice(PREFECTURES),
+                    "municipality": rng.choice(MUNICIPALITIES),
+                    "customer_id": customer.id,
+                    "facility_type_id": facility_type.id,
+                    "effective_start_utc": "2024-01-01T00:00:00+00:00",
+                    "effective_end_utc": "2099-12-31T23:59:59+00:00",
+                }
+                for index in range(start, min(start + BATCH_SIZE, facilities))
+            ]
+        )
+
+    facility_ids = [
+        facility.id for facility in db.facility.find_many(where={"customer_id": customer.id}, order={"id": "asc"})
+    ]
+    for start in range(0, len(facility_ids), BATCH_SIZE):
+        db.device.create_many(
+            data=[
+                {
+                    "device_id": f"bench-{suffix}-{facility_id}",
+                    "device_name": f"bench-{facility_id}",
+                    "facility_id": facility_id,
+                    "device_type_id": device_type.id,
+                    "admin_id": admin.id,
+                }
+                for facility_id in facility_ids[start : start + BATCH_SIZE]
+            ]
+        )
+    return customer.id
+
+
+def cleanup(db: Prisma, customer_id: int) -> None:
+    """
+    Method to remove the benchmark customer and its records
+    """
+    customer = db.customer.find_unique(where={"id": customer_id})
+    db.device.delete_many(where={"facility": {"customer_id": customer_id}})
+    db.facility.delete_many(where={"customer_id": customer_id})
+    db.customer.delete(where={"id": customer_id})
+    db.device_type.delete_many(where={"admin_id": customer.admin_id})
+    db.facility_type.delete_many(where={"admin_id": customer.admin_id})
+    db.admin.delete(where={"id": customer.admin_id})
+
+
+def run(db: Prisma, customer_id: int, search: FacilitySearch, repeat: int) -> None:
+    """
+    Method to time build_device_query (first page) for every query in QUERIES
+    """
+    print(f"backend={type(search).__name__} repeat={repeat}")
+    print(f"{'query':<40} {'matches':>8} {'p50 ms':>9} {'p95 ms':>9}")
+    for facility_name, prefecture, municipality in QUERIES:
+        parameters = ReviewListSchema(
+            customer_id=customer_id,
+            facility_name=facility_name,
+            prefecture=prefecture,
+            municipality=municipality,
+            page=1,
+        )
+        timings = []
+        total = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            _, total, _ = build_device_query(db, customer_id, parameters)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        label = " / ".join(str(value) for value in (facility_name, prefecture, municipality) if value)
+        print(f"{label:<40} {total:>8} {statistics.median(timings):>9.1f} {p95:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the facility search filters")
+    parser.add_argument("--facilities", type=int, default=50000, help="Number of facilities to create")
+    parser.add_argument("--customer-id", type=int, default=None, help="Reuse an existing benchmark customer")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the dataset")
+    parser.add_argument("--cleanup", action="store_true", help="Remove the created dataset afterwards")
+    args = parser.parse_args()
+
+    db = Prisma()
+    db.connect()
+    try:
+        customer_id = args.customer_id
+        if customer_id is None:
+            started = time.perf_counter()
+            customer_id = seed(db, args.facilities, args.seed)
+            print(f"seeded customer_id={customer_id} in {time.perf_counter() - started:.1f}s")
+
+        run(db, customer_id, get_facility_search(), args.repeat)
+
+        if args.cleanup and args.customer_id is None:
+            cleanup(db, customer_id)
+    finally:
+        db.disconnect()
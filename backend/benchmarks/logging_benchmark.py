@@ -0,0 +1,205 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/benchmarks/logging_benchmark.py
+Description: Per record cost of the JSON logging, the previous FormatterJSON (inspect.getmembers,
+traceback.format_exc, json) against src/logger.py (record.__dict__, orjson), and the time a request thread
+spends in the handler, writing to a slow stdout (before) against queueing the record (after).
+
+Usage (from backend, no DB needed):
+    python -m benchmarks.logging_benchmark --records 20000 --stdout-delay-ms 1
+"""
+
+import argparse
+import inspect
+import io
+import json
+import logging
+import queue
+import statistics
+import sys
+import time
+import traceback
+from logging.handlers import QueueListener
+
+from src.logger import FormatterJSON, RequestContextQueueHandler
+
+LOG_FORMAT = "[%(levelname)s]\t%(asctime)s\t%(message)s\n"
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+class LegacyFormatterJSON(logging.Formatter):
+    """
+    FormatterJSON before the __dict__ / orjson rewrite, outside of a request context (TraceId "-")
+    """
+
+    def format(self, record):
+        supported_keys = {}
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+            supported_keys = {
+                "LogLevel": record.levelname.replace("CRITICAL", "FATAL"),
+                "DateTime": f"{record.asctime}.{int(record.msecs)}Z",
+                "TraceId": "-",
+                "LogMessage": record.getMessage(),
+                "Resources": record.name,
+                "Caller": f"{record.filename}:{record.lineno}",
+                "FunctionName": record.funcName,
+                "ErrorCode": getattr(record, "ErrorCode", "-"),
+            }
+        if record.exc_info:
+            supported_keys["StackTrace"] = traceback.format_exc().splitlines()
+
+        for i in inspect.getmembers(record):
+            if not i[0].startswith("_") and not inspect.ismethod(i[1]):
+                existed_keys = [
+                    "args",
+                    "asctime",
+                    "created",
+                    "exc_info",
+                    "exc_text",
+                    "filename",
+                    "funcName",
+                    "levelname",
+                    "levelno",
+                    "lineno",
+                    "module",
+                    "msecs",
+                    "msg",
+                    "name",
+                    "pathname",
+                    "process",
+                    "processName",
+                    "relativeCreated",
+                    "stack_info",
+                    "thread",
+                    "threadName",
+                ]
+                if not i[0] in existed_keys:
+                    supported_keys[i[0]] = i[1]
+
+        return json.dumps(supported_keys, ensure_ascii=False)
+
+
+class SlowStream(io.StringIO):
+    """
+    stdout of a container whose log collector is slow, each write takes `delay` seconds
+    """
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def write(self, text):
+        time.sleep(self.delay)
+        return len(text)
+
+
+def make_records(count: int, with_exception: bool) -> list:
+    """
+    Records like the ones of the API: a message with arguments, an ErrorCode and optionally a stack trace
+    """
+    exc_info = None
+    if with_exception:
+        try:
+            raise ValueError("AITRIOS request failed")
+        except ValueError:
+            exc_info = sys.exc_info()
+
+    records = []
+    for index in range(count):
+        record = logging.LogRecord(
+            "caat-backend", logging.ERROR, __file__, 42, "Request %s failed: %s", (index, "timeout"), exc_info, "run"
+        )
+        record.ErrorCode = 50001
+        records.append(record)
+    return records
+
+
+def per_record_us(formatter: logging.Formatter, records: list, with_exception: bool) -> float:
+    """
+    Returns the mean format time of a record in µs
+    """
+    if with_exception:
+        # The legacy formatter reads the exception being handled
+        try:
+            raise ValueError("AITRIOS request failed")
+        except ValueError:
+            started = time.perf_counter()
+            for record in records:
+                formatter.format(record)
+    else:
+        started = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+    return (time.perf_counter() - started) / len(records) * 1_000_000
+
+
+def caller_us(handler: logging.Handler, records: list) -> list:
+    """
+    Returns the time in µs spent by the calling (request) thread to handle each record
+    """
+    timings = []
+    for record in records:
+        started = time.perf_counter()
+        handler.handle(record)
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+def run(records: int, stdout_delay_ms: float) -> None:
+    """
+    Method to print the per record format cost and the caller cost with a slow stdout
+    """
+    legacy = LegacyFormatterJSON(LOG_FORMAT, DATE_FORMAT)
+    current = FormatterJSON(LOG_FORMAT, DATE_FORMAT)
+
+    print(f"Format, {records} records")
+    print(f"  {'record':<22} {'before µs/record':>17} {'after µs/record':>16} {'speedup':>8}")
+    for name, with_exception in [("message + ErrorCode", False), ("with stack trace", True)]:
+        before = per_record_us(legacy, make_records(records, with_exception), with_exception)
+        after = per_record_us(current, make_records(records, with_exception), with_exception)
+        print(f"  {name:<22} {before:>17.2f} {after:>16.2f} {before / after:>7.1f}x")
+
+    # Fewer records, each write to the slow stream takes stdout_delay_ms
+    count = max(min(records, int(2000 / max(stdout_delay_ms, 0.001))), 100)
+    stream_handler = logging.StreamHandler(SlowStream(stdout_delay_ms / 1000))
+    stream_handler.setFormatter(legacy)
+    before = caller_us(stream_handler, make_records(count, False))
+
+    log_queue = queue.SimpleQueue()
+    listener_handler = logging.StreamHandler(SlowStream(stdout_delay_ms / 1000))
+    listener_handler.setFormatter(current)
+    listener = QueueListener(log_queue, listener_handler)
+    listener.start()
+    after = caller_us(RequestContextQueueHandler(log_queue), make_records(count, False))
+    listener.stop()
+
+    print(f"Request thread time per record, stdout write {stdout_delay_ms} ms, {count} records")
+    print(f"  {'handler':<34} {'p50 µs':>10} {'p99 µs':>10}")
+    for name, timings in [("before (StreamHandler)", before), ("after (QueueHandler)", after)]:
+        p99 = statistics.quantiles(timings, n=100)[98]
+        print(f"  {name:<34} {statistics.median(timings):>10.1f} {p99:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the JSON log formatter and handler")
+    parser.add_argument("--records", type=int, default=20000, help="Records formatted per measure")
+    parser.add_argument("--stdout-delay-ms", type=float, default=1.0, help="Time of a write to the slow stdout")
+    args = parser.parse_args()
+
+    run(args.records, args.stdout_delay_ms)
@@ -0,0 +1,160 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/benchmarks/response_benchmark.py
+Description: Payload size and serialization time of the GET /devices and GET /reviews/latest responses,
+default Flask JSON provider without compression (before) against the orjson provider with gzip / brotli (after).
+
+Usage (from backend, no DB needed):
+    python -m benchmarks.response_benchmark --devices 1000 --page-size 100 --image-kb 40
+
+The payloads are built with the response schemas from deterministic synthetic rows.
+"""
+
+import argparse
+import base64
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from src.libs.compression import compress
+from src.libs.json_provider import ORJSONProvider
+from src.schemas.devices import DeviceCombinedItemSchema, DeviceCombinedListSchema, DeviceSchema
+from src.schemas.response import ResponseHTTPSchema
+from src.schemas.reviews import DeviceLatestReviewSchema, ReviewListResponseSchema, ReviewSchema
+
+PREFECTURES = ["東京都", "大阪府", "北海道", "愛知県", "福岡県"]
+WORDS = ["Sakura", "Central", "Station", "Tower", "Plaza", "Harbor", "Garden", "River"]
+
+
+def devices_payload(rng: random.Random, devices: int):
+    """
+    Body of GET /devices
+    """
+    items = [
+        DeviceCombinedItemSchema(
+            connection_status=rng.choice(["Connected", "Disconnected"]),
+            device_id=f"Aid-{index:08x}-0000-2000-9002-0000000{index % 10}",
+            device_name=f"{rng.choice(WORDS)}-{index}",
+            device_type_id=rng.randint(1, 5),
+            device_type_name=f"Type {rng.randint(1, 5)}",
+            facility_id=rng.randint(1, 500),
+            facility_name=f"{rng.choice(WORDS)} {rng.choice(WORDS)} {index}",
+            group_name="default",
+            registered_flag=rng.random() < 0.7,
+        )
+        for index in range(devices)
+    ]
+    data = DeviceCombinedListSchema(devices=items).model_dump()
+    return ResponseHTTPSchema(data=data).make_response()[0]
+
+
+def latest_reviews_payload(rng: random.Random, page_size: int, image_kb: int):
+    """
+    Body of GET /reviews/latest, with `latest_review.image_blob` when image_kb > 0
+    """
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    data = []
+    for index in range(page_size):
+        facility = {
+            "id": index,
+            "facility_name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {index}",
+            "prefecture": rng.choice(PREFECTURES),
+            "municipality": rng.choice(WORDS),
+            "facility_type": {"id": 1, "name": "Store"},
+        }
+        image_blob = None
+        if image_kb:
+            image_blob = "data:image/webp;base64," + base64.b64encode(rng.randbytes(image_kb * 1024)).decode()
+        review = ReviewSchema(
+            id=index,
+            image_date_utc=now,
+            image_blob=image_blob,
+            result=rng.randint(1, 4),
+            review_comment=rng.choice(["", "Angle is too low", "OK"]),
+            facility=facility,
+            created_by="contractor",
+            created_at_utc=now - timedelta(minutes=index),
+            last_updated_by="admin",
+            last_updated_at_utc=now,
+        )
+        device = DeviceSchema(
+            id=index, device_id=f"Aid-{index:08x}", device_name=f"device-{index}", device_type_id=1, facility=facility
+        )
+        item = DeviceLatestReviewSchema(device=device, latest_review=review)
+        data.append(item.model_dump(exclude=None if image_kb else {"latest_review": {"image_blob"}}))
+
+    return ReviewListResponseSchema(
+        data=data, page=1, total=page_size, page_size=page_size, size=page_size
+    ).make_response()[0]
+
+
+def timed(function, repeat: int) -> tuple:
+    """
+    Returns the result and the median time in ms of `function`
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def run(name: str, payload, repeat: int) -> None:
+    """
+    Method to print the size and time of one response, before and after
+    """
+    app = Flask(__name__)
+    before_provider = DefaultJSONProvider(app)
+    after_provider = ORJSONProvider(app)
+
+    before, before_ms = timed(lambda: before_provider.response(payload).get_data(), repeat)
+    after, after_ms = timed(lambda: after_provider.response(payload).get_data(), repeat)
+    print(f"{name}")
+    print(f"  {'variant':<24} {'bytes':>10} {'serialize ms':>13} {'compress ms':>12}")
+    print(f"  {'before (json)':<24} {len(before):>10} {before_ms:>13.2f} {'-':>12}")
+    print(f"  {'after (orjson)':<24} {len(after):>10} {after_ms:>13.2f} {'-':>12}")
+    for encoding in ("gzip", "br"):
+        compressed, compress_ms = timed(lambda: compress(after, encoding), repeat)
+        print(
+            f"  {'after (orjson + ' + encoding + ')':<24} {len(compressed):>10} {after_ms:>13.2f} {compress_ms:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the response serialization and compression")
+    parser.add_argument("--devices", type=int, default=1000, help="Devices in the GET /devices response")
+    parser.add_argument("--page-size", type=int, default=100, help="Items in the GET /reviews/latest response")
+    parser.add_argument("--image-kb", type=int, default=0, help="Also run /reviews/latest with images of this size")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measure")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the payloads")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    run(f"GET /devices ({args.devices} devices)", devices_payload(rng, args.devices), args.repeat)
+    run(f"GET /reviews/latest ({args.page_size} items)", latest_reviews_payload(rng, args.page_size, 0), args.repeat)
+    if args.image_kb:
+        run(
+            f"GET /reviews/latest?fields=*,latest_review.image_blob ({args.page_size} items, {args.image_kb} KB images)",
+            latest_reviews_payload(rng, args.page_size, args.image_kb),
+            args.repeat,
+        )
@@ -0,0 +1,55 @@
+# ------------------------------------------------------------------------
+# Copyright 2024 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/gunicorn.conf.py
+Description: gunicorn settings, read by `gunicorn main:app` from the working directory.
+
+Threaded workers (gthread): a request waiting for the AITRIOS console (up to HTTP_TIMEOUT per attempt, plus the
+retries) holds one thread while the other threads of the worker keep serving. The request handling is thread
+safe, the error codes shared by the requests are read-only (see src/exceptions.py).
+Each worker runs GUNICORN_THREADS requests at once, their DB queries share the connection pool of the Prisma
+query engine of the worker (`connection_limit` of DATABASE_URL).
+
+The Prometheus metrics of the workers are aggregated from PROMETHEUS_MULTIPROC_DIR (see src/libs/metrics.py),
+the directory is emptied when gunicorn starts and the files of the exited workers are marked as dead.
+"""
+
+import glob
+import os
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.getenv("WEB_CONCURRENCY", 2))
+threads = int(os.getenv("GUNICORN_THREADS", 16))
+# Requests in progress on shutdown / reload may be waiting for the console retries
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 60))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+
+def on_starting(server):
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+        # Samples of a previous run
+        for path in glob.glob(os.path.join(multiproc_dir, "*.db")):
+            os.remove(path)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
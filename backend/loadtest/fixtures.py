@@ -0,0 +1,176 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/loadtest/fixtures.py
+Description: Tenant of the load tests, an admin with one customer per AITRIOS API version pointing to the
+mock console (loadtest/mock_aitrios.py), their facilities and devices, and a contractor token per facility.
+
+The records are tagged with a random suffix, so a run does not collide with the data of the DB,
+and are removed by `cleanup`.
+"""
+
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from loadtest.mock_aitrios import API_VERSIONS, TOKEN_PATH
+from prisma import Prisma
+from src.config import APP_SECRET_KEY
+from src.models.images import release_review_images
+from src.services.facility_service import FacilityService
+from src.utils import encrypt_data
+from werkzeug.security import generate_password_hash
+
+BATCH_SIZE = 1000
+
+
+@dataclass
+class LoadTestFacility:
+    id: int
+    customer_id: int
+    api_version: str
+    token: str
+    device_ids: List[int] = field(default_factory=list)
+
+
+@dataclass
+class LoadTestTenant:
+    tag: str
+    admin_id: int
+    login_id: str
+    password: str
+    customer_ids: List[int]
+    facilities: List[LoadTestFacility]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _contractor_token(facility_id: int, customer_id: int, valid_hours: int) -> str:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return FacilityService(
+        facility_id=facility_id,
+        customer_id=customer_id,
+        secret_key=APP_SECRET_KEY,
+        start_time=(now - timedelta(minutes=1)).strftime("%Y-%m-%dT%H:%M:%S%z"),
+        exp=(now + timedelta(hours=valid_hours)).strftime("%Y-%m-%dT%H:%M:%S%z"),
+    ).generate_jwt_token()
+
+
+def seed(
+    db: Prisma, mock_url: str, facilities: int, devices_per_facility: int, valid_hours: int = 24
+) -> LoadTestTenant:
+    """
+    Method to create the load test tenant
+    Args:
+        db (Prisma connection)
+        mock_url (str): Base URL of the mock console, e.g. http://127.0.0.1:9000
+        facilities (int): Facilities per customer
+        devices_per_facility (int): Devices per facility
+        valid_hours (int): Validity of the contractor tokens
+    Returns:
+        LoadTestTenant
+    """
+    tag = uuid.uuid4().hex[:8]
+    mock_url = mock_url.rstrip("/")
+    login_id = f"loadtest_{tag}"
+    password = uuid.uuid4().hex
+    admin = db.admin.create(
+        data={"login_id": login_id, "admin_password": generate_password_hash(password), "created_by": "loadtest"}
+    )
+    facility_type = db.facility_type.create(data={"name": f"loadtest_{tag}", "admin_id": admin.id})
+    device_type = db.device_type.create(data={"name": f"loadtest_{tag}", "admin_id": admin.id, "sample_image_blob": ""})
+
+    customer_ids = []
+    tenant_facilities = []
+    for api_version in API_VERSIONS:
+        customer = db.customer.create(
+            data={
+                "admin_id": admin.id,
+                "customer_name": f"loadtest_{tag}_{api_version}",
+                "customer_uuid": str(uuid.uuid4()),
+                "auth_url": f"{mock_url}{TOKEN_PATH}",
+                "base_url": f"{mock_url}/api/{api_version}",
+                "client_id": encrypt_data(f"loadtest-{tag}"),
+                "client_secret": encrypt_data(uuid.uuid4().hex),
+            }
+        )
+        customer_ids.append(customer.id)
+        db.facility.create_many(
+            data=[
+                {
+                    "facility_name": f"loadtest {tag} {api_version} {index:04d}",
+                    "prefecture": "東京都",
+                    "municipality": "Minato",
+                    "customer_id": customer.id,
+                    "facility_type_id": facility_type.id,
+                    "effective_start_utc": "2024-01-01T00:00:00+00:00",
+                    "effective_end_utc": "2099-12-31T23:59:59+00:00",
+                }
+                for index in range(facilities)
+            ]
+        )
+        for facility in db.facility.find_many(where={"customer_id": customer.id}, order={"id": "asc"}):
+            tenant_facilities.append(
+                LoadTestFacility(
+                    id=facility.id,
+                    customer_id=customer.id,
+                    api_version=api_version,
+                    token=_contractor_token(facility.id, customer.id, valid_hours),
+                )
+            )
+
+    rows = [
+        {
+            "device_id": f"lt-{tag}-{facility.id}-{index:03d}",
+            "device_name": f"loadtest-{facility.id}-{index}",
+            "facility_id": facility.id,
+            "device_type_id": device_type.id,
+            "admin_id": admin.id,
+        }
+        for facility in tenant_facilities
+        for index in range(devices_per_facility)
+    ]
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.device.create_many(data=rows[start : start + BATCH_SIZE])
+
+    facility_map = {facility.id: facility for facility in tenant_facilities}
+    for device in db.device.find_many(where={"admin_id": admin.id}, order={"id": "asc"}):
+        facility_map[device.facility_id].device_ids.append(device.id)
+
+    return LoadTestTenant(tag, admin.id, login_id, password, customer_ids, tenant_facilities)
+
+
+def cleanup(db: Prisma, tenant: LoadTestTenant) -> None:
+    """
+    Method to remove the load test tenant and the records created by the load test
+    """
+    facility_ids = [facility.id for facility in tenant.facilities]
+    where = {"customer_id": {"in": tenant.customer_ids}}
+    release_review_images(db, where)
+    db.review.delete_many(where=where)
+    db.device_capture.delete_many(where={"facility_id": {"in": facility_ids}})
+    db.status_counter.delete_many(where=where)
+    db.device.delete_many(where={"admin_id": tenant.admin_id})
+    db.facility.delete_many(where=where)
+    db.customer.delete_many(where={"id": {"in": tenant.customer_ids}})
+    db.device_type.delete_many(where={"admin_id": tenant.admin_id})
+    db.facility_type.delete_many(where={"admin_id": tenant.admin_id})
+    db.change_counter.delete_many(where={"admin_id": tenant.admin_id})
+    db.admin.delete(where={"id": tenant.admin_id})
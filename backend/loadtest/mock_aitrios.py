@@ -0,0 +1,206 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/loadtest/mock_aitrios.py
+Description: Mock AITRIOS console for the load tests, with latency, error and timeout injection.
+
+Serves the routes called by src/services/aitrios_service*.py under /api/v1 and /api/v2:
+    POST /oauth2/token                                 client credentials token (non enterprise edition)
+    GET  /api/<version>/devices                        device list, in the v1 or v2 format
+    POST /api/<version>/devices/<device_id>/command    direct_get_image (v2)
+    GET  /api/<version>/devices/<device_id>/images/latest  latest image (v1)
+
+Every request waits `latency_ms` (+- `jitter_ms`), then fails with a 500 at `error_rate`, or hangs for
+`timeout_seconds` at `timeout_rate` (longer than HTTP_TIMEOUT to trigger the client timeout and retries).
+
+Usage (from backend):
+    python -m loadtest.mock_aitrios --port 9000 --latency-ms 300 --error-rate 0.01 --timeout-rate 0.005
+"""
+
+import argparse
+import base64
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from io import BytesIO
+
+from flask import Flask, jsonify, request
+from PIL import Image, ImageDraw
+
+API_VERSIONS = ("v1", "v2")
+TOKEN_PATH = "/oauth2/token"
+
+
+@dataclass
+class FaultOptions:
+    """
+    Faults injected into every response
+    """
+
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    error_rate: float = 0
+    timeout_rate: float = 0
+    timeout_seconds: float = 25
+    seed: int = 42
+
+
+class FaultInjector:
+    """
+    Draws the latency and the outcome of the requests from a seeded generator, shared by the server threads
+    """
+
+    def __init__(self, options: FaultOptions):
+        self.options = options
+        self._rng = random.Random(options.seed)
+        self._lock = threading.Lock()
+
+    def apply(self):
+        """
+        Method to delay the request and inject the fault drawn for it
+        Returns:
+            Error response or None
+        """
+        with self._lock:
+            jitter = self._rng.uniform(-self.options.jitter_ms, self.options.jitter_ms)
+            draw = self._rng.random()
+
+        time.sleep(max(self.options.latency_ms + jitter, 0) / 1000)
+        if draw < self.options.timeout_rate:
+            time.sleep(self.options.timeout_seconds)
+        elif draw < self.options.timeout_rate + self.options.error_rate:
+            return jsonify(result="ERROR", code="E.SC.API.0000000", message="Injected error", time=_now()), 500
+        return None
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def sample_jpeg(width: int, height: int) -> str:
+    """
+    Method to draw the deterministic camera image returned by the mock
+    Returns:
+        str: base64 encoded JPEG
+    """
+    image = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    draw = ImageDraw.Draw(image)
+    for index in range(8):
+        left = index * width // 8
+        draw.rectangle([left, height // 3, left + width // 16, 2 * height // 3], fill=(32 * index, 96, 160))
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def create_mock_app(options: FaultOptions, devices: int = 100, image_size=(1280, 960)) -> Flask:
+    """
+    Method to create the mock console application
+    Args:
+        options (FaultOptions): Injected faults
+        devices (int): Devices listed by GET /devices without `device_ids`
+        image_size (tuple): Size of the camera image
+    Returns:
+        Flask
+    """
+    app = Flask(__name__)
+    injector = FaultInjector(options)
+    image = sample_jpeg(*image_size)
+    default_device_ids = [f"lt-mock-{index:06d}" for index in range(devices)]
+
+    @app.before_request
+    def inject_faults():
+        return injector.apply()
+
+    @app.post(TOKEN_PATH)
+    def token():
+        if not request.form.get("client_id") or not request.form.get("client_secret"):
+            return jsonify(error="invalid_client"), 401
+        return jsonify(access_token=f"mock-{request.form['client_id']}", token_type="Bearer", expires_in=3600)
+
+    @app.get("/api/<version>/devices")
+    def devices_list(version: str):
+        if version not in API_VERSIONS:
+            return jsonify(result="ERROR", message="Not found"), 404
+        requested = request.args.get("device_ids")
+        device_ids = requested.split(",") if requested else default_device_ids
+        if version == "v1":
+            items = [
+                {
+                    "device_id": device_id,
+                    "property": {"device_name": device_id},
+                    "connectionState": "Connected",
+                    "device_groups": [{"device_group_id": "loadtest"}],
+                }
+                for device_id in device_ids
+            ]
+        else:
+            items = [
+                {
+                    "device_id": device_id,
+                    "device_name": device_id,
+                    "connection_state": "Connected",
+                    "device_groups": [{"device_group_id": "loadtest"}],
+                }
+                for device_id in device_ids
+            ]
+        return jsonify(devices=items)
+
+    @app.post("/api/<version>/devices/<device_id>/command")
+    def device_command(version: str, device_id: str):
+        body = request.get_json(silent=True) or {}
+        if body.get("command_name") != "direct_get_image":
+            return jsonify(result="ERROR", message="Invalid parameter command_name.", time=_now()), 400
+        return jsonify(result="SUCCESS", command_response={"image": image})
+
+    @app.get("/api/<version>/devices/<device_id>/images/latest")
+    def device_latest_image(version: str, device_id: str):
+        return jsonify(device_id=device_id, contents=image)
+
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock AITRIOS console for the load tests")
+    parser.add_argument("--host", default="127.0.0.1", help="Listen address")
+    parser.add_argument("--port", type=int, default=9000, help="Listen port")
+    parser.add_argument("--latency-ms", type=float, default=200, help="Latency of every response")
+    parser.add_argument("--jitter-ms", type=float, default=50, help="Uniform jitter around the latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="Share of the requests failing with a 500")
+    parser.add_argument("--timeout-rate", type=float, default=0, help="Share of the requests hanging")
+    parser.add_argument("--timeout-seconds", type=float, default=25, help="Hang time of the timed out requests")
+    parser.add_argument("--devices", type=int, default=100, help="Devices listed by GET /devices")
+    parser.add_argument("--image-size", default="1280x960", help="Camera image size, WIDTHxHEIGHT")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the injected faults")
+    args = parser.parse_args()
+
+    fault_options = FaultOptions(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_seconds=args.timeout_seconds,
+        seed=args.seed,
+    )
+    width, height = (int(value) for value in args.image_size.lower().split("x"))
+    # The request log of the development server would dominate the output
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    create_mock_app(fault_options, args.devices, (width, height)).run(host=args.host, port=args.port, threaded=True)
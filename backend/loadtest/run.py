@@ -0,0 +1,270 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/loadtest/run.py
+Description: Load test of the backend, against the DB of DATABASE_URL (a local Postgres with the schema pushed)
+and the mock AITRIOS console (loadtest/mock_aitrios.py).
+
+The harness starts the mock console and the backend under gunicorn (or uses the running ones given by
+--mock-url / --target), seeds a load test tenant (loadtest/fixtures.py), runs closed-loop virtual users
+with the contractor / admin traffic mix of loadtest/scenarios.py, then reports the p50 / p95 / p99 latency
+and the throughput per endpoint and removes the tenant.
+
+Usage (from backend, DATABASE_URL and APP_SECRET_KEY set):
+    python -m loadtest.run --users 50 --duration 120 --mix contractor=4,admin=1 --workers 4 --threads 8 \
+        --aitrios-latency-ms 500 --aitrios-error-rate 0.01 --output loadtest-w4t8.json
+
+Run it with several --workers / --threads / --worker-class values and compare the throughput and the p95
+to size the gunicorn workers (gunicorn.conf.py settings by default). Samples of the first --warmup seconds
+are not reported.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import requests
+from loadtest.fixtures import LoadTestTenant, cleanup, seed
+from loadtest.scenarios import SCENARIOS, RequestSample, VirtualUser
+from prisma import Prisma
+
+STARTUP_TIMEOUT_SECONDS = 30
+
+
+def wait_until_up(url: str, process: subprocess.Popen | None) -> None:
+    """
+    Method to wait until the server answers on `url`
+    Raises:
+        RuntimeError: the server process exited or did not answer within STARTUP_TIMEOUT_SECONDS
+    """
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process and process.poll() is not None:
+            raise RuntimeError(f"{url}: server exited with {process.returncode}")
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.exceptions.RequestException:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url}: server did not start within {STARTUP_TIMEOUT_SECONDS}s")
+
+
+def start_mock(args) -> subprocess.Popen:
+    command = [
+        sys.executable,
+        "-m",
+        "loadtest.mock_aitrios",
+        f"--port={args.mock_port}",
+        f"--latency-ms={args.aitrios_latency_ms}",
+        f"--jitter-ms={args.aitrios_jitter_ms}",
+        f"--error-rate={args.aitrios_error_rate}",
+        f"--timeout-rate={args.aitrios_timeout_rate}",
+        f"--timeout-seconds={args.aitrios_timeout_seconds}",
+        f"--seed={args.seed}",
+    ]
+    return subprocess.Popen(command)
+
+
+def start_backend(args) -> subprocess.Popen:
+    # gunicorn.conf.py of the working directory is read as in production, the given options override it
+    command = [sys.executable, "-m", "gunicorn", "main:app", f"--bind=127.0.0.1:{args.port}", "--log-level=warning"]
+    for option in ("workers", "threads", "worker_class"):
+        if getattr(args, option) is not None:
+            command.append(f"--{option.replace('_', '-')}={getattr(args, option)}")
+    return subprocess.Popen(command, env={**os.environ, "PORT": str(args.port)})
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of sorted values
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: List[RequestSample], seconds: float) -> Dict:
+    """
+    Method to aggregate the samples
+    Returns:
+        {requests, errors, statuses, throughput (requests per second), p50_ms, p95_ms, p99_ms, max_ms}
+    """
+    durations = sorted(sample.duration * 1000 for sample in samples)
+    statuses = defaultdict(int)
+    for sample in samples:
+        statuses[str(sample.status)] += 1
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for sample in samples if sample.status == 0 or sample.status >= 400),
+        "statuses": dict(sorted(statuses.items())),
+        "throughput": len(samples) / seconds if seconds else 0.0,
+        "p50_ms": percentile(durations, 50),
+        "p95_ms": percentile(durations, 95),
+        "p99_ms": percentile(durations, 99),
+        "max_ms": durations[-1] if durations else 0.0,
+    }
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Method to parse the traffic mix, e.g. `contractor=4,admin=1`
+    """
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Unknown scenario {name}, expected one of {', '.join(SCENARIOS)}")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def run_users(args, tenant: LoadTestTenant, base_url: str) -> List[RequestSample]:
+    """
+    Method to run the virtual users for the warmup and the measured duration
+    Returns:
+        Samples of all the users
+    """
+    weights = parse_mix(args.mix)
+    names, scenario_weights = list(weights), list(weights.values())
+    started = time.perf_counter()
+    end = started + args.warmup + args.duration
+    users = [
+        VirtualUser(base_url, tenant, random.Random(args.seed + index), args.request_timeout)
+        for index in range(args.users)
+    ]
+
+    def user_loop(index: int, user: VirtualUser):
+        # Users are started evenly over the ramp up
+        time.sleep(args.ramp_up * index / args.users)
+        while time.perf_counter() < end:
+            scenario = user.rng.choices(names, scenario_weights)[0]
+            SCENARIOS[scenario](user)
+            if args.think_time_ms:
+                time.sleep(user.rng.expovariate(1000 / args.think_time_ms))
+
+    threads = [threading.Thread(target=user_loop, args=(index, user), daemon=True) for index, user in enumerate(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    measured_from = started + args.warmup
+    return [sample for user in users for sample in user.samples if sample.started >= measured_from]
+
+
+def report(args, samples: List[RequestSample]) -> Dict:
+    """
+    Method to print the latency and throughput per endpoint
+    Returns:
+        Report written to --output
+    """
+    by_endpoint = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample.endpoint].append(sample)
+
+    endpoints = {endpoint: summarize(items, args.duration) for endpoint, items in sorted(by_endpoint.items())}
+    total = summarize(samples, args.duration)
+
+    print(f"users={args.users} duration={args.duration}s mix={args.mix} target={args.target or 'gunicorn'}")
+    if not args.target:
+        settings = {option: getattr(args, option) for option in ("workers", "threads", "worker_class")}
+        print("gunicorn " + " ".join(f"{key}={value or 'gunicorn.conf.py'}" for key, value in settings.items()))
+    print(
+        f"{'endpoint':<52} {'requests':>8} {'errors':>7} {'req/s':>8} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for endpoint, summary in [*endpoints.items(), ("total", total)]:
+        print(
+            f"{endpoint:<52} {summary['requests']:>8} {summary['errors']:>7} {summary['throughput']:>8.1f} "
+            f"{summary['p50_ms']:>9.1f} {summary['p95_ms']:>9.1f} {summary['p99_ms']:>9.1f} {summary['max_ms']:>9.1f}"
+        )
+
+    return {"config": vars(args), "endpoints": endpoints, "total": total}
+
+
+def main(args) -> None:
+    processes = []
+    db = Prisma()
+    db.connect()
+    tenant = None
+    try:
+        mock_url = args.mock_url
+        if not mock_url:
+            mock_url = f"http://127.0.0.1:{args.mock_port}"
+            processes.append(start_mock(args))
+            wait_until_up(f"{mock_url}/api/v2/devices", processes[-1])
+
+        base_url = args.target
+        if not base_url:
+            base_url = f"http://127.0.0.1:{args.port}"
+            processes.append(start_backend(args))
+            wait_until_up(f"{base_url}/", processes[-1])
+
+        tenant = seed(db, mock_url, args.facilities, args.devices_per_facility)
+        result = report(args, run_users(args, tenant, base_url))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(result, file, indent=2)
+    finally:
+        if tenant and not args.keep_data:
+            cleanup(db, tenant)
+        db.disconnect()
+        for process in reversed(processes):
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the backend with contractor and admin traffic")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=10, help="Seconds run before measuring")
+    parser.add_argument("--ramp-up", type=float, default=5, help="Seconds over which the users are started")
+    parser.add_argument("--mix", default="contractor=4,admin=1", help="Scenario weights")
+    parser.add_argument("--think-time-ms", type=float, default=500, help="Mean pause between scenario iterations")
+    parser.add_argument("--request-timeout", type=float, default=60, help="Client timeout of a request, seconds")
+    parser.add_argument("--facilities", type=int, default=10, help="Facilities per customer of the tenant")
+    parser.add_argument("--devices-per-facility", type=int, default=5, help="Devices per facility")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the users and the mock faults")
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    parser.add_argument("--keep-data", action="store_true", help="Do not remove the load test tenant")
+    backend = parser.add_argument_group("backend")
+    backend.add_argument("--target", help="URL of a running backend, gunicorn is started otherwise")
+    backend.add_argument("--port", type=int, default=8100, help="Port of the started backend")
+    backend.add_argument("--workers", type=int, help="gunicorn workers, gunicorn.conf.py by default")
+    backend.add_argument("--threads", type=int, help="gunicorn threads per worker, gunicorn.conf.py by default")
+    backend.add_argument("--worker-class", help="gunicorn worker class (sync, gthread), gunicorn.conf.py by default")
+    mock = parser.add_argument_group("mock AITRIOS console")
+    mock.add_argument("--mock-url", help="URL of a running mock console, it is started otherwise")
+    mock.add_argument("--mock-port", type=int, default=9000, help="Port of the started mock console")
+    mock.add_argument("--aitrios-latency-ms", type=float, default=200, help="Latency of the console")
+    mock.add_argument("--aitrios-jitter-ms", type=float, default=50, help="Uniform jitter around the latency")
+    mock.add_argument("--aitrios-error-rate", type=float, default=0, help="Share of console requests failing")
+    mock.add_argument("--aitrios-timeout-rate", type=float, default=0, help="Share of console requests hanging")
+    mock.add_argument("--aitrios-timeout-seconds", type=float, default=25, help="Hang time of the timed out requests")
+
+    main(parser.parse_args())
@@ -0,0 +1,181 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/loadtest/scenarios.py
+Description: Contractor and admin traffic of the load tests.
+
+A virtual user runs one scenario iteration after another, each request is recorded with the route
+template of its endpoint (e.g. `GET /facility/devices/<id>/images?image_type=1`).
+
+contractor (web-app, facility token of the QR code):
+    POST /auth/facility, GET /facility/devices, GET /facility/devices/<id>/images?image_type=1 (AITRIOS image),
+    GET /facility/devices/<id>/images?image_type=0, POST /reviews with the capture ID,
+    GET /facility/devices/<id>/status
+admin (web-admin, logged in once per user):
+    GET /reviews/latest, GET /reviews/sla, GET /devices (AITRIOS device list),
+    GET /reviews/devices/<id>/history, PUT /reviews/<id> rejecting a pending review
+"""
+
+import random
+import time
+from typing import Callable, Dict, List, NamedTuple
+
+import requests
+from loadtest.fixtures import LoadTestFacility, LoadTestTenant
+from src.schemas.reviews import DeviceReviewAllowedEnums
+
+# Rejected reviews can be requested again, so the admin does not approve to keep the devices in the loop
+REJECT_COMMENT = "Load test, please adjust the angle"
+
+
+class RequestSample(NamedTuple):
+    endpoint: str
+    status: int
+    duration: float  # seconds
+    started: float  # time.perf_counter()
+
+
+class VirtualUser:
+    """
+    HTTP session of a virtual user, recording a RequestSample per request
+    """
+
+    def __init__(self, base_url: str, tenant: LoadTestTenant, rng: random.Random, timeout: float):
+        self.base_url = base_url.rstrip("/")
+        self.tenant = tenant
+        self.rng = rng
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.samples: List[RequestSample] = []
+        self.admin_token = None
+
+    def request(self, method: str, endpoint: str, path: str, **kwargs) -> requests.Response | None:
+        """
+        Method to send a request and record it
+        Args:
+            method (str): HTTP method
+            endpoint (str): Route template the request is reported under
+            path (str): Path with the query string
+        Returns:
+            Response, None if the request failed without a response (status 0)
+        """
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+            status = response.status_code
+        except requests.exceptions.RequestException:
+            response, status = None, 0
+        self.samples.append(RequestSample(f"{method} {endpoint}", status, time.perf_counter() - started, started))
+        return response
+
+
+def _json(response: requests.Response | None) -> Dict:
+    if response is None or response.status_code >= 400:
+        return {}
+    try:
+        return response.json()
+    except ValueError:
+        return {}
+
+
+def contractor_iteration(user: VirtualUser) -> None:
+    """
+    A contractor opening the QR code URL of a facility and requesting the review of a device
+    """
+    facility: LoadTestFacility = user.rng.choice(user.tenant.facilities)
+    headers = {"Authorization": f"Bearer {facility.token}"}
+
+    user.request("POST", "/auth/facility", "/auth/facility", headers=headers)
+    devices = _json(user.request("GET", "/facility/devices", "/facility/devices", headers=headers)).get("devices")
+    device_id = user.rng.choice(devices)["id"] if devices else user.rng.choice(facility.device_ids)
+
+    images_path = f"/facility/devices/{device_id}/images"
+    camera = _json(
+        user.request(
+            "GET", "/facility/devices/<id>/images?image_type=1", f"{images_path}?image_type=1", headers=headers
+        )
+    )
+    user.request("GET", "/facility/devices/<id>/images?image_type=0", f"{images_path}?image_type=0", headers=headers)
+    if camera.get("capture_id"):
+        user.request(
+            "POST",
+            "/reviews",
+            "/reviews",
+            headers=headers,
+            json={"device_id": device_id, "capture_id": camera["capture_id"]},
+        )
+    user.request("GET", "/facility/devices/<id>/status", f"/facility/devices/{device_id}/status", headers=headers)
+
+
+def _admin_headers(user: VirtualUser) -> Dict:
+    if not user.admin_token:
+        body = _json(
+            user.request(
+                "POST",
+                "/auth/login",
+                "/auth/login",
+                json={"login_id": user.tenant.login_id, "password": user.tenant.password},
+            )
+        )
+        user.admin_token = (body.get("data") or {}).get("token")
+    return {"Authorization": f"Bearer {user.admin_token}"}
+
+
+def admin_iteration(user: VirtualUser) -> None:
+    """
+    An admin going through the pending reviews of a customer
+    """
+    headers = _admin_headers(user)
+    if not user.admin_token:
+        return
+    customer_id = user.rng.choice(user.tenant.customer_ids)
+
+    latest = _json(
+        user.request(
+            "GET",
+            "/reviews/latest?status=2",
+            f"/reviews/latest?customer_id={customer_id}&status=2&page=1&page_size=20",
+            headers=headers,
+        )
+    ).get("data")
+    user.request("GET", "/reviews/sla", f"/reviews/sla?customer_id={customer_id}", headers=headers)
+    user.request("GET", "/devices", f"/devices?customer_id={customer_id}", headers=headers)
+
+    if latest:
+        item = user.rng.choice(latest)
+        user.request(
+            "GET",
+            "/reviews/devices/<id>/history",
+            f"/reviews/devices/{item['device']['id']}/history?page=1&page_size=20",
+            headers=headers,
+        )
+        review_id = (item.get("latest_review") or {}).get("id")
+        if review_id:
+            user.request(
+                "PUT",
+                "/reviews/<id>",
+                f"/reviews/{review_id}",
+                headers=headers,
+                json={"result": DeviceReviewAllowedEnums.REJECTED.value, "comment": REJECT_COMMENT},
+            )
+
+
+SCENARIOS: Dict[str, Callable[[VirtualUser], None]] = {
+    "contractor": contractor_iteration,
+    "admin": admin_iteration,
+}
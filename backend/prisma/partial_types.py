@@ -0,0 +1,38 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/prisma/partial_types.py
+Description: Partial (projected) Prisma models.
+
+Prisma Client Python does not support per query column selection.
+Partial types are picked up automatically by `prisma generate` from this file
+and only select the fields declared on them, so blob columns can be left in the DB.
+"""
+
+from prisma.models import device, device_type, image, review
+
+# Review row without the base64 image
+review.create_partial("ReviewWithoutImage", exclude=["image_blob"])
+
+# Device type row without the base64 reference image
+device_type.create_partial("DeviceTypeWithoutImage", exclude=["sample_image_blob"])
+
+# Device row whose `device_type` relation is loaded without the reference image
+device.create_partial("DeviceWithoutImage", relations={"device_type": "DeviceTypeWithoutImage"})
+
+# Image row without the base64 image, to build the URL of the reference images
+image.create_partial("ImageWithoutBlob", exclude=["image_blob"])
@@ -0,0 +1,34 @@
+-- ------------------------------------------------------------------------
+-- Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+-- Licensed under the Apache License, Version 2.0 (the "License");
+-- you may not use this file except in compliance with the License.
+-- You may obtain a copy of the License at
+
+-- http://www.apache.org/licenses/LICENSE-2.0
+
+-- Unless required by applicable law or agreed to in writing, software
+-- distributed under the License is distributed on an "AS IS" BASIS,
+-- WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+-- See the License for the specific language governing permissions and
+-- limitations under the License.
+-- ------------------------------------------------------------------------
+
+-- Full-text index for the facility filters on SQL Server (Azure).
+-- Prisma does not manage full-text indexes, apply after `prisma db push`:
+--   python scripts/create_search_index.py
+-- Statements are separated by `GO` lines and run outside of a transaction.
+
+IF NOT EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = 'facility_catalog')
+    CREATE FULLTEXT CATALOG facility_catalog;
+GO
+
+IF NOT EXISTS (SELECT 1 FROM sys.fulltext_indexes WHERE object_id = OBJECT_ID('dbo.facility'))
+    CREATE FULLTEXT INDEX ON [dbo].[facility] (
+        [facility_name] LANGUAGE 1041,
+        [prefecture] LANGUAGE 1041,
+        [municipality] LANGUAGE 1041
+    )
+    KEY INDEX [facility_pkey] ON facility_catalog
+    WITH CHANGE_TRACKING AUTO;
+GO
@@ -0,0 +1,82 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+import argparse
+import time
+from datetime import datetime
+from typing import List
+
+from prisma import Prisma
+from src.models.retention import apply_review_retention, find_retention_candidates
+from src.services.archive_service import get_image_archive
+
+
+def apply_retention(customer_ids: List[int], batch_size: int, sleep: float, max_reviews: int, dry_run: bool) -> None:
+    """
+    Method to archive or drop the review images not retained by the customer retention policies.
+    Run from backend as `python -m scripts.apply_retention`, e.g. scheduled daily outside of the review hours.
+    Each review is updated in its own short transaction and the script pauses `sleep` seconds
+    every `batch_size` reviews, so the live review traffic is not blocked.
+    Args:
+        customer_ids (list): Customers to process, all customers with a policy if empty
+        batch_size (int): Reviews processed between two pauses
+        sleep (float): Pause between two batches, in seconds
+        max_reviews (int): Stop after this number of reviews (0: no limit)
+        dry_run (bool): Only print the number of reviews to process
+    """
+    db = Prisma()
+    db.connect()
+    try:
+        where = {"customer_id": {"in": customer_ids}} if customer_ids else {}
+        policies = db.retention_policy.find_many(where=where, order={"customer_id": "asc"})
+        archive = get_image_archive()
+        now = datetime.utcnow()
+        processed = 0
+
+        for policy in policies:
+            candidates = find_retention_candidates(db, policy, now)
+            if dry_run:
+                print(f"Customer {policy.customer_id}: {len(candidates)} review image(s) to {policy.action}.")
+                continue
+
+            done = 0
+            for review in candidates:
+                if max_reviews and processed >= max_reviews:
+                    break
+                if apply_review_retention(db, archive, review, policy.action):
+                    done += 1
+                processed += 1
+                if processed % batch_size == 0:
+                    time.sleep(sleep)
+
+            print(f"Customer {policy.customer_id}: {done} review image(s) {policy.action}d.")
+            if max_reviews and processed >= max_reviews:
+                print(f"Stopped after {processed} review(s), run again to continue.")
+                break
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply the review image retention policies")
+    parser.add_argument("--customer-id", type=int, action="append", default=[], help="Customer ID (repeatable)")
+    parser.add_argument("--batch-size", type=int, default=50, help="Reviews processed between two pauses")
+    parser.add_argument("--sleep", type=float, default=1.0, help="Pause between two batches, in seconds")
+    parser.add_argument("--max-reviews", type=int, default=0, help="Stop after this number of reviews")
+    parser.add_argument("--dry-run", action="store_true", help="Only print the number of reviews to process")
+    args = parser.parse_args()
+
+    apply_retention(args.customer_id, args.batch_size, args.sleep, args.max_reviews, args.dry_run)
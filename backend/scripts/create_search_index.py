@@ -0,0 +1,55 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+import argparse
+import re
+
+from prisma import Prisma
+
+# ======== User Inputs ========
+SQL_PATH = "./prisma/sql/sqlserver_facility_fulltext.sql"
+# ==============================
+
+
+def create_search_index(sql_path: str) -> None:
+    """
+    Method to create the SQL Server full-text index used by the facility filters.
+    The Postgres trigram indexes are part of schema.postgres.prisma and created by `prisma db push`.
+    Args:
+        sql_path (str): path of the SQL file, batches separated by `GO` lines
+    """
+    with open(sql_path, encoding="utf-8") as sql_file:
+        batches = [batch.strip() for batch in re.split(r"^\s*GO\s*$", sql_file.read(), flags=re.MULTILINE)]
+
+    db = Prisma()
+    db.connect()
+    try:
+        for batch in batches:
+            # Skip the comment only header
+            if not [line for line in batch.splitlines() if line.strip() and not line.strip().startswith("--")]:
+                continue
+            db.execute_raw(batch)
+        print("Full-text index created.")
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create the facility full-text index on SQL Server")
+    parser.add_argument("-f", "--file", type=str, default=SQL_PATH, help="SQL file to apply")
+    args = parser.parse_args()
+
+    create_search_index(args.file)
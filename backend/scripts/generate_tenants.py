@@ -0,0 +1,312 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+import argparse
+import random
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from typing import Dict, Iterator, List
+
+from PIL import Image
+from prisma import Prisma
+from src.models.images import hash_data_url, release_image, release_review_images
+from src.models.status_counters import reconcile_status_counters
+from src.schemas.reviews import DeviceReviewAllowedEnums
+from src.services.image_service import normalize_image, to_data_url
+from src.utils import encrypt_data
+from werkzeug.security import generate_password_hash
+
+PREFECTURES = ["東京都", "大阪府", "北海道", "愛知県", "福岡県", "神奈川県", "京都府", "沖縄県"]
+MUNICIPALITIES = ["Chiyoda", "Minato", "Shibuya", "Kita", "Naka", "Chuo", "Higashi", "Nishi", "Minami"]
+WORDS = ["Sakura", "Central", "Station", "Tower", "Plaza", "Harbor", "Garden", "River", "Hill", "Park"]
+FACILITY_TYPES = ["Store", "Warehouse", "Office", "Parking"]
+DEVICE_TYPES = ["Entrance camera", "Shelf camera", "Ceiling camera"]
+REJECT_COMMENTS = ["Angle is too low", "Angle is too high", "Turn the camera to the left", "Lens is dirty"]
+
+# Result of the latest review of a device, the previous reviews are rejected
+LATEST_RESULTS = [
+    DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value,
+    DeviceReviewAllowedEnums.REJECTED.value,
+    DeviceReviewAllowedEnums.APPROVED.value,
+]
+LATEST_RESULT_WEIGHTS = [0.3, 0.2, 0.5]
+# Minutes between two reviews of a device
+REVIEW_INTERVAL_MINUTES = 3 * 24 * 60
+
+
+def generate_images(rng: random.Random, count: int, width: int, height: int) -> List[str]:
+    """
+    Method to draw the distinct images, normalized like the uploaded ones
+    Returns:
+        List of data URLs
+    """
+    images = []
+    for _ in range(count):
+        # Noise upscaled from 1/8 of the size, closer to a camera image than full resolution noise
+        small = (max(width // 8, 1), max(height // 8, 1))
+        image = Image.frombytes("RGB", small, rng.randbytes(small[0] * small[1] * 3)).resize((width, height))
+        buffer = BytesIO()
+        image.save(buffer, format="JPEG", quality=90)
+        buffer.seek(0)
+        images.append(to_data_url(*normalize_image(buffer)))
+    return images
+
+
+def create_images(db: Prisma, images: List[str]) -> List[int]:
+    """
+    Method to store the images, an image already stored (previous run) is reused
+    Returns:
+        Image IDs, in the order of `images`
+    """
+    hashes = [hash_data_url(image) for image in images]
+    db.image.create_many(
+        data=[{"content_hash": content_hash, "image_blob": image} for content_hash, image in zip(hashes, images)],
+        skip_duplicates=True,
+    )
+    stored = {image.content_hash: image.id for image in db.image.find_many(where={"content_hash": {"in": hashes}})}
+    return [stored[content_hash] for content_hash in hashes]
+
+
+def batched(rows: Iterator[Dict], batch_size: int) -> Iterator[List[Dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def generate(args) -> None:
+    """
+    Method to generate deterministic synthetic tenants for the benchmarks and load tests (e.g. 100k devices,
+    1M reviews): an admin `<prefix>_admin` with `--customers` customers, their facilities, devices and reviews.
+    Run from backend as `python -m scripts.generate_tenants`, `--delete` removes them.
+    Rows are bulk-loaded with create_many in batches of `--batch-size`. The review and reference images are
+    `--images` distinct images stored once in the image table, shared like the uploaded ones.
+    Every value is drawn from `--seed` and the review times are relative to `--reference-time`, so generating
+    into an empty database gives the same dataset. The customers point to the mock AITRIOS console
+    (loadtest/mock_aitrios.py) by default.
+    Args:
+        args: Parsed command line arguments
+    """
+    rng = random.Random(args.seed)
+    reference_time = (
+        datetime.now(timezone.utc) if args.reference_time == "now" else datetime.fromisoformat(args.reference_time)
+    )
+    width, height = (int(value) for value in args.image_size.lower().split("x"))
+
+    db = Prisma()
+    db.connect()
+    try:
+        if db.admin.find_unique(where={"login_id": f"{args.prefix}_admin"}):
+            print(f"{args.prefix}_admin already exists, run with --delete first.")
+            return
+
+        image_ids = create_images(db, generate_images(rng, args.images, width, height))
+        references = Counter()
+
+        admin = db.admin.create(
+            data={
+                "login_id": f"{args.prefix}_admin",
+                "admin_password": generate_password_hash(args.password),
+                "created_by": "generate_tenants",
+                "last_updated_by": "generate_tenants",
+            }
+        )
+        facility_type_ids = [
+            db.facility_type.create(data={"name": name, "admin_id": admin.id}).id for name in FACILITY_TYPES
+        ]
+        device_type_ids = []
+        for index, name in enumerate(DEVICE_TYPES):
+            image_id = image_ids[index % len(image_ids)]
+            references[image_id] += 1
+            device_type_ids.append(
+                db.device_type.create(data={"name": name, "admin_id": admin.id, "sample_image_id": image_id}).id
+            )
+
+        customer_ids = []
+        totals = Counter()
+        for customer_index in range(args.customers):
+            customer = db.customer.create(
+                data={
+                    "admin_id": admin.id,
+                    "customer_name": f"{args.prefix}_customer_{customer_index:04d}",
+                    "customer_uuid": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                    "auth_url": args.auth_url,
+                    "base_url": args.base_url,
+                    "client_id": encrypt_data(f"{args.prefix}-{customer_index:04d}"),
+                    "client_secret": encrypt_data(f"{args.prefix}-secret-{customer_index:04d}"),
+                }
+            )
+            customer_ids.append(customer.id)
+
+            for batch in batched(
+                (
+                    {
+                        "facility_name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {facility_index:05d}",
+                        "prefecture": rng.choice(PREFECTURES),
+                        "municipality": rng.choice(MUNICIPALITIES),
+                        "customer_id": customer.id,
+                        "facility_type_id": rng.choice(facility_type_ids),
+                        "effective_start_utc": "2024-01-01T00:00:00+00:00",
+                        "effective_end_utc": "2099-12-31T23:59:59+00:00",
+                    }
+                    for facility_index in range(args.facilities)
+                ),
+                args.batch_size,
+            ):
+                totals["facilities"] += db.facility.create_many(data=batch)
+            facility_ids = [
+                facility.id
+                for facility in db.facility.find_many(where={"customer_id": customer.id}, order={"id": "asc"})
+            ]
+
+            # The latest review result of each device, drawn before the devices are created
+            latest_results = [
+                rng.choices(LATEST_RESULTS, LATEST_RESULT_WEIGHTS)[0] if args.reviews else None
+                for _ in range(len(facility_ids) * args.devices)
+            ]
+            device_rows = (
+                {
+                    "device_id": f"{args.prefix}-{customer_index:04d}-{facility_position:05d}-{device_index:03d}",
+                    "device_name": f"{rng.choice(WORDS)}-{facility_position}-{device_index}",
+                    "facility_id": facility_id,
+                    "device_type_id": rng.choice(device_type_ids),
+                    "admin_id": admin.id,
+                    "result": latest_results[facility_position * args.devices + device_index]
+                    or DeviceReviewAllowedEnums.INITIAL_STATE.value,
+                }
+                for facility_position, facility_id in enumerate(facility_ids)
+                for device_index in range(args.devices)
+            )
+            for batch in batched(device_rows, args.batch_size):
+                totals["devices"] += db.device.create_many(data=batch)
+
+            devices = db.device.find_many(where={"facility": {"customer_id": customer.id}}, order={"id": "asc"})
+
+            def review_rows():
+                for device, latest_result in zip(devices, latest_results):
+                    latest_time = reference_time - timedelta(minutes=rng.randint(0, REVIEW_INTERVAL_MINUTES))
+                    for review_index in range(args.reviews):
+                        latest = review_index == args.reviews - 1
+                        result = latest_result if latest else DeviceReviewAllowedEnums.REJECTED.value
+                        created_at = latest_time - timedelta(
+                            minutes=REVIEW_INTERVAL_MINUTES * (args.reviews - 1 - review_index)
+                        )
+                        image_id = rng.choice(image_ids)
+                        references[image_id] += 1
+                        yield {
+                            "customer_id": customer.id,
+                            "facility_id": device.facility_id,
+                            "device_id": device.id,
+                            "image_id": image_id,
+                            "image_date_utc": created_at,
+                            "result": result,
+                            "review_comment": (
+                                rng.choice(REJECT_COMMENTS) if result == DeviceReviewAllowedEnums.REJECTED.value else ""
+                            ),
+                            "created_by": "generate_tenants",
+                            "created_at_utc": created_at,
+                            "last_updated_by": "generate_tenants",
+                        }
+
+            for batch in batched(review_rows(), args.batch_size):
+                totals["reviews"] += db.review.create_many(data=batch)
+
+            print(
+                f"{customer.customer_name}: {len(facility_ids)} facilities, {len(devices)} devices, "
+                f"{totals['reviews']} reviews so far"
+            )
+
+        for image_id, count in references.items():
+            db.image.update(where={"id": image_id}, data={"ref_count": {"increment": count}})
+        reconcile_status_counters(db, customer_ids)
+
+        print(
+            f"{args.prefix}_admin (password {args.password}): {len(customer_ids)} customers, "
+            f"{totals['facilities']} facilities, {totals['devices']} devices, {totals['reviews']} reviews, "
+            f"{len(set(image_ids))} images."
+        )
+    finally:
+        db.disconnect()
+
+
+def delete(prefix: str) -> None:
+    """
+    Method to delete the tenants generated with the given prefix
+    Args:
+        prefix (str): --prefix of the generation
+    """
+    db = Prisma()
+    db.connect()
+    try:
+        admin = db.admin.find_unique(where={"login_id": f"{prefix}_admin"})
+        if not admin:
+            print(f"{prefix}_admin not found.")
+            return
+
+        customer_ids = [customer.id for customer in db.customer.find_many(where={"admin_id": admin.id})]
+        facility_ids = [facility.id for facility in db.facility.find_many(where={"customer_id": {"in": customer_ids}})]
+        where = {"customer_id": {"in": customer_ids}}
+        release_review_images(db, where)
+        reviews = db.review.delete_many(where=where)
+        db.device_capture.delete_many(where={"facility_id": {"in": facility_ids}})
+        db.status_counter.delete_many(where=where)
+        db.retention_policy.delete_many(where=where)
+        db.device.delete_many(where={"admin_id": admin.id})
+        db.facility.delete_many(where=where)
+        db.customer.delete_many(where={"admin_id": admin.id})
+        for device_type in db.device_type.find_many(where={"admin_id": admin.id}):
+            release_image(db, device_type.sample_image_id)
+        db.device_type.delete_many(where={"admin_id": admin.id})
+        db.facility_type.delete_many(where={"admin_id": admin.id})
+        db.change_counter.delete_many(where={"admin_id": admin.id})
+        db.admin.delete(where={"id": admin.id})
+        print(f"{prefix}_admin deleted with {len(customer_ids)} customers and {reviews} reviews.")
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate deterministic synthetic tenants")
+    parser.add_argument("--customers", type=int, default=1, help="Customers of the admin")
+    parser.add_argument("--facilities", type=int, default=100, help="Facilities per customer")
+    parser.add_argument("--devices", type=int, default=5, help="Devices per facility")
+    parser.add_argument("--reviews", type=int, default=5, help="Reviews per device")
+    parser.add_argument("--images", type=int, default=20, help="Distinct images shared by the reviews")
+    parser.add_argument("--image-size", default="1280x960", help="Image size before normalization, WIDTHxHEIGHT")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--reference-time",
+        default="2025-01-01T00:00:00+00:00",
+        help="Time of the latest reviews (ISO 8601), `now` for the current time",
+    )
+    parser.add_argument("--prefix", default="synthetic", help="Prefix of the admin login ID and the records")
+    parser.add_argument("--password", default="synthetic", help="Password of the admin")
+    parser.add_argument("--base-url", default="http://127.0.0.1:9000/api/v2", help="AITRIOS base URL of the customers")
+    parser.add_argument("--auth-url", default="http://127.0.0.1:9000/oauth2/token", help="AITRIOS token URL")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per create_many")
+    parser.add_argument("--delete", action="store_true", help="Delete the tenants of --prefix instead")
+    args = parser.parse_args()
+
+    if args.delete:
+        delete(args.prefix)
+    else:
+        generate(args)
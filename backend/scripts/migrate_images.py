@@ -0,0 +1,102 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+import argparse
+from datetime import timedelta
+
+from prisma import Prisma
+from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS
+from src.exceptions import APIException
+from src.models.images import PreparedImage, acquire_image, prepare_base64_image
+
+
+def _prepare(db: Prisma, image: str, normalize: bool) -> PreparedImage:
+    if normalize:
+        return prepare_base64_image(db, image)
+    return PreparedImage.from_data_url(image)
+
+
+def _migrate(db: Prisma, model: str, blob_field: str, id_field: str, batch_size: int, normalize: bool) -> tuple:
+    """
+    Method to move the images of one table to the image table, in batches of `batch_size` rows
+    Returns:
+        (migrated rows, skipped rows)
+    """
+    actions = getattr(db, model)
+    migrated, skipped, last_id = 0, 0, 0
+    while True:
+        rows = actions.find_many(
+            where={"id": {"gt": last_id}, id_field: None, blob_field: {"not": ""}},
+            order={"id": "asc"},
+            take=batch_size,
+        )
+        if not rows:
+            break
+
+        for row in rows:
+            last_id = row.id
+            try:
+                prepared = _prepare(db, getattr(row, blob_field), normalize)
+            except (APIException, ValueError) as _exec:
+                print(f"Skipped {model} {row.id}: {_exec}")
+                skipped += 1
+                continue
+
+            with db.tx(
+                max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+                timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+            ) as transaction:
+                getattr(transaction, model).update(
+                    where={"id": row.id},
+                    data={id_field: acquire_image(transaction, prepared), blob_field: ""},
+                )
+            migrated += 1
+
+    return migrated, skipped
+
+
+def migrate(batch_size: int, normalize: bool) -> None:
+    """
+    Method to move the images stored in review.image_blob / device_type.sample_image_blob
+    to the deduplicated image table.
+    Run from backend as `python -m scripts.migrate_images` after `prisma db push` introduces the image table.
+    Rows are migrated one by one, the script can be stopped and run again.
+    Args:
+        batch_size (int): Rows read per query
+        normalize (bool): Also downscale and re-encode the images (see src/services/image_service.py)
+    """
+    db = Prisma()
+    db.connect()
+    try:
+        for model, blob_field, id_field in [
+            ("device_type", "sample_image_blob", "sample_image_id"),
+            ("review", "image_blob", "image_id"),
+        ]:
+            migrated, skipped = _migrate(db, model, blob_field, id_field, batch_size, normalize)
+            print(f"{model}: {migrated} image(s) migrated, {skipped} skipped.")
+
+        print(f"{db.image.count()} distinct image(s) stored.")
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move the stored images to the deduplicated image table")
+    parser.add_argument("--batch-size", type=int, default=100, help="Rows read per query")
+    parser.add_argument("--normalize", action="store_true", help="Downscale and re-encode the images")
+    args = parser.parse_args()
+
+    migrate(args.batch_size, args.normalize)
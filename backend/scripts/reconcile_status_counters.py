@@ -0,0 +1,51 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+import argparse
+
+from prisma import Prisma
+from src.models.status_counters import reconcile_status_counters
+
+
+def reconcile(customer_ids: list[int] | None) -> None:
+    """
+    Method to rebuild the device result counters from the device table.
+    Run from backend as `python -m scripts.reconcile_status_counters`.
+    Run once after `prisma db push` introduces the status_counter table, then periodically (e.g. cron)
+    to repair any drift.
+    Args:
+        customer_ids (list[int]): Customer IDs to reconcile, all customers if None
+    """
+    db = Prisma()
+    db.connect()
+    try:
+        if not customer_ids:
+            customer_ids = [customer.id for customer in db.customer.find_many()]
+            # Counters of deleted customers
+            db.status_counter.delete_many(where={"customer_id": {"not_in": customer_ids}})
+
+        reconcile_status_counters(db, customer_ids)
+        print(f"Status counters reconciled for {len(customer_ids)} customer(s).")
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the device result counters")
+    parser.add_argument("-c", "--customer-id", type=int, action="append", help="Customer ID, repeatable")
+    args = parser.parse_args()
+
+    reconcile(args.customer_id)
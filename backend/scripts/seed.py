@@ -63,6 +63,8 @@ def clear_data():
         db.facility_type.delete_many()
         db.customer.delete_many()
         db.admin.delete_many()
+        # Master data versions used as ETag by the backend
+        db.change_counter.delete_many()
     except errors.PrismaError as e:
         print("Clear DB Failed. " + str(e))
         return False
@@ -29,6 +29,8 @@ from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_S
 from src.core import db
 from src.exceptions import APIException, ErrorCodes, InvalidAuthTokenException, InvalidBaseURLException
 from src.libs.auth import check_resource_authorization
+from src.libs.etag import conditional_get
+from src.models.change_counters import CUSTOMER, bump_change_counter
 from src.schemas.customers import (
     CreateCustomerRequestSchema,
     CreateCustomerResponseSchema,
@@ -36,6 +38,8 @@ from src.schemas.customers import (
     CustomerListResponseSchema,
     CustomerListSchema,
     CustomerUpdateRequestSchema,
+    RetentionPolicyGetResponseSchema,
+    RetentionPolicyRequestSchema,
 )
 from src.schemas.response import ResponseHTTPSchema
 from src.services.aitrios_service import verify_customer_credentials
@@ -47,6 +51,7 @@ api = Blueprint("customers", __name__, url_prefix="/customers")
 
 @api.get("")
 @login_required
+@conditional_get(CUSTOMER)
 def get_customers():
     """
     List all customers
@@ -187,10 +192,71 @@ def update_console_credentials(customer_id: int, body: CustomerUpdateRequestSche
             where={"id": customer_id},
             data={**customer_data, "last_updated_at_utc": datetime.now(timezone.utc)},
         )
+        bump_change_counter(transaction, CUSTOMER, current_user.id)
     response_data = {"message": "Successfully updated"}
     return ResponseHTTPSchema(**response_data).make_response()
 
 
+@api.get("/<int:customer_id>/retention-policy")
+@login_required
+def get_retention_policy(customer_id: int):
+    """
+    Get the review image retention policy of a customer
+    Args:
+        customer_id: int
+    """
+
+    # Return 404 if customer_id is not valid
+    if customer_id <= 0:
+        raise APIException(ErrorCodes.CUSTOMER_NOT_FOUND)
+
+    check_resource_authorization(customer_id=customer_id)
+
+    # No policy: images are retained indefinitely
+    policy = db.retention_policy.find_unique(where={"customer_id": customer_id})
+    return_data = policy.model_dump() if policy else {"customer_id": customer_id}
+
+    return RetentionPolicyGetResponseSchema(**return_data).make_response()
+
+
+@api.put("/<int:customer_id>/retention-policy")
+@login_required
+@validate()
+def update_retention_policy(customer_id: int, body: RetentionPolicyRequestSchema):
+    """
+    Create or update the review image retention policy of a customer.
+    The policy is applied by scripts/apply_retention.py
+    Args:
+        customer_id: int
+        body: {
+            "max_age_days": 90,
+            "keep_latest": 5,
+            "action": "archive"
+        }
+    """
+
+    # Return 404 if customer_id is not valid
+    if customer_id <= 0:
+        raise APIException(ErrorCodes.CUSTOMER_NOT_FOUND)
+
+    check_resource_authorization(customer_id=customer_id)
+
+    policy_data = {
+        "max_age_days": body.max_age_days,
+        "keep_latest": body.keep_latest,
+        "action": body.action.value,
+    }
+    policy = db.retention_policy.upsert(
+        where={"customer_id": customer_id},
+        data={
+            "create": {"customer_id": customer_id, **policy_data},
+            "update": policy_data,
+        },
+    )
+
+    return RetentionPolicyGetResponseSchema(**policy.model_dump()).make_response(message="Successfully updated")
+
+
 @api.post("")
 @login_required
 @validate()
@@ -254,8 +320,8 @@ def create_customer(body: CreateCustomerRequestSchema):
     with db.tx(
         max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
         timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
-    ):
-        new_customer = db.customer.create(
+    ) as transaction:
+        new_customer = transaction.customer.create(
             data={
                 "customer_uuid": str(uuid.uuid4()),
                 "customer_name": body.customer_name,
@@ -271,6 +337,7 @@ def create_customer(body: CreateCustomerRequestSchema):
                 "last_updated_at_utc": now_utc,
             }
         )
+        bump_change_counter(transaction, CUSTOMER, current_user.id)
 
     # 3. Prepare the response
     resp_data = CreateCustomerResponseSchema(id=new_customer.id, customer_name=new_customer.customer_name)
@@ -25,10 +25,20 @@ from io import BytesIO
 
 from flask import Blueprint, jsonify, request, send_file
 from flask_login import current_user, login_required
+from prisma.partials import ReviewWithoutImage
 from src.core import db
-from src.exceptions import APIException, ErrorCodes
+from src.exceptions import APIException, ErrorCodes, with_message
+from src.models.change_counters import MASTER_DATA_TABLES, bump_change_counter
+from src.models.images import (
+    acquire_image,
+    get_image_blob,
+    prepare_base64_image,
+    release_image,
+    release_review_images,
+)
+from src.models.status_counters import reconcile_status_counters
 from src.schemas.data_migration import DataMigrationSchema
-from src.utils import decrypt_data, encrypt_data, is_valid_base64_image
+from src.utils import decrypt_data, encrypt_data
 
 # Admin App API
 # Blueprint for export/import APIs
@@ -52,14 +62,15 @@ def export_data():
 
         # Fetch facility types and device types (global data)
         facility_types = db.facility_type.find_many(where={"admin_id": current_user.id})
-        device_types = db.device_type.find_many(where={"admin_id": current_user.id})
+        device_types = db.device_type.find_many(where={"admin_id": current_user.id}, include={"sample_image": True})
 
         # Prepare data for export
         data = {
             "admin": [
                 {
                     "device_types": [
-                        {"name": dt.name, "sample_image_blob": dt.sample_image_blob} for dt in device_types
+                        {"name": dt.name, "sample_image_blob": get_image_blob(dt.sample_image, dt.sample_image_blob)}
+                        for dt in device_types
                     ],
                     "facility_types": [{"name": ft.name} for ft in facility_types],
                     "customers": [
@@ -184,9 +195,7 @@ def import_data():
         except json.JSONDecodeError as _js_decode_exc:
             raise APIException(ErrorCodes.INVALID_JSON_FORMAT) from _js_decode_exc
         except ValueError as _schema_exc:
-            _ec = ErrorCodes.SCHEMA_VALIDATION_FAILED
-            _ec["message"] = str(_schema_exc)
-            raise APIException(_ec) from _schema_exc
+            raise APIException(with_message(ErrorCodes.SCHEMA_VALIDATION_FAILED, str(_schema_exc))) from _schema_exc
 
         # Ensure the admin list is non-empty
         if not validated_data.admin or len(validated_data.admin) == 0:
@@ -195,12 +204,16 @@ def import_data():
         # Assign the first admin record to a variable for reuse
         admin_data = validated_data.admin[0]
 
-        # Validate device type images
+        # Validate device type images from their header and normalize them, before any data is deleted.
+        # Images exported from this application are already normalized and kept as is
+        sample_images = []
         for device_type_data in admin_data.device_types:
-            if not is_valid_base64_image(device_type_data.sample_image_blob):
-                _ec = ErrorCodes.SCHEMA_VALIDATION_FAILED
-                _ec["message"] = "invalid sample image blob format"
-                raise APIException(_ec)
+            try:
+                sample_images.append(prepare_base64_image(db, device_type_data.sample_image_blob))
+            except APIException as _image_exc:
+                raise APIException(
+                    with_message(ErrorCodes.SCHEMA_VALIDATION_FAILED, "invalid sample image blob format")
+                ) from _image_exc
 
         # verify if the customer name is unique in the admin data
         customer_names = [customer.customer_name for customer in admin_data.customers]
@@ -209,7 +222,8 @@ def import_data():
 
         # Step 3: Clear all data associated with the current user
         # Batch delete reviews
-        reviews_to_delete = db.review.find_many(where={"customer": {"admin_id": current_user.id}})
+        release_review_images(db, {"customer": {"admin_id": current_user.id}})
+        reviews_to_delete = ReviewWithoutImage.prisma(db).find_many(where={"customer": {"admin_id": current_user.id}})
         for review in reviews_to_delete:
             db.review.delete(where={"id": review.id})
 
@@ -227,11 +241,13 @@ def import_data():
         customers_to_delete = db.customer.find_many(where={"admin_id": current_user.id})
         for customer in customers_to_delete:
             db.customer.delete(where={"id": customer.id})
+        db.status_counter.delete_many(where={"customer_id": {"in": [customer.id for customer in customers_to_delete]}})
 
         # Batch delete device types
         device_types_to_delete = db.device_type.find_many(where={"admin_id": current_user.id})
         for device_type in device_types_to_delete:
             db.device_type.delete(where={"id": device_type.id})
+            release_image(db, device_type.sample_image_id)
 
         # Batch delete facility types
         facility_types_to_delete = db.facility_type.find_many(where={"admin_id": current_user.id})
@@ -252,23 +268,26 @@ def import_data():
                 db.facility_type.create(data={"name": facility_type_data.name, "admin_id": current_user.id})
 
         # Insert device types
-        for device_type_data in admin_data.device_types:
+        for device_type_data, sample_image in zip(admin_data.device_types, sample_images):
 
             existing_device_type = db.device_type.find_first(
                 where={"name": device_type_data.name, "admin_id": current_user.id}
             )
+            # Imported images are deduplicated by content
+            sample_image_id = acquire_image(db, sample_image)
             if existing_device_type:
                 # Update the existing device type
                 db.device_type.update(
                     where={"id": existing_device_type.id},
-                    data={"sample_image_blob": device_type_data.sample_image_blob},
+                    data={"sample_image_id": sample_image_id, "sample_image_blob": ""},
                 )
+                release_image(db, existing_device_type.sample_image_id)
             else:
                 # Create a new device type
                 db.device_type.create(
                     data={
                         "name": device_type_data.name,
-                        "sample_image_blob": device_type_data.sample_image_blob,
+                        "sample_image_id": sample_image_id,
                         "admin_id": current_user.id,
                     }
                 )
@@ -337,6 +356,9 @@ def import_data():
                         }
                     )
 
+        # Build the device result counters of the imported customers
+        reconcile_status_counters(db, list(customer_map.values()))
+
         return jsonify({"message": "Data imported successfully."})
     except APIException as _api_exc:
         # Re-raise API-specific exceptions without wrapping them
@@ -344,3 +366,7 @@ def import_data():
     except Exception as _exc:
         # Handle unexpected errors
         raise APIException(ErrorCodes.UNEXPECTED_ERROR) from _exc
+    finally:
+        # Also after a failed import, the master data may be partially replaced
+        for table_name in MASTER_DATA_TABLES:
+            bump_change_counter(db, table_name, current_user.id)
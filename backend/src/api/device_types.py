@@ -18,14 +18,25 @@
 File: backend/src/api/device_types.py
 """
 
+import base64
+import re
 from datetime import datetime, timedelta, timezone
 
-from flask import Blueprint
+from flask import Blueprint, make_response
 from flask_login import current_user, login_required
 from flask_pydantic import validate
-from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS
+from prisma.partials import DeviceTypeWithoutImage
+from src.config import (
+    DB_TRANSACTION_MAX_WAIT_SECONDS,
+    DB_TRANSACTION_TIMEOUT_SECONDS,
+    REFERENCE_IMAGE_MAX_AGE_SECONDS,
+)
 from src.core import db
 from src.exceptions import APIException, ErrorCodes
+from src.libs.etag import conditional_get
+from src.libs.fields import FieldSelection
+from src.models.change_counters import DEVICE_TYPE, bump_change_counter
+from src.models.images import acquire_image, add_reference_image_urls, prepare_base64_image, release_image
 from src.schemas.devices import (
     CreateDeviceTypeRequestSchema,
     DeviceTypeListResponseSchema,
@@ -34,46 +45,95 @@ from src.schemas.devices import (
     EditDeviceTypeRequestSchema,
 )
 from src.schemas.response import ResponseHTTPSchema
-from src.utils import is_valid_base64_image
 
 # Admin App API
 api = Blueprint("device-types", __name__, url_prefix="/device-types")
 
+CONTENT_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+
 
 @api.get("")
 @login_required
+@conditional_get(DEVICE_TYPE)
 def get_device_types():
     """
     GET /device-types
     Retrieves a list of all device types.
+    QueryParams
+        fields: Sparse fieldset of the items (see src/libs/fields.py), `id`, `name` and `sample_image_url`
+                by default, `sample_image_blob` is returned only when requested
     """
-    rows = db.device_type.find_many(where={"admin_id": current_user.id})
-    data = [DeviceTypeResponseSchema.model_validate(row.model_dump()) for row in rows]
+    fields = FieldSelection.from_request(
+        DeviceTypeSchema, blob_paths=["sample_image_blob"], default_paths=DeviceTypeResponseSchema.model_fields
+    )
+    if fields.wants("sample_image_blob"):
+        rows = db.device_type.find_many(where={"admin_id": current_user.id}, include={"sample_image": True})
+    else:
+        rows = DeviceTypeWithoutImage.prisma(db).find_many(where={"admin_id": current_user.id})
+
+    device_types = add_reference_image_urls(db, [row.model_dump() for row in rows])
+    data = [fields.dump(DeviceTypeSchema.model_validate(device_type)) for device_type in device_types]
     response = DeviceTypeListResponseSchema(data=data, message="Device types retrieved successfully", total=len(data))
     return response.make_response()
 
 
 @api.get("/<int:devicetype_id>")
 @login_required
+@conditional_get(DEVICE_TYPE)
 def get_devicetype_by_id(devicetype_id: int):
     """
     GET /device-types/{devicetype_id}
     Fetches details for a specific devicetype by ID
+    QueryParams
+        fields: Sparse fieldset of the response (see src/libs/fields.py),
+                `sample_image_blob` is returned only when requested, `sample_image_url` otherwise
     """
 
     # Return 404 if device_type_id is not valid
     if devicetype_id <= 0:
         raise APIException(ErrorCodes.DEVICE_TYPE_NOT_FOUND)
 
-    devicetype_obj = db.device_type.find_first(where={"id": devicetype_id, "admin_id": current_user.id})
+    fields = FieldSelection.from_request(DeviceTypeSchema, blob_paths=["sample_image_blob"])
+    where = {"id": devicetype_id, "admin_id": current_user.id}
+    if fields.wants("sample_image_blob"):
+        devicetype_obj = db.device_type.find_first(where=where, include={"sample_image": True})
+    else:
+        devicetype_obj = DeviceTypeWithoutImage.prisma(db).find_first(where=where)
     if not devicetype_obj:
         raise APIException(ErrorCodes.DEVICE_TYPE_NOT_FOUND)
 
+    data = add_reference_image_urls(db, [devicetype_obj.model_dump()])[0]
     return ResponseHTTPSchema(
-        message="Device type retrieved successfully", data=devicetype_obj.model_dump()
+        message="Device type retrieved successfully", data=fields.dump(DeviceTypeSchema.model_validate(data))
     ).make_response()
 
 
+@api.get("/reference-images/<string:content_hash>")
+def get_reference_image(content_hash: str):
+    """
+    GET /device-types/reference-images/{content_hash}
+    Serves the reference image of a device type, as sent in `sample_image_url`.
+    The content of the URL never changes, so it is cached by the browsers and proxies for good.
+    There is no authentication (<img> tags of the Admin and Contractor apps): the hash is only known
+    from the device type responses, and only the images referenced by a device type are served.
+    """
+    if not CONTENT_HASH_PATTERN.fullmatch(content_hash):
+        raise APIException(ErrorCodes.IMAGE_NOT_FOUND)
+
+    image = db.image.find_first(where={"content_hash": content_hash, "device_types": {"some": {}}})
+    if not image:
+        raise APIException(ErrorCodes.IMAGE_NOT_FOUND)
+
+    # data:<mime type>;base64,<data>
+    header, _, data = image.image_blob.partition(",")
+    response = make_response(base64.b64decode(data))
+    response.mimetype = header.removeprefix("data:").split(";")[0]
+    response.cache_control.public = True
+    response.cache_control.max_age = REFERENCE_IMAGE_MAX_AGE_SECONDS
+    response.cache_control.immutable = True
+    return response
+
+
 @api.post("")
 @login_required
 @validate()
@@ -83,28 +143,30 @@ def create_device_type(body: CreateDeviceTypeRequestSchema):
     Creates a new device type with reference image.
     """
 
-    reference_image = body.reference_image
-
-    if reference_image and not reference_image.startswith("data:image/"):
-        reference_image = "data:image/jpeg;base64," + reference_image
+    # Stored downscaled and re-encoded without metadata, shared by the device types with the same image
+    try:
+        reference_image = prepare_base64_image(db, body.reference_image)
+    except APIException:
+        return ResponseHTTPSchema(status_code=400, message="Invalid image format").make_response()
 
     with db.tx(
         max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
         timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
-    ):
-        new_device_type = db.device_type.create(
+    ) as transaction:
+        new_device_type = transaction.device_type.create(
             data={
                 "name": body.name,
-                "sample_image_blob": reference_image,
+                "sample_image_id": acquire_image(transaction, reference_image),
                 "created_by": "system",
                 "admin_id": current_user.id,
                 "last_updated_by": "system",
-            }
+            },
         )
+        bump_change_counter(transaction, DEVICE_TYPE, current_user.id)
 
-    created_data = DeviceTypeSchema(**new_device_type.model_dump())
+    created_data = DeviceTypeSchema(**add_reference_image_urls(db, [new_device_type.model_dump()])[0])
     return ResponseHTTPSchema(
-        status_code=201, message="Device type created", data=created_data.model_dump()
+        status_code=201, message="Device type created", data=created_data.model_dump(exclude={"sample_image_blob"})
     ).make_response()
 
 
@@ -135,29 +197,34 @@ def edit_device_type(device_type_id: int, body: EditDeviceTypeRequestSchema):
     if body.name:
         update_data["name"] = body.name
 
+    reference_image = None
     if body.reference_image is not None:
-        ref_img = body.reference_image
-        if ref_img and not ref_img.startswith("data:image/"):
-            ref_img = "data:image/jpeg;base64," + ref_img
-        update_data["sample_image_blob"] = ref_img
-
-        # Validate if the base64 string is valid image
-        if update_data.get("sample_image_blob"):
-            if not is_valid_base64_image(update_data["sample_image_blob"]):
-                return ResponseHTTPSchema(status_code=400, message="Invalid image format").make_response()
+        # Validate the image and store it downscaled and re-encoded, without metadata
+        try:
+            reference_image = prepare_base64_image(db, body.reference_image)
+        except APIException:
+            return ResponseHTTPSchema(status_code=400, message="Invalid image format").make_response()
 
     # 3. Update DB
     with db.tx(
         max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
         timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
-    ):
-        updated = db.device_type.update(
+    ) as transaction:
+        if reference_image:
+            update_data["sample_image_id"] = acquire_image(transaction, reference_image)
+            update_data["sample_image_blob"] = ""
+            release_image(transaction, device_type.sample_image_id)
+
+        updated = transaction.device_type.update(
             where={"id": device_type_id},
             data={**update_data, "last_updated_by": "system", "last_updated_at_utc": datetime.now(timezone.utc)},
         )
+        bump_change_counter(transaction, DEVICE_TYPE, device_type.admin_id)
 
     # 4. Return the updated device type
-    updated_data = DeviceTypeSchema(**updated.model_dump())
+    updated_data = DeviceTypeSchema(**add_reference_image_urls(db, [updated.model_dump()])[0])
     return ResponseHTTPSchema(
-        status_code=200, message="Device type updated successfully", data=updated_data.model_dump()
+        status_code=200,
+        message="Device type updated successfully",
+        data=updated_data.model_dump(exclude={"sample_image_blob"}),
     ).make_response()
@@ -18,14 +18,19 @@
 File: backend/src/api/devices.py
 """
 
+from datetime import timedelta
 
 from flask import Blueprint, request
 from flask_login import current_user, login_required
 from flask_pydantic import validate
+from prisma.partials import DeviceWithoutImage, ReviewWithoutImage
+from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS
 from src.core import db
-from src.exceptions import APIException, ErrorCodes, InvalidBaseURLException
+from src.exceptions import APIException, ErrorCodes, InvalidBaseURLException, with_message
 from src.libs.auth import check_resource_authorization
-from src.models.reviews import build_device_query
+from src.models.images import release_review_images
+from src.models.reviews import build_device_query, delete_review
+from src.models.status_counters import adjust_status_counter, adjust_status_counters
 from src.schemas.devices import (
     AitriosDeviceListSchema,
     DeleteDeviceListRequestSchema,
@@ -71,16 +76,12 @@ def get_device_connection_status():
         # Check if unexpected params are received and raise exception if so.
         unexpected_params = received_params - STATUS_API_EXPECTED_PARAMS
         if unexpected_params:
-            _ec = ErrorCodes.UNEXPECTED_PARAMS
-            _ec["message"] = f"Unexpected params: {unexpected_params}"
-            raise APIException(_ec)
+            raise APIException(with_message(ErrorCodes.UNEXPECTED_PARAMS, f"Unexpected params: {unexpected_params}"))
 
         # Check if `customer_id` is received.
         # If not, raise param missing error.
         if "customer_id" not in request.args:
-            _ec = ErrorCodes.PARAMETER_MISSING
-            _ec["message"] = "`customer_id` query parameter is required"
-            raise APIException(_ec)
+            raise APIException(with_message(ErrorCodes.PARAMETER_MISSING, "`customer_id` query parameter is required"))
 
         customer_id = request.args.get("customer_id")
         if not customer_id or int(customer_id) <= 0:
@@ -190,7 +191,8 @@ def save_or_update_devices(body: DeviceSaveOrUpdateRequestSchema):
             facility_id = device.facility_id
 
             # Validate facility_id
-            if not facility_id or not db.facility.find_first(where={"id": facility_id}):
+            facility = db.facility.find_first(where={"id": facility_id}) if facility_id else None
+            if not facility:
                 raise APIException(ErrorCodes.INVALID_FACILITY_ID)
 
             # Validate device_type_id
@@ -199,18 +201,20 @@ def save_or_update_devices(body: DeviceSaveOrUpdateRequestSchema):
                 raise APIException(ErrorCodes.INVALID_DEVICE_TYPE_ID)
 
             # Check if the device exists
-            existing_device = db.device.find_first(where={"device_id": device_id, "admin_id": current_user.id})
+            existing_device = db.device.find_first(
+                where={"device_id": device_id, "admin_id": current_user.id}, include={"facility": True}
+            )
             device_update_result = None
 
             if existing_device:
                 # delete all the reviews for the device one by one
-                reviews = db.review.find_many(where={"device_id": existing_device.id})
+                reviews = ReviewWithoutImage.prisma(db).find_many(where={"device_id": existing_device.id})
 
                 is_review_delete_successful = True
                 # Iterate through the reviews and delete them
                 for review in reviews:
                     try:
-                        db.review.delete(where={"id": review.id})
+                        delete_review(db, review)
                     except Exception:
                         is_review_delete_successful = False
                         break
@@ -227,7 +231,24 @@ def save_or_update_devices(body: DeviceSaveOrUpdateRequestSchema):
                     "device_type_id": device_type_id,
                     "result": DeviceReviewAllowedEnums.INITIAL_STATE.value,
                 }
-                device_update_result = db.device.update(where={"id": existing_device.id}, data=update_data)
+                with db.tx(
+                    max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+                    timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+                ) as transaction:
+                    device_update_result = transaction.device.update(where={"id": existing_device.id}, data=update_data)
+                    # Move the device from its previous facility / result counter
+                    adjust_status_counters(
+                        transaction,
+                        [
+                            (
+                                existing_device.facility.customer_id,
+                                existing_device.facility_id,
+                                existing_device.result,
+                                -1,
+                            ),
+                            (facility.customer_id, facility_id, DeviceReviewAllowedEnums.INITIAL_STATE.value, 1),
+                        ],
+                    )
             else:
                 # Create new device
                 create_data = {
@@ -237,7 +258,14 @@ def save_or_update_devices(body: DeviceSaveOrUpdateRequestSchema):
                     "device_type_id": device_type_id,
                     "admin_id": current_user.id,
                 }
-                device_update_result = db.device.create(data=create_data)
+                with db.tx(
+                    max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+                    timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+                ) as transaction:
+                    device_update_result = transaction.device.create(data=create_data)
+                    adjust_status_counter(
+                        transaction, facility.customer_id, facility_id, device_update_result.result, 1
+                    )
 
             if not device_update_result:
                 failed_to_update_devices.append(device_id)
@@ -246,9 +274,7 @@ def save_or_update_devices(body: DeviceSaveOrUpdateRequestSchema):
         # Check if any device update failed
         if failed_to_update_devices:
             error_message = f"Failed to update devices for the following IDs: {failed_to_update_devices}."
-            _ec = ErrorCodes.DEVICE_UPDATE_FAILED.copy()
-            _ec["message"] = error_message
-            raise APIException(_ec)
+            raise APIException(with_message(ErrorCodes.DEVICE_UPDATE_FAILED, error_message))
 
         return ResponseHTTPSchema(message="Devices processed successfully", status_code=200).make_response()
     except APIException:
@@ -269,9 +295,7 @@ def get_combined_devices():
     # 1. Parse and validate `customer_id`
     customer_id_str = request.args.get("customer_id")
     if not customer_id_str:
-        _ec = ErrorCodes.PARAMETER_MISSING
-        _ec["message"] = "`customer_id` query parameter is required."
-        raise APIException(_ec)
+        raise APIException(with_message(ErrorCodes.PARAMETER_MISSING, "`customer_id` query parameter is required."))
 
     try:
         customer_id = int(customer_id_str)
@@ -315,8 +339,11 @@ def get_combined_devices():
     except Exception as exc:
         raise APIException(ErrorCodes.UNEXPECTED_ERROR) from exc
 
-    # 6. Build a map of local AAT DB devices belonging to the given customer
-    local_db_devices = db.device.find_many(where={"facility": {"customer_id": customer_id}})
+    # 6. Build a map of local AAT DB devices belonging to the given customer,
+    # with their facility and device type (without its reference image) in the same query
+    local_db_devices = DeviceWithoutImage.prisma(db).find_many(
+        where={"facility": {"customer_id": customer_id}}, include={"facility": True, "device_type": True}
+    )
     local_map = {dev.device_id: dev for dev in local_db_devices}
 
     # 7. Construct final list
@@ -340,12 +367,10 @@ def get_combined_devices():
             # Use local DB details for device name, facility, device_type, etc.
             device_name = db_dev.device_name
             facility_id = db_dev.facility_id
-            facility = db.facility.find_unique(where={"id": db_dev.facility_id})
-            facility_name = facility.facility_name if facility else ""
+            facility_name = db_dev.facility.facility_name if db_dev.facility else ""
 
             device_type_id = db_dev.device_type_id
-            device_type = db.device_type.find_unique(where={"id": db_dev.device_type_id})
-            device_type_name = device_type.name if device_type else ""
+            device_type_name = db_dev.device_type.name if db_dev.device_type else ""
             # delete device id present in aitrios from local_map
             del local_map[device_id]
 
@@ -365,14 +390,13 @@ def get_combined_devices():
 
     # Add remaining local devices to the list
     for local_device in local_map.values():
-        facility_obj = db.facility.find_unique(where={"id": local_device.facility_id, "customer_id": customer_id})
+        facility_obj = local_device.facility
 
         # Add the device from database only if it belongs to the same customer
-        if facility_obj:
-            facility_name = facility_obj.facility_name if facility_obj else ""
+        if facility_obj and facility_obj.customer_id == customer_id:
+            facility_name = facility_obj.facility_name
 
-            device_type_obj = db.device_type.find_unique(where={"id": local_device.device_type_id})
-            device_type_name = device_type_obj.name if device_type_obj else ""
+            device_type_name = local_device.device_type.name if local_device.device_type else ""
 
             combined_list.append(
                 {
@@ -422,25 +446,31 @@ def delete_devices(body: DeleteDeviceListRequestSchema):
 
             # Find the device in the database by AITRIOS DEVICE ID
             existing_device = db.device.find_first(
-                where={"device_id": device.device_id, "facility_id": device.facility_id, "admin_id": current_user.id}
+                where={"device_id": device.device_id, "facility_id": device.facility_id, "admin_id": current_user.id},
+                include={"facility": True},
             )
             if not existing_device:
                 failed_to_delete_devices.append(device.device_id)
                 continue
 
-            # search reviews by Device DB ID
-            reviews = db.review.find_many(where={"device_id": existing_device.id})
-            total_reviews = len(reviews)
-
-            if reviews and total_reviews > 0:
-                # delete reviews by Device DB ID
-                deleted_review_count = db.review.delete_many(where={"device_id": existing_device.id})
-
-                if deleted_review_count != total_reviews:
-                    failed_to_delete_devices.append(device.device_id)
-                    continue
-
-            delete_device = db.device.delete(where={"id": existing_device.id, "facility_id": device.facility_id})
+            with db.tx(
+                max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+                timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+            ) as transaction:
+                # delete reviews by Device DB ID, releasing their images along with the device delete
+                release_review_images(transaction, {"device_id": existing_device.id})
+                transaction.review.delete_many(where={"device_id": existing_device.id})
+                delete_device = transaction.device.delete(
+                    where={"id": existing_device.id, "facility_id": device.facility_id}
+                )
+                if delete_device:
+                    adjust_status_counter(
+                        transaction,
+                        existing_device.facility.customer_id,
+                        existing_device.facility_id,
+                        existing_device.result,
+                        -1,
+                    )
             if not delete_device:
                 failed_to_delete_devices.append(device.device_id)
 
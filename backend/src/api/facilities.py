@@ -18,6 +18,7 @@ from datetime import datetime
 
 from flask import Blueprint, jsonify, request
 from flask_pydantic import validate
+from prisma.partials import DeviceTypeWithoutImage
 from requests.exceptions import RequestException
 from src.core import db
 from src.exceptions import (
@@ -28,6 +29,8 @@ from src.exceptions import (
     RetryAPIException,
 )
 from src.libs.auth import check_device_authorization, validate_auth_token
+from src.models.captures import store_capture
+from src.models.images import add_reference_image_urls
 from src.schemas.devices import DeviceStatusListSchema
 from src.schemas.facilities import (
     FacilityDeviceDataSchema,
@@ -38,6 +41,7 @@ from src.schemas.facilities import (
 )
 from src.schemas.reviews import DeviceReviewAllowedEnums
 from src.services import aitrios_service
+from src.services.image_service import normalize_base64_image
 from src.utils import dict_has_non_null_values
 
 # Contractor App API
@@ -256,7 +260,9 @@ def get_images(device_id: int, payload: dict):
     if image_type not in [ImageTypeSchema.CAMERA, ImageTypeSchema.REVIEW_COMMENT_AND_SAMPLE_IMAGE]:
         raise APIException(ErrorCodes.IMAGE_TYPE_NOT_FOUND)
     camera_image = None
+    capture_id = None
     sample_image = None
+    sample_image_url = None
     review_comment = ""
     device = db.device.find_first(where={"id": int(device_id)})
 
@@ -289,6 +295,9 @@ def get_images(device_id: int, payload: dict):
                 raise APIException(ErrorCodes.INVALID_CONSOLE_CREDENTIALS)
 
             camera_image = aitrios_service.fetch_images_by_device_id(device.device_id, console_creds.copy())
+            if camera_image:
+                # The capture keeps the normalized image the review is created from, the camera image is returned as is
+                capture_id = store_capture(db, int(device_id), int(facility_id), normalize_base64_image(camera_image))
 
         except RetryAPIException:
             raise APIException(ErrorCodes.CAMERA_ISSUE)
@@ -307,8 +316,11 @@ def get_images(device_id: int, payload: dict):
 
     elif image_type == ImageTypeSchema.REVIEW_COMMENT_AND_SAMPLE_IMAGE:
         try:
-            device_type = db.device_type.find_first(where={"id": int(device.device_type_id)})
-            sample_image = device_type.sample_image_blob
+            device_type = DeviceTypeWithoutImage.prisma(db).find_first(where={"id": int(device.device_type_id)})
+            sample_image_url = add_reference_image_urls(db, [device_type.model_dump()])[0]["sample_image_url"]
+            if not sample_image_url:
+                # Reference image still in the legacy column, see scripts/migrate_images.py
+                sample_image = db.device_type.find_unique(where={"id": device_type.id}).sample_image_blob
             review = db.review.find_first(
                 where={
                     "facility_id": int(facility_id),
@@ -328,7 +340,9 @@ def get_images(device_id: int, payload: dict):
             "device_id": device_id,
             "device_image": camera_image,
             "sample_image": sample_image,
+            "sample_image_url": sample_image_url,
             "retrieved_date": datetime.now(),
             "comment": review_comment,
+            "capture_id": capture_id,
         }
     ).model_dump()
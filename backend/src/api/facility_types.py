@@ -25,6 +25,8 @@ from flask_login import current_user, login_required
 from flask_pydantic import validate
 from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS
 from src.core import db
+from src.libs.etag import conditional_get
+from src.models.change_counters import FACILITY_TYPE, bump_change_counter
 from src.schemas.facility_types import (
     CreateFacilityTypeRequestSchema,
     FacilityTypeListResponseSchema,
@@ -38,6 +40,7 @@ api = Blueprint("facility-types", __name__, url_prefix="/facility-types")
 
 @api.get("")
 @login_required
+@conditional_get(FACILITY_TYPE)
 def get_facility_types():
     """
     GET /facility-types
@@ -72,10 +75,11 @@ def create_facility_type(body: CreateFacilityTypeRequestSchema):
     with db.tx(
         max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
         timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
-    ):
-        new_type = db.facility_type.create(
+    ) as transaction:
+        new_type = transaction.facility_type.create(
             data={"name": body.name, "admin_id": current_user.id, "created_by": "system", "last_updated_by": "system"}
         )
+        bump_change_counter(transaction, FACILITY_TYPE, current_user.id)
 
     created_data = FacilityTypeSchema(**new_type.model_dump())
 
@@ -14,12 +14,18 @@
 # limitations under the License.
 # ------------------------------------------------------------------------
 
+from datetime import timedelta
+
 from flask import Blueprint, request
-from flask_login import login_required
+from flask_login import current_user, login_required
 from flask_pydantic import validate
+from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS
 from src.core import db
 from src.exceptions import APIException, ErrorCodes
 from src.libs.auth import check_resource_authorization
+from src.libs.etag import conditional_get
+from src.models.change_counters import FACILITY, bump_change_counter
+from src.models.status_counters import move_facility_status_counters
 from src.schemas.facility_update import (
     FacilityUpdateBasicSchema,
     FacilityUpdateByCustomerListResponseSchema,
@@ -34,6 +40,7 @@ api = Blueprint("facility-update", __name__, url_prefix="/facilities")
 
 @api.get("/<int:facility_id>")
 @login_required
+@conditional_get(FACILITY)
 def get_facility_by_id(facility_id: int):
     """
     GET /facilities/{facility_id}
@@ -94,7 +101,15 @@ def create_or_update_facility(facility_id: int, body: FacilityUpdateCreateOrUpda
             if duplicate:
                 raise APIException(ErrorCodes.DUPLICATE_FACILITY_NAME)
 
-            db.facility.update(where={"id": facility_id}, data=update_data)
+            with db.tx(
+                max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+                timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+            ) as transaction:
+                transaction.facility.update(where={"id": facility_id}, data=update_data)
+                # The facility devices are now counted for the new customer
+                if existing.customer_id != body.customer_id:
+                    move_facility_status_counters(transaction, facility_id, existing.customer_id, body.customer_id)
+                bump_change_counter(transaction, FACILITY, current_user.id)
             message = "Facility updated successfully"
         else:
             # Handle the case where the facility ID is not found for an update
@@ -121,7 +136,12 @@ def create_or_update_facility(facility_id: int, body: FacilityUpdateCreateOrUpda
                 "facility_type_id": body.facility_type_id,
                 "customer_id": body.customer_id,
             }
-            db.facility.create(data=create_data)
+            with db.tx(
+                max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+                timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+            ) as transaction:
+                transaction.facility.create(data=create_data)
+                bump_change_counter(transaction, FACILITY, current_user.id)
             message = "Facility created successfully"
 
         return ResponseHTTPSchema(message=message, status_code=200).make_response()
@@ -135,6 +155,7 @@ def create_or_update_facility(facility_id: int, body: FacilityUpdateCreateOrUpda
 
 @api.get("")
 @login_required
+@conditional_get(FACILITY)
 def get_facilities_by_customer():
     """
     GET /facilities?customer_id={customer_id}
@@ -15,28 +15,75 @@
 # ------------------------------------------------------------------------
 
 from datetime import datetime, timedelta
+from typing import Callable
 
 from flask import Blueprint, request
 from flask_login import current_user, login_required
 from flask_pydantic import validate
-from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS, DEFAULT_PAGE_SIZE
+from prisma.partials import DeviceWithoutImage, ReviewWithoutImage
+from src.config import (
+    DB_TRANSACTION_MAX_WAIT_SECONDS,
+    DB_TRANSACTION_TIMEOUT_SECONDS,
+    DEFAULT_PAGE_SIZE,
+    REVIEW_SLA_BUCKET_MINUTES,
+    REVIEW_SLA_MINUTES,
+    UPLOAD_CHUNK_MAX_BYTES,
+)
 from src.core import db
-from src.exceptions import APIException, ErrorCodes
+from src.exceptions import APIException, ErrorCodes, with_message
 from src.libs.auth import check_device_authorization, check_resource_authorization, validate_auth_token
-from src.models.reviews import build_device_query, get_checking_reviews_info
+from src.libs.fields import FieldSelection
+from src.libs.idempotency import idempotent
+from src.models.captures import take_capture
+from src.models.images import (
+    PreparedImage,
+    acquire_image,
+    add_reference_image_urls,
+    get_image_blob,
+    prepare_base64_image,
+    prepare_upload_image,
+    release_review_images,
+)
+from src.models.reviews import (
+    build_device_query,
+    find_device_review_history,
+    find_latest_reviews,
+    get_checking_reviews_info,
+    get_review_sla_summary,
+)
+from src.models.status_counters import lock_device, set_device_result
+from src.models.uploads import (
+    append_upload_chunk,
+    assemble_upload,
+    complete_upload_session,
+    create_upload_session,
+    get_upload_session,
+)
 from src.schemas.devices import DeviceGetResponseSchema, DeviceSchema
 from src.schemas.response import ResponseHTTPSchema
 from src.schemas.reviews import (
     ConfirmReviewRequestSchema,
     ConfirmReviewResponseDataSchema,
     CreateReviewRequestSchema,
+    CreateUploadRequestSchema,
+    DeviceLatestReviewSchema,
     DeviceReviewAllowedEnums,
+    DeviceReviewHistoryCursorSchema,
     DeviceReviewHistorySchema,
     ReviewGetResponseSchema,
+    ReviewImageGetResponseSchema,
     ReviewListResponseSchema,
     ReviewListSchema,
     ReviewSchema,
+    ReviewSlaBucketSchema,
+    ReviewSlaCustomerSchema,
+    ReviewSlaFacilitySchema,
+    ReviewSlaGetResponseSchema,
+    UploadGetResponseSchema,
 )
+from src.services.archive_service import get_image_archive
+from src.services.review_image_service import read_multipart_image, read_raw_image
+from src.utils import to_list
 
 api = Blueprint("reviews", __name__, url_prefix="/reviews")
 
@@ -55,22 +102,20 @@ def get_device_latest_reviews():
             region
             prefecture
             municipality
+            fields: Sparse fieldset of the items (see src/libs/fields.py),
+                    `latest_review.image_blob` is returned only when requested
     Returns:
         List of devices and its latest reviews
     """
     # Customer ID is mandatory
     if not request.args.get("customer_id"):
-        _ec = ErrorCodes.VALUE_ERROR
-        _ec["message"] = "customer_id is required"
-        raise APIException(_ec)
+        raise APIException(with_message(ErrorCodes.VALUE_ERROR, "customer_id is required"))
 
     # Raise error if customer Id is not an integer
     try:
         customer_id = int(request.args.get("customer_id"))
     except ValueError as exc:
-        _ec = ErrorCodes.VALUE_ERROR
-        _ec["message"] = "customer_id should be an integer"
-        raise APIException(_ec) from exc
+        raise APIException(with_message(ErrorCodes.VALUE_ERROR, "customer_id should be an integer")) from exc
 
     # Return 404 if customer_id is not valid
     if customer_id <= 0:
@@ -79,28 +124,24 @@ def get_device_latest_reviews():
     check_resource_authorization(customer_id=customer_id)
 
     query = ReviewListSchema(**request.args)
+    fields = FieldSelection.from_request(DeviceLatestReviewSchema, blob_paths=["latest_review.image_blob"])
+    include_image = fields.wants("latest_review.image_blob")
 
     devices, count, result_count = build_device_query(connection=db, customer_id=customer_id, parameters=query)
+    latest_reviews = find_latest_reviews(db, [device.id for device in devices], include_image=include_image)
     data = []
-    reviews = []
     for device in devices:
-        temp = {}
-        device_reviews = db.review.find_many(
-            where={"device_id": device.id},
-            include={"facility": {"include": {"facility_type": True}}},
-            order={"created_at_utc": "desc"},
+        latest_review = latest_reviews.get(device.id)
+        item = DeviceLatestReviewSchema(
+            device=DeviceSchema(**device.model_dump()),
+            latest_review=ReviewSchema(**latest_review.model_dump()) if latest_review else {},
         )
-        latest_review = {}
-        temp["latest_review"] = {}
-        if len(device_reviews) > 0:
-            latest_review = device_reviews[0]
-            temp["latest_review"] = ReviewSchema(**latest_review.model_dump())
-            reviews.append(temp["latest_review"])
-        temp["device"] = DeviceSchema(**device.model_dump())
-        data.append(temp)
-
-    # Get current and late review count for all the latest reviews
-    reviewing_info = get_checking_reviews_info(data=reviews, late_minutes=query.late_minutes)
+        data.append(fields.dump(item))
+
+    # Get current and late review count of the customer
+    reviewing_info = get_checking_reviews_info(
+        connection=db, admin_id=current_user.id, customer_id=customer_id, late_minutes=query.late_minutes
+    )
 
     pagination_data = {
         "data": data,
@@ -115,6 +156,76 @@ def get_device_latest_reviews():
     return ReviewListResponseSchema(**pagination_data).make_response()
 
 
+@api.get("/sla")
+@login_required
+def get_review_sla():
+    """
+    Endpoint to get the pending and overdue review counts per customer and facility
+
+    Args:
+        QueryParams
+            customer_id: Customer ID. Omit to get all the customers of the admin
+            sla_minutes: Pending reviews older than this are overdue
+            buckets: Comma separated age bucket boundaries in minutes, e.g. 10,60,240
+    Returns:
+        Pending, overdue and age bucket counts per customer and facility
+    """
+    customer_id = None
+    try:
+        if request.args.get("customer_id"):
+            customer_id = int(request.args.get("customer_id"))
+        sla_minutes = int(request.args.get("sla_minutes", REVIEW_SLA_MINUTES))
+        bucket_minutes = [int(value) for value in to_list(request.args.get("buckets", REVIEW_SLA_BUCKET_MINUTES))]
+    except ValueError as _exec:
+        raise APIException(
+            with_message(ErrorCodes.VALUE_ERROR, "customer_id, sla_minutes and buckets should be integers")
+        ) from _exec
+
+    if sla_minutes <= 0 or not bucket_minutes or min(bucket_minutes) <= 0:
+        raise APIException(with_message(ErrorCodes.VALUE_ERROR, "sla_minutes and buckets should be positive"))
+
+    if customer_id is not None:
+        # Return 404 if customer_id is not valid
+        if customer_id <= 0:
+            raise APIException(ErrorCodes.CUSTOMER_NOT_FOUND)
+        check_resource_authorization(customer_id=customer_id)
+
+    rows = get_review_sla_summary(
+        connection=db,
+        admin_id=current_user.id,
+        customer_id=customer_id,
+        sla_minutes=sla_minutes,
+        bucket_minutes=bucket_minutes,
+    )
+
+    facilities = db.facility.find_many(where={"id": {"in": list({row["facility_id"] for row in rows})}})
+    facility_names = {facility.id: facility.facility_name for facility in facilities}
+
+    # Roll the facility counts up to their customer
+    customers = {}
+    for row in rows:
+        customer = customers.setdefault(
+            row["customer_id"],
+            ReviewSlaCustomerSchema(customer_id=row["customer_id"], ages=[0] * len(row["ages"])),
+        )
+        customer.pending += row["pending"]
+        customer.overdue += row["overdue"]
+        customer.ages = [total + count for total, count in zip(customer.ages, row["ages"])]
+        customer.facilities.append(ReviewSlaFacilitySchema(**row, facility_name=facility_names.get(row["facility_id"])))
+
+    boundaries = [0, *sorted(set(bucket_minutes))]
+    buckets = [
+        ReviewSlaBucketSchema(
+            min_minutes=boundary, max_minutes=boundaries[index + 1] if index + 1 < len(boundaries) else None
+        )
+        for index, boundary in enumerate(boundaries)
+    ]
+
+    return ReviewSlaGetResponseSchema(
+        sla_minutes=sla_minutes, buckets=buckets, customers=list(customers.values())
+    ).make_response()
+
+
 @api.get("/devices/<int:device_id>/history")
 @login_required
 def get_device_review_history(device_id: int):
@@ -123,6 +234,11 @@ def get_device_review_history(device_id: int):
 
     Args:
         device_id (int): ID of the device
+        QueryParams
+            page
+            page_size
+            fields: Sparse fieldset of the response (see src/libs/fields.py), `reviews.image_blob` and
+                    `device.device_type.sample_image_blob` are returned only when requested
     Returns:
         List of reviews for a device ID.
     """
@@ -133,8 +249,19 @@ def get_device_review_history(device_id: int):
 
     check_resource_authorization(device_id=device_id)
 
-    # Get device by ID
-    device = db.device.find_first(where={"id": device_id, "admin_id": current_user.id})
+    fields = _history_fields(DeviceReviewHistorySchema)
+    include_images = fields.wants("reviews.image_blob")
+    include_sample_image = fields.wants("device.device_type.sample_image_blob")
+
+    # Get device by ID along with its device type and facility
+    device_actions = db.device if include_sample_image else DeviceWithoutImage.prisma(db)
+    device = device_actions.find_first(
+        where={"id": device_id, "admin_id": current_user.id},
+        include={
+            "device_type": {"include": {"sample_image": True}} if include_sample_image else True,
+            "facility": {"include": {"facility_type": True}},
+        },
+    )
 
     # Check whether the device exists
     if not device:
@@ -156,13 +283,14 @@ def get_device_review_history(device_id: int):
             take = max(take, 0)
             skip = skip if take > 0 else None
     except ValueError as _exec:
-        _ec = ErrorCodes.VALUE_ERROR
-        _ec["message"] = "page and page_size should be a valid integer"
-        raise APIException(_ec) from _exec
+        raise APIException(
+            with_message(ErrorCodes.VALUE_ERROR, "page and page_size should be a valid integer")
+        ) from _exec
 
-    rows = db.review.find_many(
+    review_actions = db.review if include_images else ReviewWithoutImage.prisma(db)
+    rows = review_actions.find_many(
         where={"device_id": device_id},
-        include={"customer": {}, "facility": {"include": {"facility_type": True}}},
+        include={"image": include_images, "facility": {"include": {"facility_type": True}}},
         order={"created_at_utc": "desc"},
         take=take,
         skip=skip,
@@ -172,14 +300,10 @@ def get_device_review_history(device_id: int):
         model = ReviewGetResponseSchema(**row.model_dump())
         data.append(model)
 
-    # Get device details
-    device_details = db.device.find_first(where={"id": device_id}, include={"device_type": {}, "facility": {}})
-    device_model = DeviceGetResponseSchema(**device_details.model_dump())
+    device_data = device.model_dump()
+    add_reference_image_urls(db, [device_data["device_type"]])
+    device_model = DeviceGetResponseSchema(**device_data)
 
-    # Load device sample image
-    device_details = db.device.find_first(
-        where={"id": device_id}, include={"facility": {"include": {"customer": True}}}
-    )
     result_data = {
         "reviews": data,
         "device": device_model,
@@ -189,7 +313,125 @@ def get_device_review_history(device_id: int):
         "page_size": page_size,
     }
 
-    return DeviceReviewHistorySchema(**result_data).make_response()
+    return DeviceReviewHistorySchema(**result_data).make_response(fields)
+
+
+@api.get("/devices/<int:device_id>/history/cursor")
+@login_required
+def get_device_review_history_by_cursor(device_id: int):
+    """
+    Endpoint to get the device review history by device id using keyset pagination
+
+    Args:
+        device_id (int): ID of the device
+        QueryParams
+            cursor: `next_cursor` of the previous page. Omit to get the first page
+            limit: Maximum number of reviews in the page
+            fields: Sparse fieldset of the response (see src/libs/fields.py), `reviews.image_blob` and
+                    `device.device_type.sample_image_blob` are returned only when requested
+            include_images: `true` to add both images to the default fields
+    Returns:
+        List of reviews for a device ID and the cursor of the next page.
+    """
+
+    # Return 404 if device_id is not valid
+    if device_id <= 0:
+        raise APIException(ErrorCodes.DEVICE_NOT_FOUND)
+
+    check_resource_authorization(device_id=device_id)
+
+    fields = _history_fields(
+        DeviceReviewHistoryCursorSchema, with_images=request.args.get("include_images", "false").lower() == "true"
+    )
+    include_images = fields.wants("reviews.image_blob")
+    include_sample_image = fields.wants("device.device_type.sample_image_blob")
+
+    try:
+        limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError as _exec:
+        raise APIException(with_message(ErrorCodes.VALUE_ERROR, "limit should be a valid integer")) from _exec
+    limit = min(max(limit, 1), DEFAULT_PAGE_SIZE)
+
+    # Get device by ID along with its device type and facility
+    device_actions = db.device if include_sample_image else DeviceWithoutImage.prisma(db)
+    device = device_actions.find_first(
+        where={"id": device_id, "admin_id": current_user.id},
+        include={
+            "device_type": {"include": {"sample_image": True}} if include_sample_image else True,
+            "facility": {"include": {"facility_type": True}},
+        },
+    )
+
+    # Check whether the device exists
+    if not device:
+        raise APIException(ErrorCodes.DEVICE_NOT_FOUND)
+
+    try:
+        rows, next_cursor = find_device_review_history(
+            connection=db,
+            device_id=device_id,
+            limit=limit,
+            cursor=request.args.get("cursor"),
+            include_images=include_images,
+        )
+    except ValueError as _exec:
+        raise APIException(with_message(ErrorCodes.VALUE_ERROR, "cursor is invalid")) from _exec
+
+    device_data = device.model_dump()
+    add_reference_image_urls(db, [device_data["device_type"]])
+    result_data = {
+        "reviews": [ReviewSchema(**row.model_dump()) for row in rows],
+        "device": DeviceGetResponseSchema(**device_data),
+        "size": len(rows),
+        "page_size": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
+
+    return DeviceReviewHistoryCursorSchema(**result_data).make_response(fields)
+
+
+def _history_fields(schema, with_images: bool = False) -> FieldSelection:
+    """
+    Sparse fieldset of the review history responses, the pagination fields are always returned
+    """
+    blob_paths = ["reviews.image_blob", "device.device_type.sample_image_blob"]
+    return FieldSelection.from_request(
+        schema,
+        blob_paths=blob_paths,
+        default_blob_paths=blob_paths if with_images else [],
+        required_paths=[name for name in schema.model_fields if name not in ("reviews", "device")],
+    )
+
+
+@api.get("/<int:review_id>/image")
+@login_required
+def get_review_image(review_id: int):
+    """
+    Endpoint to get the image of a review by review_id
+
+    Args:
+        review_id (int): ID of the review
+    Returns:
+        Review ID and its image
+    """
+
+    # Return 404 if review_id is not valid
+    if review_id <= 0:
+        raise APIException(ErrorCodes.REVIEW_NOT_FOUND)
+
+    check_resource_authorization(review_id=review_id)
+
+    review = db.review.find_unique(where={"id": review_id}, include={"image": True})
+    if not review:
+        raise APIException(ErrorCodes.REVIEW_NOT_FOUND)
+
+    image_blob = get_image_blob(review.image, review.image_blob)
+    # Image moved to the archive by the retention policy of the customer
+    if review.archive_key:
+        image_blob = get_image_archive().get(review.archive_key)
+
+    return ReviewImageGetResponseSchema(id=review.id, image_blob=image_blob).make_response()
 
 
 @api.get("/<int:review_id>")
@@ -201,6 +443,9 @@ def get_review(review_id: int) -> ReviewGetResponseSchema:
 
     Args:
         review_id (int): ID of the review
+        QueryParams
+            fields: Sparse fieldset of the response (see src/libs/fields.py),
+                    `image_blob` and `device.device_type.sample_image_blob` are returned by default
     Returns:
         Review Details
     """
@@ -212,13 +457,20 @@ def get_review(review_id: int) -> ReviewGetResponseSchema:
     # Check resource authorization
     check_resource_authorization(review_id=review_id)
 
+    blob_paths = ["image_blob", "device.device_type.sample_image_blob"]
+    fields = FieldSelection.from_request(ReviewGetResponseSchema, blob_paths=blob_paths, default_blob_paths=blob_paths)
+    include_image = fields.wants("image_blob")
+    include_sample_image = fields.wants("device.device_type.sample_image_blob")
+
     # Include device and device type filter
-    review = db.review.find_unique(
+    review_actions = db.review if include_image else ReviewWithoutImage.prisma(db)
+    review = review_actions.find_unique(
         where={"id": review_id},
         include={
+            "image": include_image,
             "facility": {"include": {"facility_type": {}}},
             "device": {
-                "include": {"device_type": {}},
+                "include": {"device_type": {"include": {"sample_image": True}} if include_sample_image else True},
             },
             "customer": {},
         },
@@ -227,16 +479,19 @@ def get_review(review_id: int) -> ReviewGetResponseSchema:
     if not review:
         raise APIException(ErrorCodes.REVIEW_NOT_FOUND)
 
+    review_data = review.model_dump()
+    add_reference_image_urls(db, [review_data["device"]["device_type"]])
     try:
-        model = ReviewGetResponseSchema(**review.model_dump())
+        model = ReviewGetResponseSchema(**review_data)
     except Exception as _exec:
         raise APIException(ErrorCodes.SCHEMA_VALIDATION_FAILED) from _exec
 
-    return model
+    return fields.dump(model)
 
 
 @api.route("/<int:review_id>", methods=["PUT"])
 @login_required
+@idempotent
 @validate()
 def update_review_by_admin(review_id: int, body: ConfirmReviewRequestSchema):
     """
@@ -311,7 +566,7 @@ def update_review_by_admin(review_id: int, body: ConfirmReviewRequestSchema):
         #                             "status": body.result})
 
         # Update the device status as the review status
-        transaction.device.update(where={"id": review.device_id}, data={"result": body.result})
+        set_device_result(transaction, review.device_id, body.result)
 
     response_data = ConfirmReviewResponseDataSchema(result=body.result)
 
@@ -324,6 +579,7 @@ def update_review_by_admin(review_id: int, body: ConfirmReviewRequestSchema):
 # Commenting as facility token is validated in validate_auth_token
 # @facility_required
 @validate_auth_token
+@idempotent
 @validate()
 def create_review_by_contractor(body: CreateReviewRequestSchema, payload: dict):
     """
@@ -341,7 +597,31 @@ def create_review_by_contractor(body: CreateReviewRequestSchema, payload: dict):
     """
     # extract data from review body
     device_id = body.device_id
+    # A payload already stored (e.g. resubmitted after a rejection) is neither normalized nor stored again
+    get_image = (lambda: prepare_base64_image(db, body.image)) if body.image else None
 
+    return create_review(device_id, payload, get_image=get_image, capture_id=body.capture_id)
+
+
+def create_review(
+    device_id: int,
+    payload: dict,
+    get_image: Callable[[], PreparedImage] | None,
+    capture_id: str | None = None,
+):
+    """
+    Method to create the review of a device for the contractor
+
+    Args:
+        device_id:  (int) Device DB ID
+        payload:    (dict) contains facility_id and customer_id of the contractor token.
+        get_image:  (Callable) Prepares the image of the review (see src/models/images.py), called once the device
+                    is authorized, so unauthorized requests do not decode images
+        capture_id: (str) Capture ID of GET /facility/devices/<id>/images, used instead of image if not expired
+
+    Returns:
+        Response: HTTP response indicating success or failure.
+    """
     check_device_authorization(device_id, payload)
 
     device = db.device.find_first(where={"id": int(device_id)})
@@ -350,8 +630,6 @@ def create_review_by_contractor(body: CreateReviewRequestSchema, payload: dict):
     if not device:
         raise APIException(ErrorCodes.DEVICE_NOT_FOUND)
 
-    image = body.image
-
     # Get the facility ID
     facility_id = payload.get("facility_id")
 
@@ -397,6 +675,8 @@ def create_review_by_contractor(body: CreateReviewRequestSchema, payload: dict):
     if latest_device_review and latest_device_review.result == DeviceReviewAllowedEnums.APPROVED.value:
         raise APIException(ErrorCodes.REVIEW_CREATION_ERROR)
 
+    image = get_image() if get_image else None
+
     # Create DB transaction to add review in the DB
     try:
         # max_wait and timeout is added overriding the default, because, in case of Azure SQL DB
@@ -406,21 +686,46 @@ def create_review_by_contractor(body: CreateReviewRequestSchema, payload: dict):
             max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
             timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
         ) as transaction:
+            # Requests for the same device wait for each other from here, the check above is repeated
+            # on the committed reviews, with or without Idempotency-Key
+            lock_device(transaction, int(device_id))
+            existing_review = transaction.review.find_first(
+                where={
+                    "device_id": int(device_id),
+                    "facility_id": int(facility_id),
+                    "customer_id": customer.id,
+                    "result": DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value,
+                }
+            )
+            if existing_review:
+                return ResponseHTTPSchema(
+                    status_code=200, message="Review already exists", data={"review_id": existing_review.id}
+                ).make_response()
+
+            if capture_id:
+                # Use the image kept at capture time, the uploaded image is the fallback
+                captured_image = take_capture(transaction, capture_id, int(device_id), int(facility_id))
+                if captured_image:
+                    image = PreparedImage.from_data_url(captured_image)
+
+            if not image:
+                raise APIException(ErrorCodes.CAPTURE_NOT_FOUND)
+
             # Create a new review record
             data = {
                 "customer_id": facility.customer_id,
                 "facility_id": facility_id,
                 "device_id": device_id,
                 "result": DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW,
-                "image_blob": image,
+                "image_id": acquire_image(transaction, image),
             }
             review = transaction.review.create(data=data)
 
             # Update the device status as the review status
-            transaction.device.update(
-                where={"id": review.device_id}, data={"result": DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW}
-            )
+            set_device_result(transaction, review.device_id, DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW)
 
+    except APIException as _api_exec:
+        raise _api_exec
     except Exception as _exec:
         raise APIException(ErrorCodes.REVIEW_CREATION_FAILED) from _exec
     # Return success response
@@ -429,6 +734,180 @@ def create_review_by_contractor(body: CreateReviewRequestSchema, payload: dict):
     ).make_response()
 
 
+@api.post("/upload")
+@validate_auth_token
+def upload_review_by_contractor(payload: dict):
+    """
+    Endpoint to create the review with a streamed image upload.
+
+    The body is either the raw image (Content-Type: image/jpeg or image/png)
+    or multipart/form-data with the image in the `image` file part.
+
+    Args:
+        QueryParams
+            device_id: Device DB ID (can also be sent as a multipart form field)
+        payload:    (dict) contains facility_id and customer_id.
+                    payload is returned as kwargs by`validate_auth_token` decorator.
+
+    Returns:
+        Response: HTTP response indicating success or failure.
+    """
+    device_id = request.args.get("device_id")
+    # Check the device before reading the body
+    if device_id:
+        device_id = _parse_device_id(device_id)
+        check_device_authorization(device_id, payload)
+
+    if request.mimetype == "multipart/form-data":
+        buffer, fields = read_multipart_image(
+            request.stream, request.mimetype_params.get("boundary"), request.content_length
+        )
+    else:
+        buffer, fields = read_raw_image(request.stream, request.content_length), {}
+
+    with buffer:
+        if not device_id:
+            device_id = _parse_device_id(fields.get("device_id"))
+
+        return create_review(device_id, payload, get_image=lambda: prepare_upload_image(db, buffer))
+
+
+def _parse_device_id(device_id: str | None) -> int:
+    try:
+        device_id = int(device_id)
+    except (TypeError, ValueError) as _exec:
+        raise APIException(ErrorCodes.INVALID_DEVICE_ID) from _exec
+
+    if device_id <= 0:
+        raise APIException(ErrorCodes.INVALID_DEVICE_ID)
+    return device_id
+
+
+@api.post("/uploads")
+@validate_auth_token
+@validate()
+def create_upload_by_contractor(body: CreateUploadRequestSchema, payload: dict):
+    """
+    Endpoint to start a resumable image upload.
+    Send the image with PUT /reviews/uploads/<upload_id>?offset=<n> in chunks of at most `chunk_size` bytes,
+    then create the review with POST /reviews/uploads/<upload_id>/complete.
+
+    Args:
+        body:       (CreateUploadRequestSchema) device_id and total_bytes of the image
+        payload:    (dict) contains facility_id and customer_id.
+                    payload is returned as kwargs by`validate_auth_token` decorator.
+
+    Returns:
+        UploadGetResponseSchema: Upload ID and progress
+    """
+    check_device_authorization(body.device_id, payload)
+
+    session = create_upload_session(db, body.device_id, int(payload.get("facility_id")), body.total_bytes)
+
+    return _upload_response(session).make_response(status_code=201)
+
+
+@api.get("/uploads/<string:upload_id>")
+@validate_auth_token
+def get_upload_by_contractor(upload_id: str, payload: dict):
+    """
+    Endpoint to get the progress of a resumable upload, the next chunk is sent at `received_bytes`
+
+    Args:
+        upload_id:  (str) Upload ID
+        payload:    (dict) contains facility_id and customer_id.
+                    payload is returned as kwargs by`validate_auth_token` decorator.
+
+    Returns:
+        UploadGetResponseSchema: Upload ID and progress
+    """
+    session = get_upload_session(db, upload_id, int(payload.get("facility_id")))
+
+    return _upload_response(session).make_response()
+
+
+@api.put("/uploads/<string:upload_id>")
+@validate_auth_token
+def put_upload_chunk_by_contractor(upload_id: str, payload: dict):
+    """
+    Endpoint to append a chunk (raw request body) to a resumable upload
+
+    Args:
+        upload_id:  (str) Upload ID
+        QueryParams
+            offset: Offset of the chunk in the image, must be equal to `received_bytes`
+        payload:    (dict) contains facility_id and customer_id.
+                    payload is returned as kwargs by`validate_auth_token` decorator.
+
+    Returns:
+        UploadGetResponseSchema: Upload ID and progress
+    """
+    session = get_upload_session(db, upload_id, int(payload.get("facility_id")))
+
+    try:
+        offset = int(request.args.get("offset", ""))
+    except ValueError as _exec:
+        raise APIException(with_message(ErrorCodes.VALUE_ERROR, "offset should be a valid integer")) from _exec
+
+    if request.content_length is not None and request.content_length > UPLOAD_CHUNK_MAX_BYTES:
+        raise APIException(ErrorCodes.IMAGE_TOO_LARGE)
+
+    # Read one byte more than allowed to detect chunked bodies over the limit
+    data = request.stream.read(UPLOAD_CHUNK_MAX_BYTES + 1)
+    if len(data) > UPLOAD_CHUNK_MAX_BYTES:
+        raise APIException(ErrorCodes.IMAGE_TOO_LARGE)
+    if not data:
+        raise APIException(ErrorCodes.INVALID_INPUT)
+
+    session.received_bytes = append_upload_chunk(db, session, offset, data)
+
+    return _upload_response(session).make_response()
+
+
+@api.post("/uploads/<string:upload_id>/complete")
+@validate_auth_token
+def complete_upload_by_contractor(upload_id: str, payload: dict):
+    """
+    Endpoint to create the review from a complete resumable upload.
+    A repeated request returns the review created by the first one while the session is not expired.
+
+    Args:
+        upload_id:  (str) Upload ID
+        payload:    (dict) contains facility_id and customer_id.
+                    payload is returned as kwargs by`validate_auth_token` decorator.
+
+    Returns:
+        Response: HTTP response indicating success or failure.
+    """
+    session = get_upload_session(db, upload_id, int(payload.get("facility_id")))
+
+    # Repeated request of a completed upload (e.g. the response was lost), return the created review
+    if session.review_id is not None:
+        return ResponseHTTPSchema(
+            status_code=200, message="Review already exists", data={"review_id": session.review_id}
+        ).make_response()
+
+    with assemble_upload(db, session) as buffer:
+        response = create_review(session.device_id, payload, get_image=lambda: prepare_upload_image(db, buffer))
+
+    body, _ = response
+    complete_upload_session(db, session, body["data"]["review_id"])
+
+    return response
+
+
+def _upload_response(session) -> UploadGetResponseSchema:
+    return UploadGetResponseSchema(
+        upload_id=session.upload_uuid,
+        device_id=session.device_id,
+        total_bytes=session.total_bytes,
+        received_bytes=session.received_bytes,
+        chunk_size=UPLOAD_CHUNK_MAX_BYTES,
+        expires_at_utc=session.expires_at_utc,
+        review_id=session.review_id,
+    )
+
+
 @api.delete("/devices/<int:device_id>")
 @login_required
 @validate()
@@ -446,43 +925,27 @@ def delete_reviews_by_device(device_id: int) -> ResponseHTTPSchema:
     """
     # Validate device_id
     if device_id <= 0:
-        _ec = ErrorCodes.VALUE_ERROR.copy()
-        _ec["message"] = "Valid device_id is required"
-        raise APIException(_ec)
+        raise APIException(with_message(ErrorCodes.VALUE_ERROR, "Valid device_id is required"))
 
     # Authorization check for the device
     check_resource_authorization(device_id=device_id)
 
-    # Find all reviews for the device
-    reviews = db.review.find_many(where={"device_id": device_id})
-
-    # Check if reviews exist for the device
-    if not reviews:
-        raise APIException(ErrorCodes.REVIEW_NOT_FOUND)
-
-    failed_to_delete_reviews = []
-    # Iterate through the reviews and delete them
-    for review in reviews:
-        try:
-            db.review.delete(where={"id": review.id})
-        except Exception:
-            failed_to_delete_reviews.append(review.id)
-
-    if failed_to_delete_reviews:
-        # If any review deletion fails, add the failed review IDs to the error message
-        error_message = f"Failed to delete reviews with IDs: {', '.join(map(str, failed_to_delete_reviews))}"
-        _ec = ErrorCodes.REVIEW_DELETE_FAILED.copy()
-        _ec["message"] = error_message
-        raise APIException(_ec)
-
-    update_data = {
-        "result": DeviceReviewAllowedEnums.INITIAL_STATE,
-    }
-    update_result = db.device.update(where={"id": device_id}, data=update_data)
-
-    if not update_result:
-        _ec = ErrorCodes.REVIEW_DELETE_FAILED.copy()
-        _ec["message"] = "Failed to update device status after deleting reviews"
-        raise APIException(_ec)
+    with db.tx(
+        max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+        timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+    ) as transaction:
+        # The device row is locked first, like review creation, then the images are released with the reviews
+        lock_device(transaction, device_id)
+        release_review_images(transaction, {"device_id": device_id})
+        deleted_review_count = transaction.review.delete_many(where={"device_id": device_id})
+
+        # Check if reviews exist for the device
+        if not deleted_review_count:
+            raise APIException(ErrorCodes.REVIEW_NOT_FOUND)
+
+        if not set_device_result(transaction, device_id, DeviceReviewAllowedEnums.INITIAL_STATE):
+            raise APIException(
+                with_message(ErrorCodes.REVIEW_DELETE_FAILED, "Failed to update device status after deleting reviews")
+            )
 
     return ResponseHTTPSchema(message="All reviews for the device deleted successfully").make_response()
@@ -24,7 +24,7 @@ from .api import register_apis
 from .config import validate_missing_environments
 from .core import db
 from .exceptions import handle_api_exception, register_exceptions
-from .libs import auth, cors
+from .libs import auth, compression, cors, json_provider, memory_tracking, metrics, profiling, query_accounting, tracing
 from .logger import get_json_logger
 from flask import request
 from .exceptions import APIException, ErrorCodes
@@ -46,7 +46,8 @@ def create_app():
         Returns:
             None
         """
-        g.trace_id = uuid.uuid4().hex
+        # Trace ID of the request span when tracing is enabled
+        g.trace_id = tracing.get_trace_id() or uuid.uuid4().hex
 
     @app.before_request
     def ignore_robots_txt():
@@ -66,6 +67,21 @@ def create_app():
             logger.info(f"Ignoring {path} URL")
             raise APIException(ErrorCodes.URL_NOT_FOUND)
 
+    # Prometheus metrics (GET /metrics), first so the request duration includes the other hooks
+    metrics.init_app(app)
+    # Query count / DB time of each request in its log line
+    query_accounting.init_app(app)
+    # OpenTelemetry spans of the requests, queries and AITRIOS calls (TRACING_EXPORTER)
+    tracing.init_app(app)
+    # Sampling profiler of the requests (X-Profile header of an admin, PROFILING_SAMPLE_RATE)
+    profiling.init_app(app)
+    # Memory peak of each request (MEMORY_TRACKING)
+    memory_tracking.init_app(app)
+
+    # JSON serialization with orjson and gzip / brotli compression of the responses
+    json_provider.init_app(app)
+    compression.init_app(app)
+
     # 3rd-party modules
     logger.info("Cors init is started")
     cors.init_app(app)
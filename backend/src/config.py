@@ -21,6 +21,51 @@ APP_SECRET_KEY = os.getenv("APP_SECRET_KEY", None)
 CONTRACTOR_APP_URL = os.getenv("CONTRACTOR_APP_URL", None)
 DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", 100))
 DEFAULT_JWT_EXPIRED_MINUTES = int(os.getenv("DEFAULT_JWT_EXPIRED_MINUTES", 1440))
+APP_ENV = os.getenv("APP_ENV", None)
+# Facility filter backend: "like" (substring, pg_trgm indexed on Postgres) or "fulltext" (opt-in, SQL Server only,
+# matches word prefixes instead of substrings)
+FACILITY_SEARCH_BACKEND = os.getenv("FACILITY_SEARCH_BACKEND", "like")
+# Pending reviews older than REVIEW_SLA_MINUTES are overdue, ages are bucketed by REVIEW_SLA_BUCKET_MINUTES
+REVIEW_SLA_MINUTES = int(os.getenv("REVIEW_SLA_MINUTES", 60))
+REVIEW_SLA_BUCKET_MINUTES = os.getenv("REVIEW_SLA_BUCKET_MINUTES", "10,60,240,1440")
+# Lifetime of the camera images kept server side for review creation
+CAPTURE_TTL_SECONDS = int(os.getenv("CAPTURE_TTL_SECONDS", 600))
+# Streaming image upload: size cap, read chunk size and in-memory size before spilling to a temporary file
+MAX_IMAGE_UPLOAD_BYTES = int(os.getenv("MAX_IMAGE_UPLOAD_BYTES", 10 * 1024 * 1024))
+IMAGE_UPLOAD_CHUNK_BYTES = 64 * 1024
+IMAGE_UPLOAD_SPOOL_BYTES = 1024 * 1024
+# Stored images are downscaled to IMAGE_MAX_DIMENSION pixels and re-encoded as IMAGE_FORMAT (WEBP / JPEG)
+IMAGE_MAX_DIMENSION = int(os.getenv("IMAGE_MAX_DIMENSION", 2048))
+IMAGE_FORMAT = os.getenv("IMAGE_FORMAT", "WEBP").upper()
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", 85))
+# Resumable upload: lifetime of the partial data and maximum chunk size
+UPLOAD_SESSION_TTL_SECONDS = int(os.getenv("UPLOAD_SESSION_TTL_SECONDS", 3600))
+UPLOAD_CHUNK_MAX_BYTES = int(os.getenv("UPLOAD_CHUNK_MAX_BYTES", 1024 * 1024))
+# Idempotency-Key: lifetime of the stored responses and time after which an unfinished request can be retried
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", 24 * 3600))
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", 120))
+# Directory of the review images archived by the retention policies (scripts/apply_retention.py)
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "archive")
+# Response compression: minimum body size and gzip level / brotli quality
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", 1024))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 5))
+# Lifetime of the reference images served from their content hashed URL (immutable, 1 year)
+REFERENCE_IMAGE_MAX_AGE_SECONDS = int(os.getenv("REFERENCE_IMAGE_MAX_AGE_SECONDS", 365 * 24 * 3600))
+# Queries of the same shape run this many times by one request are logged as repeated (query in a loop)
+DB_REPEATED_QUERY_THRESHOLD = int(os.getenv("DB_REPEATED_QUERY_THRESHOLD", 5))
+# OpenTelemetry span exporter: empty (disabled), `file` (JSON lines in TRACING_FILE) or `otlp`
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "").lower()
+TRACING_FILE = os.getenv("TRACING_FILE", "traces.jsonl")
+# Request profiling: share of the requests profiled at random (0 to 1), sampling interval and profile directory
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", 0))
+PROFILING_INTERVAL_MS = int(os.getenv("PROFILING_INTERVAL_MS", 5))
+PROFILING_DIR = os.getenv("PROFILING_DIR", "profiles")
+# Per request memory tracking (tracemalloc): frames kept per allocation and budget above which
+# the top allocation sites are logged (MB, 0 to disable)
+MEMORY_TRACKING = os.getenv("MEMORY_TRACKING", "false").lower() == "true"
+MEMORY_TRACKING_FRAMES = int(os.getenv("MEMORY_TRACKING_FRAMES", 1))
+MEMORY_BUDGET_MB = int(os.getenv("MEMORY_BUDGET_MB", 0))
 SSL_VERIFICATION = True
 HTTP_TIMEOUT = 20
 
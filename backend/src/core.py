@@ -15,11 +15,11 @@
 # ------------------------------------------------------------------------
 
 import base64
-from prisma import Prisma
-
 from src.config import APP_SECRET_KEY
+from src.libs.prisma_instrumentation import InstrumentedPrisma
 from cryptography.fernet import Fernet
-db = Prisma()
+# Queries reported to the metrics / per request accounting, see src/libs/prisma_instrumentation.py
+db = InstrumentedPrisma()
 
 # Create fernet encryption/decryption instance
 key = bytes(APP_SECRET_KEY, encoding="utf-8")
@@ -14,6 +14,9 @@
 # limitations under the License.
 # ------------------------------------------------------------------------
 
+from types import MappingProxyType
+from typing import Mapping
+
 from flask import Flask
 from pydantic import ValidationError
 from src.logger import get_json_logger
@@ -114,6 +117,30 @@ def handle_api_exception(app):
         return response.make_response()
 
 
+def _freeze_error_codes(cls):
+    """
+    Error codes are shared by all the requests (threads of a gthread worker), they are read-only.
+    Use `with_message` to raise one with another message.
+    """
+    for name, value in list(vars(cls).items()):
+        if isinstance(value, dict):
+            setattr(cls, name, MappingProxyType(value))
+    return cls
+
+
+def with_message(error_code: Mapping, message: str) -> dict:
+    """
+    Method to get a copy of an error code with another message
+    Args:
+        error_code (Mapping): ErrorCodes attribute
+        message (str): Message of the error
+    Returns:
+        dict: Error code for APIException
+    """
+    return {**error_code, "message": message}
+
+
+@_freeze_error_codes
 class ErrorCodes:
 
     # 400 Client Errors
@@ -185,6 +212,21 @@ class ErrorCodes:
         "error_code": 40016,
         "message": "Admin with this login_id already exists.",
     }
+    INVALID_IMAGE_FORMAT = {
+        "http_status": 400,
+        "error_code": 40017,
+        "message": "Invalid image, only JPEG, PNG and WEBP images are supported",
+    }
+    UPLOAD_INCOMPLETE = {
+        "http_status": 400,
+        "error_code": 40018,
+        "message": "Upload is not complete",
+    }
+    IDEMPOTENCY_KEY_REUSED = {
+        "http_status": 400,
+        "error_code": 40019,
+        "message": "Idempotency-Key was already used for a different request",
+    }
 
     # 401 Authorization Errors
     INVALID_AUTH_HEADER = {
@@ -291,10 +333,28 @@ class ErrorCodes:
     DEVICE_TYPE_NOT_FOUND = {"http_status": 404, "error_code": 40411, "message": "Device type not found"}
     FACILITY_TYPE_NOT_FOUND = {"http_status": 404, "error_code": 40412, "message": "Facility type not found"}
     ADMIN_NOT_FOUND = {"http_status": 404, "error_code": 40413, "message": "Admin not found"}
+    CAPTURE_NOT_FOUND = {"http_status": 404, "error_code": 40414, "message": "Capture not found or expired"}
+    UPLOAD_NOT_FOUND = {"http_status": 404, "error_code": 40415, "message": "Upload not found or expired"}
+    IMAGE_NOT_FOUND = {"http_status": 404, "error_code": 40416, "message": "Image not found"}
 
     # 405 Method not allowed
     METHOD_NOT_ALLOWED = {"http_status": 405, "error_code": 40501, "message": "Method not allowed"}
 
+    # 409 Conflict
+    UPLOAD_OFFSET_MISMATCH = {
+        "http_status": 409,
+        "error_code": 40901,
+        "message": "Chunk offset does not match the received size of the upload",
+    }
+    IDEMPOTENCY_REQUEST_IN_PROGRESS = {
+        "http_status": 409,
+        "error_code": 40902,
+        "message": "A request with the same Idempotency-Key is in progress",
+    }
+
+    # 413 Payload Too Large
+    IMAGE_TOO_LARGE = {"http_status": 413, "error_code": 41301, "message": "Image exceeds the maximum upload size"}
+
     # 500 Server Errors
     CAMERA_ISSUE = {
         "http_status": 500,
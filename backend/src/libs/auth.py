@@ -22,6 +22,7 @@ from flask import Flask, g, request
 from flask.sessions import SecureCookieSessionInterface
 from flask_login import LoginManager, current_user
 from jwt import InvalidTokenError
+from prisma.partials import ReviewWithoutImage
 from src.core import db
 from src.logger import get_json_logger
 from src.schemas import ResponseHTTPSchema
@@ -256,7 +257,8 @@ def check_resource_authorization(
                 if record.customer.id != customer_id:
                     raise APIException(ErrorCodes.PERMISSION_DENIED)
         if review_id:
-            record = db.review.find_first(where={"id": review_id}, include={"customer": {}})
+            # Without the legacy image column, the image is loaded by the endpoint only
+            record = ReviewWithoutImage.prisma(db).find_first(where={"id": review_id}, include={"customer": {}})
             # Check if record exists
             if not record:
                 raise APIException(ErrorCodes.REVIEW_NOT_FOUND)
@@ -0,0 +1,97 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/compression.py
+Description: gzip / brotli compression of the responses.
+
+The encoding is negotiated with Accept-Encoding, brotli is preferred over gzip at the same quality value.
+Bodies smaller than COMPRESSION_MIN_BYTES, streamed responses and images (already compressed) are sent as is.
+"""
+
+import gzip
+
+import brotli
+from flask import Flask, Response, request
+from src.config import COMPRESSION_BROTLI_QUALITY, COMPRESSION_GZIP_LEVEL, COMPRESSION_MIN_BYTES
+
+COMPRESSIBLE_MIMETYPES = frozenset({"application/json", "text/html", "text/plain", "text/csv", "image/svg+xml"})
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Method to compress a response body
+    Args:
+        data (bytes): Response body
+        encoding (str): `br` or `gzip`
+    Returns:
+        bytes
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=COMPRESSION_GZIP_LEVEL)
+
+
+def select_encoding(accept_encodings) -> str | None:
+    """
+    Method to select the content encoding accepted by the client
+    Args:
+        accept_encodings (Accept): request.accept_encodings
+    Returns:
+        str: `br`, `gzip` or None
+    """
+    candidates = ["br", "gzip"]
+    qualities = {encoding: accept_encodings[encoding] for encoding in candidates}
+    encoding = max(candidates, key=lambda name: qualities[name])
+    return encoding if qualities[encoding] > 0 else None
+
+
+def compress_response(response: Response) -> Response:
+    """
+    After request method compressing the response body
+    Args:
+        response (Response)
+    Returns:
+        Response
+    """
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = select_encoding(request.accept_encodings)
+    if not encoding or (response.content_length or 0) < COMPRESSION_MIN_BYTES:
+        return response
+
+    response.set_data(compress(response.get_data(), encoding))
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def init_app(app: Flask):
+    """
+    Initializes the response compression of the Flask application.
+
+    Args:
+        app (Flask): The Flask application instance to initialize.
+    """
+    app.after_request(compress_response)
@@ -0,0 +1,78 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/etag.py
+Description: Conditional GET (ETag / If-None-Match) of the admin master data endpoints.
+
+The ETag is derived from the change counters of the tables the response is read from (src/models/change_counters.py)
+and from the requested URL, so it is known before running the query: a request whose If-None-Match matches
+gets a 304 after a single counter lookup. The ETag is weak, the body bytes depend on the content encoding.
+"""
+
+import hashlib
+import hmac
+from functools import wraps
+
+from flask import make_response, request
+from flask_login import current_user
+from src.config import APP_SECRET_KEY
+from src.core import db
+from src.models.change_counters import get_change_versions
+
+
+def compute_etag(table_names) -> str:
+    """
+    Method to compute the ETag of the current request
+    Args:
+        table_names (list): Master data tables the response is read from
+    Returns:
+        str: ETag value (unquoted)
+    """
+    versions = get_change_versions(db, table_names, current_user.id)
+    source = "|".join([str(current_user.id), request.full_path] + [f"{name}={versions[name]}" for name in table_names])
+    # Keyed with the app secret, so a client cannot build the ETag of a response it never received
+    return hmac.new(APP_SECRET_KEY.encode("utf-8"), source.encode("utf-8"), hashlib.sha256).hexdigest()[:32]
+
+
+def conditional_get(*table_names: str):
+    """
+    Decorator of the GET endpoints answering 304 Not Modified while the tables are unchanged.
+    Apply after login_required.
+    Args:
+        table_names (str): Master data tables the response is read from
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = compute_etag(table_names)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            # Cached by the browser only, and revalidated on every use
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,159 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/fields.py
+Description: Sparse fieldsets, the `fields` query parameter of the read endpoints.
+
+`fields` is a comma separated list of field paths of the response item, nested fields are
+separated by dots (e.g. `fields=id,result,device.device_type.sample_image_blob`).
+`*` selects the default fields of the endpoint, so `fields=*,image_blob` adds the image to them.
+Without `fields`, the defaults apply: every field (or the endpoint default fields) except the blobs.
+Blob fields are returned only when named, selecting their parent field is not enough.
+
+The endpoints read the blob columns only when `FieldSelection.wants` the blob path, using the
+partial types of prisma/partial_types.py otherwise, and dump the response items with `FieldSelection.dump`.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Type, get_args, get_origin
+
+from flask import request
+from pydantic import BaseModel
+from src.exceptions import APIException, ErrorCodes, with_message
+
+FIELDS_PARAM = "fields"
+DEFAULT_FIELDS = "*"
+
+
+def _nested_model(annotation) -> Type[BaseModel] | None:
+    """
+    Pydantic model of a field annotation, unwrapping Optional / Union / List
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model:
+            return model
+    return None
+
+
+def _is_valid_path(model: Type[BaseModel], path: str) -> bool:
+    for name in path.split("."):
+        if model is None or name not in model.model_fields:
+            return False
+        model = _nested_model(model.model_fields[name].annotation)
+    return True
+
+
+def _is_list(annotation) -> bool:
+    return get_origin(annotation) in (list, List) or any(_is_list(arg) for arg in get_args(annotation))
+
+
+def _to_tree(model: Type[BaseModel], paths: Iterable[str]) -> Dict:
+    """
+    Field paths as pydantic include / exclude argument: {"a": True, "b": {"c": True}, "items": {"__all__": ...}}
+    """
+    tree = {}
+    for path in sorted(paths, key=lambda path: path.count(".")):
+        node, node_model = tree, model
+        *parents, name = path.split(".")
+        for parent in parents:
+            if node.get(parent) is True:
+                break
+            annotation = node_model.model_fields[parent].annotation
+            node = node.setdefault(parent, {})
+            # Applies to every element of the list fields
+            if _is_list(annotation):
+                node = node.setdefault("__all__", {})
+            node_model = _nested_model(annotation)
+        else:
+            node[name] = True
+    return tree
+
+
+class FieldSelection:
+    """
+    Fields selected for the response items of a read endpoint
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        fields: str | None,
+        blob_paths: Iterable[str],
+        default_paths: Iterable[str] | None = None,
+        default_blob_paths: Iterable[str] = (),
+        required_paths: Iterable[str] = (),
+    ):
+        """
+        Args:
+            model (BaseModel): Schema of the response item, used to validate the paths
+            fields (str): `fields` query parameter
+            blob_paths (list): Paths of the blob fields of the item
+            default_paths (list): Fields selected by default, None for every field
+            default_blob_paths (list): Blob fields selected by default
+            required_paths (list): Fields always returned (e.g. pagination of the response)
+        Raises:
+            APIException: VALUE_ERROR for unknown field paths
+        """
+        self.model = model
+        self.blob_paths: FrozenSet[str] = frozenset(blob_paths)
+
+        requested = {path.strip() for path in (fields or DEFAULT_FIELDS).split(",") if path.strip()}
+        invalid = sorted(path for path in requested if path != DEFAULT_FIELDS and not _is_valid_path(model, path))
+        if invalid:
+            raise APIException(with_message(ErrorCodes.VALUE_ERROR, f"Unknown fields: {', '.join(invalid)}"))
+
+        use_defaults = DEFAULT_FIELDS in requested
+        requested.discard(DEFAULT_FIELDS)
+        # Blobs are selected by naming them, a parent field does not select them
+        self.selected_blobs: FrozenSet[str] = self.blob_paths & (
+            requested | set(default_blob_paths) if use_defaults else requested
+        )
+
+        self.paths: FrozenSet[str] | None = None
+        if not use_defaults:
+            self.paths = frozenset(requested) | frozenset(required_paths)
+        elif default_paths is not None:
+            self.paths = frozenset(default_paths) | requested | self.selected_blobs | frozenset(required_paths)
+
+    @classmethod
+    def from_request(cls, model: Type[BaseModel], blob_paths: Iterable[str], **defaults) -> "FieldSelection":
+        """
+        Method to get the field selection of the current request, see __init__ for the arguments
+        """
+        return cls(model, request.args.get(FIELDS_PARAM), blob_paths, **defaults)
+
+    def wants(self, path: str) -> bool:
+        """
+        Method to check whether a blob field is selected, i.e. whether its column has to be read
+        Args:
+            path (str): Path of the blob field
+        """
+        return path in self.selected_blobs
+
+    def dump(self, item: BaseModel) -> Dict:
+        """
+        Method to dump a response item with the selected fields only
+        Args:
+            item (BaseModel): Response item, instance of the model of the selection
+        Returns:
+            dict
+        """
+        include = _to_tree(self.model, self.paths) if self.paths is not None else None
+        exclude = _to_tree(self.model, self.blob_paths - self.selected_blobs) or None
+        return item.model_dump(include=include, exclude=exclude)
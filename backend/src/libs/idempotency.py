@@ -0,0 +1,166 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/idempotency.py
+Description: Idempotency-Key support for the write endpoints.
+
+The first request with a key inserts an `idempotency_record` row before doing any work. The unique
+(scope, idempotency_key) constraint makes the check and the insert a single atomic step, so
+concurrent retries cannot both run. The response is stored on the row and replayed to the
+repeated requests until the row expires.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from functools import wraps
+
+from flask import request
+from flask_login import current_user
+from prisma.errors import UniqueViolationError
+from src.config import IDEMPOTENCY_KEY_TTL_SECONDS, IDEMPOTENCY_LOCK_SECONDS
+from src.core import db
+from src.exceptions import APIException, ErrorCodes
+from src.logger import get_json_logger
+
+logger = get_json_logger()
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+def _get_scope(kwargs: dict) -> str:
+    """
+    Keys are unique per client: the contractor token facility or the logged in admin
+    """
+    payload = kwargs.get("payload")
+    if payload:
+        return f"facility:{payload.get('facility_id')}"
+
+    return f"admin:{current_user.id}"
+
+
+def _get_request_hash() -> str:
+    """
+    Hash of the method, path and body, to detect a key reused for another request
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {request.path}\n".encode("utf-8"))
+    # The body is cached, so the JSON validation after this decorator does not read it again
+    digest.update(request.get_data(cache=True))
+    return digest.hexdigest()
+
+
+def _acquire(scope: str, key: str, request_hash: str):
+    """
+    Method to insert the record of a new key, or get the stored record of a repeated request
+    Returns:
+        (record, is_new)
+    Raises:
+        APIException: IDEMPOTENCY_KEY_REUSED or IDEMPOTENCY_REQUEST_IN_PROGRESS
+    """
+    now = datetime.utcnow()
+    db.idempotency_record.delete_many(where={"expires_at_utc": {"lt": now}})
+
+    try:
+        record = db.idempotency_record.create(
+            data={
+                "scope": scope,
+                "idempotency_key": key,
+                "request_hash": request_hash,
+                "expires_at_utc": now + timedelta(seconds=IDEMPOTENCY_KEY_TTL_SECONDS),
+            }
+        )
+        return record, True
+    except UniqueViolationError:
+        pass
+
+    record = db.idempotency_record.find_unique(
+        where={"scope_idempotency_key": {"scope": scope, "idempotency_key": key}}
+    )
+    if not record:
+        # Released by a failed request in the meantime
+        raise APIException(ErrorCodes.IDEMPOTENCY_REQUEST_IN_PROGRESS)
+
+    if record.request_hash != request_hash:
+        raise APIException(ErrorCodes.IDEMPOTENCY_KEY_REUSED)
+
+    if record.status_code is not None:
+        return record, False
+
+    # Take over the record of a request that never finished (worker killed), only one retry wins
+    taken = db.idempotency_record.update_many(
+        where={
+            "id": record.id,
+            "status_code": None,
+            "created_at_utc": {"lt": now - timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS)},
+        },
+        data={"created_at_utc": now},
+    )
+    if not taken:
+        raise APIException(ErrorCodes.IDEMPOTENCY_REQUEST_IN_PROGRESS)
+
+    return record, True
+
+
+def idempotent(f):
+    """
+    Decorator to replay the stored response of requests sent again with the same Idempotency-Key header.
+    Requests without the header are not affected.
+    Place it after the authentication decorators and before `@validate()`, so repeated requests
+    skip the body validation.
+    Args:
+        f: The function to be decorated
+    Raises:
+        APIException: INVALID_INPUT, IDEMPOTENCY_KEY_REUSED or IDEMPOTENCY_REQUEST_IN_PROGRESS
+    Returns:
+        func: Decorated function
+    """
+
+    @wraps(f)
+    def idempotent_decorator_function(*args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if key is None:
+            return f(*args, **kwargs)
+
+        if not key or len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            raise APIException(ErrorCodes.INVALID_INPUT)
+
+        record, is_new = _acquire(_get_scope(kwargs), key, _get_request_hash())
+        if not is_new:
+            logger.info(f"Replaying response of Idempotency-Key {key}")
+            return json.loads(record.response_body), record.status_code, {"Idempotent-Replayed": "true"}
+
+        try:
+            response = f(*args, **kwargs)
+        except Exception:
+            # Failed requests are not stored, the client can retry with the same key
+            db.idempotency_record.delete_many(where={"id": record.id})
+            raise
+
+        if isinstance(response, tuple) and len(response) == 2 and response[1] < 500:
+            body, status_code = response
+            db.idempotency_record.update(
+                where={"id": record.id},
+                data={"status_code": status_code, "response_body": json.dumps(body, default=str)},
+            )
+        else:
+            db.idempotency_record.delete_many(where={"id": record.id})
+
+        return response
+
+    return idempotent_decorator_function
@@ -0,0 +1,76 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/json_provider.py
+Description: orjson based JSON provider of the Flask application.
+
+The output matches the default provider: sorted keys and dates (not serialized by the schemas) as HTTP dates.
+Non ASCII characters are sent as UTF-8 instead of \\u escapes. Pydantic models are dumped with model_dump.
+"""
+
+from typing import Any
+
+import orjson
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return DefaultJSONProvider.default(obj)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider serializing with orjson, see DefaultJSONProvider
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Options not supported by orjson (e.g. indent of the debug responses)
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # Indented output in debug mode
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE),
+            mimetype=self.mimetype,
+        )
+
+
+def init_app(app: Flask):
+    """
+    Sets the orjson provider as JSON provider of the Flask application.
+
+    Args:
+        app (Flask): The Flask application instance to initialize.
+    """
+    app.json = ORJSONProvider(app)
@@ -0,0 +1,125 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/memory_tracking.py
+Description: Optional per request memory accounting (MEMORY_TRACKING=true), to find the requests behind the
+memory peaks of the workers (data migration export, QR code ZIP, review history with images).
+
+For each request:
+- MemoryPeakMB: peak of the memory allocated by Python (tracemalloc) above its level at the start of the request
+- RssGrowthMB: growth of the maximum RSS of the process during the request (new high-water mark)
+Both are added to the request log line (see src/libs/query_accounting.py) and observed by endpoint in the
+caat_http_request_memory_peak_bytes / caat_http_request_rss_growth_bytes metrics.
+
+When MemoryPeakMB exceeds MEMORY_BUDGET_MB, the top allocation sites of the memory still allocated at the end of
+the request (response body and what it references) are logged as a warning.
+
+tracemalloc keeps a single, process wide peak, which each request resets. With several threads per worker
+(gthread), a request would clear the peak of the concurrent ones and see their allocations, so the requests of
+a worker are tracked one at a time: the tracking lock is held from before_request to teardown_request.
+While MEMORY_TRACKING is enabled, a worker thus processes a single request at a time (allocations of background
+threads are still counted) and tracemalloc slows the allocations down: enable it to investigate, on one instance.
+"""
+
+import resource
+import sys
+import threading
+import tracemalloc
+
+from flask import Flask, g, request
+from src.config import MEMORY_BUDGET_MB, MEMORY_TRACKING, MEMORY_TRACKING_FRAMES
+from src.libs.metrics import REQUEST_MEMORY_PEAK, REQUEST_RSS_GROWTH
+from src.logger import get_json_logger
+
+logger = get_json_logger()
+
+MB = 1024 * 1024
+TOP_ALLOCATION_SITES = 10
+
+# Serializes the tracked requests of the worker, see the module docstring
+_tracking_lock = threading.Lock()
+
+
+def _max_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def start_memory_tracking():
+    """
+    Before request method waiting for the tracking lock and recording the memory at the start of the request
+    """
+    _tracking_lock.acquire()
+    g.memory_tracking_locked = True
+    g.memory_start = (tracemalloc.get_traced_memory()[0], _max_rss_bytes())
+    tracemalloc.reset_peak()
+
+
+def end_memory_tracking(response):
+    """
+    After request method recording the tracemalloc peak of the request
+    """
+    start = g.pop("memory_start", None)
+    if start is None:
+        return response
+
+    peak_growth = max(tracemalloc.get_traced_memory()[1] - start[0], 0)
+    rss_growth = max(_max_rss_bytes() - start[1], 0)
+    endpoint = request.endpoint or "-"
+    REQUEST_MEMORY_PEAK.labels(endpoint).observe(peak_growth)
+    REQUEST_RSS_GROWTH.labels(endpoint).observe(rss_growth)
+    g.setdefault("request_log_extra", {}).update(
+        {"MemoryPeakMB": round(peak_growth / MB, 2), "RssGrowthMB": round(rss_growth / MB, 2)}
+    )
+
+    if MEMORY_BUDGET_MB and peak_growth > MEMORY_BUDGET_MB * MB:
+        statistics = tracemalloc.take_snapshot().statistics("traceback" if MEMORY_TRACKING_FRAMES > 1 else "lineno")
+        top = [
+            {"Site": " <- ".join(str(frame) for frame in stat.traceback), "SizeMB": round(stat.size / MB, 2)}
+            for stat in statistics[:TOP_ALLOCATION_SITES]
+        ]
+        logger.warning(
+            f"{request.method} {request.path} exceeded the memory budget of {MEMORY_BUDGET_MB} MB",
+            extra={"MemoryPeakMB": round(peak_growth / MB, 2), "TopAllocations": top},
+        )
+    return response
+
+
+def release_memory_tracking(exception=None):
+    """
+    Teardown request method releasing the tracking lock, also when the request failed
+    """
+    if g.pop("memory_tracking_locked", False):
+        _tracking_lock.release()
+
+
+def init_app(app: Flask):
+    """
+    Initializes the memory tracking of the Flask application, nothing is done unless MEMORY_TRACKING is set.
+
+    Args:
+        app (Flask): The Flask application instance to initialize.
+    """
+    if not MEMORY_TRACKING:
+        return
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(MEMORY_TRACKING_FRAMES)
+    app.before_request(start_memory_tracking)
+    app.after_request(end_memory_tracking)
+    app.teardown_request(release_memory_tracking)
@@ -0,0 +1,184 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/metrics.py
+Description: Prometheus metrics of the backend, exposed on GET /metrics.
+
+- caat_http_request_duration_seconds: request duration by blueprint, endpoint, method and status
+- caat_db_query_duration_seconds: Prisma query count / duration by table and method
+- caat_aitrios_request_duration_seconds: AITRIOS call latency by API version, operation and outcome
+- caat_http_request_memory_peak_bytes / caat_http_request_rss_growth_bytes: memory of the requests by endpoint,
+  observed when MEMORY_TRACKING is enabled (see src/libs/memory_tracking.py)
+
+With several gunicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty directory shared by the workers:
+each worker writes its samples there and GET /metrics aggregates them (see gunicorn.conf.py).
+"""
+
+import os
+import time
+from functools import wraps
+
+import requests
+from flask import Flask, Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from src.exceptions import APIException, InvalidAuthTokenException, InvalidBaseURLException, RetryAPIException
+from src.libs.prisma_instrumentation import QueryEvent, add_query_listener
+
+REQUEST_DURATION = Histogram(
+    "caat_http_request_duration_seconds",
+    "Duration of the HTTP requests",
+    ["blueprint", "endpoint", "method", "status"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+DB_QUERY_DURATION = Histogram(
+    "caat_db_query_duration_seconds",
+    "Duration of the Prisma queries",
+    ["model", "method"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+DB_QUERY_ERRORS = Counter("caat_db_query_errors_total", "Failed Prisma queries", ["model", "method"])
+MEMORY_BUCKETS = tuple(size * 1024 * 1024 for size in (1, 5, 10, 25, 50, 100, 250, 500, 1000))
+REQUEST_MEMORY_PEAK = Histogram(
+    "caat_http_request_memory_peak_bytes",
+    "Peak of the memory allocated during the requests (MEMORY_TRACKING)",
+    ["endpoint"],
+    buckets=MEMORY_BUCKETS,
+)
+REQUEST_RSS_GROWTH = Histogram(
+    "caat_http_request_rss_growth_bytes",
+    "Growth of the maximum RSS of the worker during the requests (MEMORY_TRACKING)",
+    ["endpoint"],
+    buckets=MEMORY_BUCKETS,
+)
+AITRIOS_REQUEST_DURATION = Histogram(
+    "caat_aitrios_request_duration_seconds",
+    "Duration of the AITRIOS API calls, each retry attempt is observed",
+    ["api_version", "operation", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30),
+)
+
+
+def aitrios_outcome(error: BaseException | None) -> str:
+    """
+    Method to get the outcome label of an AITRIOS call
+    Args:
+        error (Exception): Exception raised by the call, None on success
+    Returns:
+        str: success, retry (timeout or warning answered by AITRIOS), api_error, invalid_auth_token,
+             invalid_base_url or request_error
+    """
+    if error is None:
+        return "success"
+    if isinstance(error, RetryAPIException):
+        return "retry"
+    if isinstance(error, InvalidAuthTokenException):
+        return "invalid_auth_token"
+    if isinstance(error, InvalidBaseURLException):
+        return "invalid_base_url"
+    if isinstance(error, APIException):
+        return "api_error"
+    if isinstance(error, requests.exceptions.RequestException):
+        return "request_error"
+    return "error"
+
+
+def observe_aitrios_call(api_version: str, operation: str):
+    """
+    Decorator observing the latency of an AITRIOS call. Apply below @retry to observe each attempt.
+    Args:
+        api_version (str): v1, v2 or - (token endpoint)
+        operation (str): Name of the call, e.g. get_device_image
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            error = None
+            try:
+                return function(*args, **kwargs)
+            except BaseException as _exec:
+                error = _exec
+                raise
+            finally:
+                AITRIOS_REQUEST_DURATION.labels(api_version, operation, aitrios_outcome(error)).observe(
+                    time.perf_counter() - started
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def observe_query(event: QueryEvent):
+    """
+    Query listener recording the DB query metrics
+    """
+    DB_QUERY_DURATION.labels(event.model, event.method).observe(event.duration)
+    if event.error is not None:
+        DB_QUERY_ERRORS.labels(event.model, event.method).inc()
+
+
+def start_request_timer():
+    g.metrics_started = time.perf_counter()
+
+
+def observe_request(response):
+    """
+    After request method recording the request duration
+    """
+    started = g.pop("metrics_started", None)
+    if started is not None:
+        REQUEST_DURATION.labels(
+            request.blueprint or "-", request.endpoint or "-", request.method, str(response.status_code)
+        ).observe(time.perf_counter() - started)
+    return response
+
+
+def get_metrics():
+    """
+    GET /metrics
+    Metrics of every worker process in the Prometheus text format
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+
+def init_app(app: Flask):
+    """
+    Initializes the metrics of the Flask application and the GET /metrics endpoint.
+
+    Args:
+        app (Flask): The Flask application instance to initialize.
+    """
+    # First before request method, so the duration covers the others
+    app.before_request_funcs.setdefault(None, []).insert(0, start_request_timer)
+    app.after_request(observe_request)
+    app.add_url_rule("/metrics", "metrics", get_metrics, methods=["GET"])
+    add_query_listener(observe_query)
@@ -0,0 +1,92 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/prisma_instrumentation.py
+Description: Instrumented Prisma client, every query of the shared `src.core.db` client and of its transactions
+is reported to the registered query listeners (metrics, per request accounting, tracing).
+
+All the model actions (including the partial types) and the raw queries go through `Prisma._execute`,
+the transaction clients are copies of the client made by `Prisma._copy`.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from prisma import Prisma
+
+
+class QueryEvent(NamedTuple):
+    """
+    Query reported to the listeners once executed
+    """
+
+    model: str  # Table name, "-" for the raw queries
+    method: str  # Prisma method, e.g. find_many, create, query_raw
+    arguments: Dict[str, Any]
+    start_time_ns: int  # Wall clock time (time.time_ns)
+    duration: float  # Seconds
+    error: BaseException | None
+
+
+_query_listeners: List[Callable[[QueryEvent], None]] = []
+
+
+def add_query_listener(listener: Callable[[QueryEvent], None]):
+    """
+    Method to register a listener called after each query, in the thread running the query
+    Args:
+        listener (Callable): Called with the QueryEvent, must not raise
+    """
+    if listener not in _query_listeners:
+        _query_listeners.append(listener)
+
+
+class InstrumentedPrisma(Prisma):
+    """
+    Prisma client reporting its queries to the query listeners
+    """
+
+    __slots__ = ()
+
+    def _execute(self, method, arguments, model=None, root_selection=None):
+        start_time_ns = time.time_ns()
+        started = time.perf_counter()
+        error = None
+        try:
+            return super()._execute(method=method, arguments=arguments, model=model, root_selection=root_selection)
+        except BaseException as _exec:
+            error = _exec
+            raise
+        finally:
+            if _query_listeners:
+                event = QueryEvent(
+                    # Partial types keep the name of their table in __prisma_model__
+                    model=getattr(model, "__prisma_model__", model.__name__) if model else "-",
+                    method=method,
+                    arguments=arguments,
+                    start_time_ns=start_time_ns,
+                    duration=time.perf_counter() - started,
+                    error=error,
+                )
+                for listener in _query_listeners:
+                    listener(event)
+
+    def _copy(self) -> "InstrumentedPrisma":
+        # Transaction clients are instrumented too
+        new = super()._copy()
+        new.__class__ = InstrumentedPrisma
+        return new
@@ -0,0 +1,165 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/profiling.py
+Description: Opt-in sampling profiler of the requests, for slow requests that cannot be reproduced locally.
+
+A request is profiled when
+- it is sent by a logged in admin with the `X-Profile: 1` header, or
+- it is drawn at random with the PROFILING_SAMPLE_RATE probability (0 by default, e.g. 0.001 in production).
+
+While the request runs, a sampler thread records the stack of the request thread every PROFILING_INTERVAL_MS.
+The profile is written as PROFILING_DIR/<TraceId>.collapsed, in the collapsed stack format read by
+flamegraph.pl, speedscope and most flame graph viewers (`frame;frame;frame <samples>` per line).
+The request thread itself does nothing but start and stop the sampler.
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import Flask, g, request
+from flask_login import current_user
+from src.config import PROFILING_DIR, PROFILING_INTERVAL_MS, PROFILING_SAMPLE_RATE
+from src.exceptions import APIException
+from src.logger import get_json_logger
+
+logger = get_json_logger()
+
+PROFILE_HEADER = "X-Profile"
+# A sampler is stopped after this time even if its request never ends
+MAX_PROFILE_SECONDS = 300
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread from a background thread
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Args:
+            thread_id (int): threading.get_ident() of the profiled thread
+            interval (float): Seconds between two samples
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    @staticmethod
+    def _frame_name(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+    def _run(self):
+        deadline = time.monotonic() + MAX_PROFILE_SECONDS
+        while not self._stopped.wait(self.interval) and time.monotonic() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                names.append(self._frame_name(frame))
+                frame = frame.f_back
+            if names:
+                # Root first
+                self.stacks[";".join(reversed(names))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """
+        Stops the sampling
+        Returns:
+            Counter: Number of samples per collapsed stack
+        """
+        self._stopped.set()
+        self._thread.join()
+        return self.stacks
+
+
+def write_collapsed(path: str, stacks: Counter):
+    """
+    Method to write a profile in the collapsed stack format
+    Args:
+        path (str): Profile file
+        stacks (Counter): Samples per collapsed stack
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        for stack, samples in stacks.most_common():
+            file.write(f"{stack} {samples}\n")
+
+
+def _is_requested_by_admin() -> bool:
+    if request.headers.get(PROFILE_HEADER) != "1":
+        return False
+    try:
+        return current_user.is_authenticated
+    except APIException:
+        # Invalid Authorization header
+        return False
+
+
+def start_profiler():
+    """
+    Before request method starting the profiler of the selected requests
+    """
+    sampled = PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE
+    if not sampled and not _is_requested_by_admin():
+        return
+
+    profiler = SamplingProfiler(threading.get_ident(), PROFILING_INTERVAL_MS / 1000)
+    profiler.start()
+    g.profiler = profiler
+
+
+def stop_profiler(_exec):
+    """
+    Teardown method writing the profile of the request
+    """
+    profiler = g.pop("profiler", None)
+    if profiler is None:
+        return
+
+    stacks = profiler.stop()
+    trace_id = g.get("trace_id", "-")
+    path = os.path.join(PROFILING_DIR, f"{trace_id}.collapsed")
+    try:
+        write_collapsed(path, stacks)
+    except OSError as _os_exec:
+        logger.warning(f"Failed to write the profile {path}: {_os_exec}")
+        return
+    logger.info(
+        f"Profile of {request.method} {request.path} written to {path}",
+        extra={"ProfileSamples": sum(stacks.values()), "ProfileFile": path},
+    )
+
+
+def init_app(app: Flask):
+    """
+    Initializes the request profiling of the Flask application.
+
+    Args:
+        app (Flask): The Flask application instance to initialize.
+    """
+    app.before_request(start_profiler)
+    app.teardown_request(stop_profiler)
@@ -0,0 +1,148 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/query_accounting.py
+Description: Per request accounting of the Prisma queries (see src/libs/prisma_instrumentation.py).
+
+Each request is logged with its query count and DB time (DbQueryCount, DbQueryTimeMs), and the fields other
+request hooks put in `g.request_log_extra`. Queries of the same shape (table, method and argument structure,
+without the values) issued DB_REPEATED_QUERY_THRESHOLD times or more by one request are listed in RepeatedQueries
+and the line is logged as a warning: usually a query in a loop, to be replaced by one query over all the rows.
+
+Tests can pin the number of queries of an endpoint:
+
+    with assert_max_queries(3):
+        client.get("/devices")
+
+and with app.config["TESTING"] the responses carry the X-DB-Query-Count header.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, List
+
+from flask import Flask, current_app, g, has_request_context, request
+from src.config import DB_REPEATED_QUERY_THRESHOLD
+from src.libs.prisma_instrumentation import QueryEvent, add_query_listener
+from src.logger import get_json_logger
+
+logger = get_json_logger()
+
+RAW_QUERY_METHODS = frozenset({"query_raw", "query_first", "execute_raw"})
+
+# Queries recorded by the active assert_max_queries blocks
+_captures: List[List[QueryEvent]] = []
+
+
+def _argument_shape(value: Any) -> str:
+    if isinstance(value, dict):
+        return "{" + ",".join(f"{key}:{_argument_shape(value[key])}" for key in sorted(value)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(sorted({_argument_shape(item) for item in value})) + "]"
+    return "?"
+
+
+def query_shape(event: QueryEvent) -> str:
+    """
+    Method to get the shape of a query, identical for the queries differing only by their values
+    Args:
+        event (QueryEvent): Executed query
+    Returns:
+        str: e.g. `device.find_first({where:{id:?}})`
+    """
+    if event.method in RAW_QUERY_METHODS:
+        return f"{event.method}({event.arguments.get('query')})"
+    return f"{event.model}.{event.method}({_argument_shape(event.arguments)})"
+
+
+def account_query(event: QueryEvent):
+    """
+    Query listener accounting the queries of the current request
+    """
+    for capture in _captures:
+        capture.append(event)
+
+    if not has_request_context():
+        return
+    if "db_query_shapes" not in g:
+        g.db_query_shapes = Counter()
+        g.db_query_time = 0.0
+    g.db_query_shapes[query_shape(event)] += 1
+    g.db_query_time += event.duration
+
+
+def log_request_queries(response):
+    """
+    After request method logging the queries of the request
+    """
+    shapes = g.pop("db_query_shapes", Counter())
+    query_time = g.pop("db_query_time", 0.0)
+    query_count = sum(shapes.values())
+    if request.endpoint == "metrics":
+        return response
+
+    repeated = [
+        {"Shape": shape, "Count": count}
+        for shape, count in shapes.most_common()
+        if count >= DB_REPEATED_QUERY_THRESHOLD
+    ]
+    extra = {"DbQueryCount": query_count, "DbQueryTimeMs": round(query_time * 1000, 2)}
+    # Fields added by the other request hooks (e.g. src/libs/memory_tracking.py)
+    extra.update(g.pop("request_log_extra", {}))
+    message = f"{request.method} {request.path} {response.status_code}"
+    if repeated:
+        logger.warning(f"{message}, repeated queries", extra={**extra, "RepeatedQueries": repeated})
+    else:
+        logger.info(message, extra=extra)
+
+    if current_app.testing:
+        response.headers["X-DB-Query-Count"] = str(query_count)
+    return response
+
+
+@contextmanager
+def assert_max_queries(max_count: int):
+    """
+    Test helper failing when the block runs more than `max_count` queries
+    Args:
+        max_count (int): Maximum number of queries
+    Raises:
+        AssertionError: Listing the queries of the block
+    """
+    add_query_listener(account_query)
+    events: List[QueryEvent] = []
+    _captures.append(events)
+    try:
+        yield events
+    finally:
+        _captures.remove(events)
+
+    if len(events) > max_count:
+        shapes = Counter(query_shape(event) for event in events)
+        details = "\n".join(f"  {count} x {shape}" for shape, count in shapes.most_common())
+        raise AssertionError(f"{len(events)} queries run, at most {max_count} expected:\n{details}")
+
+
+def init_app(app: Flask):
+    """
+    Initializes the per request query accounting of the Flask application.
+
+    Args:
+        app (Flask): The Flask application instance to initialize.
+    """
+    add_query_listener(account_query)
+    app.after_request(log_request_queries)
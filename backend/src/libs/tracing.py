@@ -0,0 +1,186 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/libs/tracing.py
+Description: OpenTelemetry tracing of the requests, Prisma queries and AITRIOS calls.
+
+Spans:
+- one server span per request, continuing the W3C `traceparent` of the caller if any
+- one span per Prisma query (see src/libs/prisma_instrumentation.py)
+- AITRIOS calls: a span per call including the retries and their sleeps, and a child span per attempt
+
+The TraceId of the JSON logs is the trace ID of the request span, and the logs carry the current SpanId.
+Spans are exported when TRACING_EXPORTER is set:
+- `file`: one JSON span per line in TRACING_FILE
+- `otlp`: to the OTLP/HTTP collector of OTEL_EXPORTER_OTLP_ENDPOINT (needs opentelemetry-exporter-otlp-proto-http)
+"""
+
+import os
+from functools import wraps
+from typing import Dict
+
+from flask import Flask, g, request
+from opentelemetry import context, trace
+from opentelemetry.propagate import extract
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.trace import SpanKind, Status, StatusCode, format_span_id, format_trace_id
+from src.config import TRACING_EXPORTER, TRACING_FILE
+from src.libs.prisma_instrumentation import QueryEvent, add_query_listener
+from src.logger import FormatterJSON
+
+tracer = trace.get_tracer("caat-backend")
+
+
+def get_trace_id() -> str | None:
+    """
+    Method to get the trace ID of the current span
+    Returns:
+        str: 32 hex digits, None if tracing is disabled
+    """
+    span_context = trace.get_current_span().get_span_context()
+    return format_trace_id(span_context.trace_id) if span_context.is_valid else None
+
+
+def get_span_id() -> str | None:
+    """
+    Method to get the ID of the current span
+    Returns:
+        str: 16 hex digits, None if tracing is disabled
+    """
+    span_context = trace.get_current_span().get_span_context()
+    return format_span_id(span_context.span_id) if span_context.is_valid else None
+
+
+def traced(name: str, attributes: Dict | None = None, kind: SpanKind = SpanKind.INTERNAL):
+    """
+    Decorator running the function in a span, the span records the exception raised by the function.
+    For a function with @retry, apply it above @retry for the whole call (attempts and sleeps between them)
+    and below @retry for each attempt.
+    Args:
+        name (str): Span name
+        attributes (dict): Span attributes
+        kind (SpanKind): CLIENT for the calls to other services
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(name, kind=kind, attributes=attributes):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_query_span(event: QueryEvent):
+    """
+    Query listener recording a span per Prisma query, under the current span
+    """
+    span = tracer.start_span(
+        f"prisma {event.model}.{event.method}",
+        kind=SpanKind.CLIENT,
+        start_time=event.start_time_ns,
+        attributes={"db.system": "prisma", "db.operation": event.method, "db.sql.table": event.model},
+    )
+    if event.error is not None:
+        span.record_exception(event.error)
+        span.set_status(Status(StatusCode.ERROR, type(event.error).__name__))
+    span.end(end_time=event.start_time_ns + int(event.duration * 1_000_000_000))
+
+
+def start_request_span():
+    """
+    Before request method starting the request span
+    """
+    span = tracer.start_span(
+        f"{request.method} {request.url_rule.rule if request.url_rule else request.path}",
+        context=extract(request.headers),
+        kind=SpanKind.SERVER,
+        attributes={"http.method": request.method, "http.target": request.full_path},
+    )
+    if request.url_rule:
+        span.set_attribute("http.route", request.url_rule.rule)
+    g.tracing_span = span
+    g.tracing_token = context.attach(trace.set_span_in_context(span))
+
+
+def end_request_span(response):
+    """
+    After request method setting the status of the request span
+    """
+    span = g.get("tracing_span")
+    if span is not None:
+        span.set_attribute("http.status_code", response.status_code)
+        span.set_attribute("flask.endpoint", request.endpoint or "-")
+        if response.status_code >= 500:
+            span.set_status(Status(StatusCode.ERROR))
+    return response
+
+
+def close_request_span(_exec):
+    """
+    Teardown method ending the request span, also run for the unhandled exceptions
+    """
+    span = g.pop("tracing_span", None)
+    token = g.pop("tracing_token", None)
+    if span is not None:
+        if _exec is not None:
+            span.record_exception(_exec)
+            span.set_status(Status(StatusCode.ERROR, type(_exec).__name__))
+        span.end()
+    if token is not None:
+        context.detach(token)
+
+
+def _create_exporter():
+    if TRACING_EXPORTER == "file":
+        file = open(TRACING_FILE, "a", encoding="utf-8")
+        return ConsoleSpanExporter(
+            service_name=FormatterJSON.service_name,
+            out=file,
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    if TRACING_EXPORTER == "otlp":
+        # Optional dependency, only needed to export to a collector
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter()
+    raise ValueError(f"Unsupported TRACING_EXPORTER {TRACING_EXPORTER}")
+
+
+def init_app(app: Flask):
+    """
+    Initializes the tracing of the Flask application, nothing is done if TRACING_EXPORTER is not set.
+
+    Args:
+        app (Flask): The Flask application instance to initialize.
+    """
+    if not TRACING_EXPORTER:
+        return
+
+    provider = TracerProvider(resource=Resource.create({SERVICE_NAME: FormatterJSON.service_name}))
+    provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+    trace.set_tracer_provider(provider)
+
+    # Before the TraceId is set by start_trace
+    app.before_request_funcs.setdefault(None, []).insert(0, start_request_span)
+    app.after_request(end_request_span)
+    app.teardown_request(close_request_span)
+    add_query_listener(record_query_span)
@@ -17,14 +17,68 @@
 """
 File: src/logger.py
 Description: Utility module to log in JSON format
+
+Records are put on an in-process queue by the request threads and formatted / written to stdout
+by a single listener thread per process (QueueHandler / QueueListener), so a slow stdout never
+blocks a request. The TraceId, SpanId and the log message are captured when the record is queued.
+TraceId is the ID of the request (the trace ID of its span when tracing is enabled, see src/libs/tracing.py).
 """
 
-import inspect
-import json
+import atexit
 import logging
+import os
+import queue
 import sys
-import traceback
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
 from flask import g, has_request_context
+from opentelemetry import trace
+from opentelemetry.trace import format_span_id, format_trace_id
+
+# Attributes of logging.LogRecord, every other attribute is a user defined field (`extra`)
+RESERVED_RECORD_KEYS = frozenset(
+    {
+        "args",
+        "asctime",
+        "created",
+        "exc_info",
+        "exc_text",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "message",
+        "module",
+        "msecs",
+        "msg",
+        "name",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "taskName",
+        "thread",
+        "threadName",
+    }
+)
+# Set on the record by the request thread, see RequestContextQueueHandler
+TRACE_ID_KEY = "_trace_id"
+SPAN_ID_KEY = "_span_id"
+
+
+def _get_trace_id() -> str:
+    if has_request_context() and hasattr(g, "trace_id"):
+        return g.trace_id
+    span_context = trace.get_current_span().get_span_context()
+    return format_trace_id(span_context.trace_id) if span_context.is_valid else "-"
+
+
+def _get_span_id() -> str:
+    span_context = trace.get_current_span().get_span_context()
+    return format_span_id(span_context.span_id) if span_context.is_valid else "-"
 
 
 class FormatterJSON(logging.Formatter):
@@ -35,56 +89,94 @@ class FormatterJSON(logging.Formatter):
     log_level = "DEBUG"
     service_name = "caat-backend"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._uses_time = self.usesTime()
+
     def format(self, record):
-        supported_keys = {}  # Initialize supported_keys as an empty dictionary
-        if self.usesTime():
+        supported_keys = {}
+        if self._uses_time:
             record.asctime = self.formatTime(record, self.datefmt)
             # Define supporting Fields (keys)
             supported_keys = {
                 "LogLevel": record.levelname.replace("CRITICAL", "FATAL"),
                 "DateTime": f"{record.asctime}.{int(record.msecs)}Z",
-                "TraceId": g.trace_id if has_request_context() and hasattr(g, 'trace_id') else "-",
+                "TraceId": record.__dict__.get(TRACE_ID_KEY) or _get_trace_id(),
+                "SpanId": record.__dict__.get(SPAN_ID_KEY) or _get_span_id(),
                 "LogMessage": record.getMessage(),
                 "Resources": record.name,
                 "Caller": f"{record.filename}:{record.lineno}",
                 "FunctionName": record.funcName,
                 "ErrorCode": getattr(record, "ErrorCode", "-"),
             }
-        # Add to Fields (key) to support stack traces
-        if record.exc_info:
-            exception_data = traceback.format_exc().splitlines()
-            supported_keys["StackTrace"] = exception_data
+        # Add to Fields (key) to support stack traces, from the record as it may be formatted in another thread
+        if record.exc_info and record.exc_info[0] is not None:
+            supported_keys["StackTrace"] = self.formatException(record.exc_info).splitlines()
+        elif record.exc_text:
+            supported_keys["StackTrace"] = record.exc_text.splitlines()
 
         # Add user defined Fields (keys)
-        for i in inspect.getmembers(record):
-            if not i[0].startswith("_") and not inspect.ismethod(i[1]):
-                existed_keys = [
-                    "args",
-                    "asctime",
-                    "created",
-                    "exc_info",
-                    "exc_text",
-                    "filename",
-                    "funcName",
-                    "levelname",
-                    "levelno",
-                    "lineno",
-                    "module",
-                    "msecs",
-                    "msg",
-                    "name",
-                    "pathname",
-                    "process",
-                    "processName",
-                    "relativeCreated",
-                    "stack_info",
-                    "thread",
-                    "threadName",
-                ]
-                if not i[0] in existed_keys:
-                    supported_keys[i[0]] = i[1]
-
-        return json.dumps(supported_keys, ensure_ascii=False)
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_RECORD_KEYS and not key.startswith("_"):
+                supported_keys[key] = value
+
+        return orjson.dumps(supported_keys, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+class RequestContextQueueHandler(QueueHandler):
+    """
+    QueueHandler keeping the record for the listener, with the request context data it cannot read
+    """
+
+    def prepare(self, record):
+        # The arguments may be changed by the caller once the record is queued
+        record.msg = record.getMessage()
+        record.args = None
+        record.__dict__[TRACE_ID_KEY] = _get_trace_id()
+        record.__dict__[SPAN_ID_KEY] = _get_span_id()
+        return record
+
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_listener: QueueListener | None = None
+
+
+def _start_queue_listener():
+    """
+    Starts the listener thread writing the queued records to stdout, once per process
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(FormatterJSON("[%(levelname)s]\t%(asctime)s\t%(message)s\n", "%Y-%m-%dT%H:%M:%S"))
+    _queue_listener = QueueListener(_log_queue, handler)
+    _queue_listener.start()
+    # Writes the queued records before exiting
+    atexit.register(_queue_listener.stop)
+
+
+def _pause_queue_listener():
+    """
+    Writes the queued records and stops the listener thread before a fork (gunicorn workers),
+    so the forked process neither inherits a lock held by the thread nor writes the records again
+    """
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
+def _resume_queue_listener():
+    if _queue_listener is not None:
+        _queue_listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_pause_queue_listener,
+        after_in_parent=_resume_queue_listener,
+        after_in_child=_resume_queue_listener,
+    )
 
 
 def get_json_logger(name: str = FormatterJSON.service_name, log_level: str = FormatterJSON.log_level):
@@ -99,9 +191,8 @@ def get_json_logger(name: str = FormatterJSON.service_name, log_level: str = For
     """
 
     json_logger = logging.getLogger(name)
-    handler = logging.StreamHandler(sys.stdout)
-    formatter = FormatterJSON("[%(levelname)s]\t%(asctime)s\t%(message)s\n", "%Y-%m-%dT%H:%M:%S")
-    handler.setFormatter(formatter)
+    _start_queue_listener()
+    handler = RequestContextQueueHandler(_log_queue)
     if json_logger.hasHandlers():
         json_logger.handlers.clear()
     json_logger.addHandler(handler)
@@ -0,0 +1,82 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/models/captures.py
+Description: Short lived server side storage of the camera images returned to the contractor app,
+so the review can be created from the capture ID instead of uploading the image again.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+from prisma import Prisma
+from src.config import CAPTURE_TTL_SECONDS
+
+
+def store_capture(connection: Prisma, device_id: int, facility_id: int, image: str) -> str:
+    """
+    Method to store a camera image, replacing the previous capture of the device, and purge the expired ones.
+    Only the latest capture of a device can be used to create the review, so polling the camera
+    (interval capture) keeps a single row per device.
+    Args:
+        connection (Prisma connection)
+        device_id (int): Device DB ID
+        facility_id (int): Facility ID of the contractor token
+        image (str): base64 data URL of the image
+    Returns:
+        str: Capture ID
+    """
+    now = datetime.utcnow()
+    connection.device_capture.delete_many(where={"expires_at_utc": {"lt": now}})
+
+    capture_data = {
+        "capture_uuid": str(uuid.uuid4()),
+        "image_blob": image,
+        "created_at_utc": now,
+        "expires_at_utc": now + timedelta(seconds=CAPTURE_TTL_SECONDS),
+    }
+    capture = connection.device_capture.upsert(
+        where={"device_id_facility_id": {"device_id": device_id, "facility_id": facility_id}},
+        data={
+            "create": {**capture_data, "device_id": device_id, "facility_id": facility_id},
+            "update": capture_data,
+        },
+    )
+    return capture.capture_uuid
+
+
+def take_capture(connection: Prisma, capture_id: str, device_id: int, facility_id: int) -> str | None:
+    """
+    Method to get and remove a capture. Use the review creation transaction as connection,
+    so the capture is kept if the review is not created.
+    Args:
+        connection (Prisma connection / transaction)
+        capture_id (str): Capture ID returned by GET /facility/devices/<id>/images
+        device_id (int): Device DB ID the review is created for
+        facility_id (int): Facility ID of the contractor token
+    Returns:
+        str: base64 data URL of the image, None if the capture is not found, expired or for another device
+    """
+    capture = connection.device_capture.find_unique(where={"capture_uuid": capture_id})
+    if not capture or capture.device_id != device_id or capture.facility_id != facility_id:
+        return None
+
+    connection.device_capture.delete(where={"id": capture.id})
+    if capture.expires_at_utc.replace(tzinfo=None) < datetime.utcnow():
+        return None
+
+    return capture.image_blob
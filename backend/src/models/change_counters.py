@@ -0,0 +1,84 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/models/change_counters.py
+Description: Per admin versions of the master data tables (see the change_counter model).
+
+Every write of a customer, facility, facility type or device type calls bump_change_counter for the
+admin owning the row, with the same connection (transaction) as the write when there is one.
+"""
+
+from typing import Dict, Iterable
+
+from prisma import Prisma
+from prisma.errors import UniqueViolationError
+
+# Master data tables with a change counter, named after their Prisma model
+CUSTOMER = "customer"
+FACILITY = "facility"
+FACILITY_TYPE = "facility_type"
+DEVICE_TYPE = "device_type"
+MASTER_DATA_TABLES = (CUSTOMER, FACILITY, FACILITY_TYPE, DEVICE_TYPE)
+
+
+def bump_change_counter(connection: Prisma, table_name: str, admin_id: int):
+    """
+    Method to record a write of a master data table
+    Args:
+        connection (Prisma connection / transaction)
+        table_name (str): One of MASTER_DATA_TABLES
+        admin_id (int): Admin owning the written rows
+    """
+    connection.change_counter.upsert(
+        where={"table_name_admin_id": {"table_name": table_name, "admin_id": admin_id}},
+        data={
+            "create": {"table_name": table_name, "admin_id": admin_id, "version": 1},
+            "update": {"version": {"increment": 1}},
+        },
+    )
+
+
+def get_change_versions(connection: Prisma, table_names: Iterable[str], admin_id: int) -> Dict[str, str]:
+    """
+    Method to get the current version of master data tables.
+    Missing counters are created, so that a counter deleted and created again never repeats a version.
+    Args:
+        connection (Prisma connection)
+        table_names (list): Tables of MASTER_DATA_TABLES
+        admin_id (int): Admin ID
+    Returns:
+        dict: Table name -> version string (version and time of the last write)
+    """
+    table_names = list(table_names)
+    rows = connection.change_counter.find_many(where={"table_name": {"in": table_names}, "admin_id": admin_id})
+    counters = {row.table_name: row for row in rows}
+
+    for table_name in table_names:
+        if table_name not in counters:
+            try:
+                counters[table_name] = connection.change_counter.create(
+                    data={"table_name": table_name, "admin_id": admin_id}
+                )
+            except UniqueViolationError:
+                counters[table_name] = connection.change_counter.find_unique(
+                    where={"table_name_admin_id": {"table_name": table_name, "admin_id": admin_id}}
+                )
+
+    return {
+        table_name: f"{counter.version}.{int(counter.last_updated_at_utc.timestamp() * 1000)}"
+        for table_name, counter in counters.items()
+    }
@@ -0,0 +1,80 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/models/dialect.py
+Description: Helpers for the raw SQL queries, which differ between Postgres (local, aws) and SQL Server (azure).
+The dialect is detected once, from the DATABASE_URL scheme (see get_sql_dialect).
+"""
+
+from src.config import APP_ENV, DATABASE_URL
+
+POSTGRES = "postgres"
+SQLSERVER = "sqlserver"
+
+
+def get_sql_dialect() -> str:
+    """
+    Method to get the SQL dialect of the database, from the DATABASE_URL scheme (`sqlserver://` or
+    `postgresql://`). APP_ENV is only used without DATABASE_URL: azure is SQL Server, everything else Postgres,
+    so local runs and tests with APP_ENV unset are not taken as SQL Server.
+    Returns:
+        str: POSTGRES or SQLSERVER
+    """
+    if DATABASE_URL:
+        return SQLSERVER if DATABASE_URL.partition(":")[0] == "sqlserver" else POSTGRES
+    return SQLSERVER if APP_ENV == "azure" else POSTGRES
+
+
+def sql_param(dialect: str | None, index: int) -> str:
+    """
+    Method to get the placeholder of a raw query parameter
+    Args:
+        dialect (str): POSTGRES or SQLSERVER, get_sql_dialect() if None
+        index (int): 1 based index of the parameter
+    Returns:
+        str: `$1` (Postgres) or `@P1` (SQL Server)
+    """
+    dialect = dialect or get_sql_dialect()
+    return f"${index}" if dialect == POSTGRES else f"@P{index}"
+
+
+def sql_timestamp_param(dialect: str | None, index: int) -> str:
+    """
+    Method to get the placeholder of a timestamp parameter.
+    Raw query parameters are sent as text, so they are cast to the type of the DateTime columns.
+    Args:
+        dialect (str): POSTGRES or SQLSERVER, get_sql_dialect() if None
+        index (int): 1 based index of the parameter
+    Returns:
+        str: `CAST($1 AS timestamp(3))` (Postgres) or `CAST(@P1 AS datetime2)` (SQL Server)
+    """
+    dialect = dialect or get_sql_dialect()
+    column_type = "timestamp(3)" if dialect == POSTGRES else "datetime2"
+    return f"CAST({sql_param(dialect, index)} AS {column_type})"
+
+
+def sql_table(dialect: str | None, table: str) -> str:
+    """
+    Method to get the quoted table name
+    Args:
+        dialect (str): POSTGRES or SQLSERVER, get_sql_dialect() if None
+        table (str): Prisma model name
+    Returns:
+        str: `"table"` (Postgres) or `[dbo].[table]` (SQL Server)
+    """
+    dialect = dialect or get_sql_dialect()
+    return f'"{table}"' if dialect == POSTGRES else f"[dbo].[{table}]"
@@ -0,0 +1,141 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/models/facility_search.py
+Description: Query builders for the facility name / prefecture / municipality filters.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from prisma import Prisma
+from src.config import FACILITY_SEARCH_BACKEND
+from src.logger import get_json_logger
+from src.models.dialect import SQLSERVER, get_sql_dialect
+
+logger = get_json_logger()
+
+# SQL Server accepts at most 2100 parameters per query, the `in` filter leaves room for the other device filters
+MAX_FULLTEXT_MATCHES = 1000
+
+
+# Strategy Interface
+class FacilitySearch(ABC):
+    @abstractmethod
+    def build_conditions(
+        self,
+        connection: Prisma,
+        customer_id: int,
+        facility_names: List[str],
+        prefecture: str | None,
+        municipality: str | None,
+    ) -> List[dict]:
+        """
+        Builds the device `AND` conditions for the facility filters
+        Args:
+            connection (Prisma connection)
+            customer_id (int): Customer ID the devices are filtered by
+            facility_names (List[str]): Facility name tokens, every token must match
+            prefecture (str): Prefecture filter
+            municipality (str): Municipality filter
+        Returns:
+            List of Prisma where conditions for the device model
+        """
+        pass
+
+
+class LikeFacilitySearch(FacilitySearch):
+    """
+    Substring match (`LIKE '%token%'`) on the facility columns.
+
+    On Postgres the columns are covered by `pg_trgm` GIN indexes (see schema.postgres.prisma),
+    which the planner uses for `LIKE '%token%'`, so no full scan is needed.
+    """
+
+    def build_conditions(self, connection, customer_id, facility_names, prefecture, municipality):
+        conditions = []
+        for facility_name in facility_names:
+            conditions.append({"facility": {"facility_name": {"contains": facility_name}}})
+
+        if prefecture:
+            conditions.append({"facility": {"prefecture": {"contains": prefecture}}})
+
+        if municipality:
+            conditions.append({"facility": {"municipality": {"contains": municipality}}})
+
+        return conditions
+
+
+class FullTextFacilitySearch(FacilitySearch):
+    """
+    SQL Server full-text search on the facility columns.
+
+    Requires the full-text catalog created by `prisma/sql/sqlserver_facility_fulltext.sql`.
+    Tokens are matched as word prefixes (`CONTAINS(column, '"token*"')`), unlike the substring match of
+    `LikeFacilitySearch`: a token inside a word ("kyo" in "Tokyo") does not match, and Japanese text is
+    matched on the word breaks of the full-text index language. Enabled with FACILITY_SEARCH_BACKEND=fulltext
+    only, the substring match stays the default.
+    Falls back to `LikeFacilitySearch` if the full-text query fails or matches too many facilities.
+    """
+
+    def __init__(self):
+        self.fallback = LikeFacilitySearch()
+
+    @staticmethod
+    def _prefix_term(token: str) -> str:
+        # Double quotes delimit the term in a CONTAINS search condition
+        return '"' + token.replace('"', "") + '*"'
+
+    def build_conditions(self, connection, customer_id, facility_names, prefecture, municipality):
+        clauses = ["customer_id = @P1"]
+        params = [customer_id]
+        for column, tokens in [
+            ("facility_name", [name for name in facility_names if name.replace('"', "").strip()]),
+            ("prefecture", [prefecture] if prefecture else []),
+            ("municipality", [municipality] if municipality else []),
+        ]:
+            for token in tokens:
+                params.append(self._prefix_term(token))
+                clauses.append(f"CONTAINS([{column}], @P{len(params)})")
+
+        if len(params) == 1:
+            return self.fallback.build_conditions(connection, customer_id, facility_names, prefecture, municipality)
+
+        query = f"SELECT TOP {MAX_FULLTEXT_MATCHES + 1} [id] FROM [dbo].[facility] WHERE {' AND '.join(clauses)}"
+        try:
+            rows = connection.query_raw(query, *params)
+        except Exception as _exec:
+            logger.warning(f"Full-text facility search failed, falling back to LIKE search: {_exec}")
+            return self.fallback.build_conditions(connection, customer_id, facility_names, prefecture, municipality)
+
+        if len(rows) > MAX_FULLTEXT_MATCHES:
+            return self.fallback.build_conditions(connection, customer_id, facility_names, prefecture, municipality)
+
+        return [{"facility_id": {"in": [row["id"] for row in rows]}}]
+
+
+def get_facility_search() -> FacilitySearch:
+    """
+    Method to get the facility search based on FACILITY_SEARCH_BACKEND. The substring match is the default,
+    the full-text search is used only when FACILITY_SEARCH_BACKEND=fulltext on SQL Server
+    Returns:
+        FacilitySearch: LikeFacilitySearch or FullTextFacilitySearch
+    """
+    if FACILITY_SEARCH_BACKEND == "fulltext" and get_sql_dialect() == SQLSERVER:
+        return FullTextFacilitySearch()
+
+    return LikeFacilitySearch()
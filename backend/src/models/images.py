@@ -0,0 +1,270 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/models/images.py
+Description: Deduplicated, reference counted storage of the review and device type images.
+
+An image is prepared outside of the write transaction: the hash of the received payload is looked up first,
+so a payload already stored (resubmitted capture, shared reference image) skips the normalization.
+Otherwise the payload is normalized and keyed by the hash of the normalized image.
+In the write transaction the image row is created or its ref_count incremented (acquire_image), and
+the row is released when the review / device type stops pointing to it (release_image).
+
+Rows written before the image table keep their image in review.image_blob / device_type.sample_image_blob,
+see scripts/migrate_images.py.
+
+Reference images of the device types are sent as the URL of GET /device-types/reference-images/<content_hash>
+(see reference_image_url), which never changes content and is cached by the browsers and proxies.
+"""
+
+import base64
+import hashlib
+from io import BytesIO
+from typing import Callable, Dict, List
+
+from flask import url_for
+from prisma import Prisma
+from prisma.errors import UniqueViolationError
+from prisma.partials import ImageWithoutBlob
+from src.services.image_service import decode_base64_image, normalize_image, to_data_url
+from src.services.review_image_service import ImageUploadBuffer
+
+
+def hash_image(data: bytes) -> str:
+    """
+    Method to get the content hash of an image
+    Args:
+        data (bytes): Encoded image (not base64)
+    Returns:
+        str: SHA-256 hex digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_data_url(image: str) -> str:
+    """
+    Method to get the content hash of an image stored as data URL
+    Args:
+        image (str): data:image/<type>;base64,<data>
+    Returns:
+        str: SHA-256 hex digest of the decoded image
+    """
+    return hash_image(base64.b64decode(image.rpartition(",")[2]))
+
+
+class PreparedImage:
+    """
+    Image to be referenced by a review or device type, see acquire_image.
+    `image` is None when the image is already stored, `normalize` returns it if the stored row is gone
+    before the write transaction.
+    """
+
+    def __init__(
+        self,
+        content_hash: str,
+        image: str | None = None,
+        source_hash: str | None = None,
+        normalize: Callable[[], str] | None = None,
+    ):
+        self.content_hash = content_hash
+        self.image = image
+        self.source_hash = source_hash
+        self.normalize = normalize
+
+    @classmethod
+    def from_data_url(cls, image: str) -> "PreparedImage":
+        """
+        Method to prepare an already normalized image (capture, data migration import)
+        """
+        return cls(content_hash=hash_data_url(image), image=image)
+
+
+def prepare_image(connection: Prisma, source_hash: str, normalize: Callable[[], str]) -> PreparedImage:
+    """
+    Method to find a stored copy of a payload, or normalize it
+    Args:
+        connection (Prisma connection)
+        source_hash (str): Hash of the received image bytes
+        normalize (Callable): Returns the normalized data URL of the payload
+    Returns:
+        PreparedImage
+    Raises:
+        APIException: INVALID_IMAGE_FORMAT if the payload is normalized and not a valid image
+    """
+    # The payload may be the original upload of a stored image or the stored image itself
+    stored = connection.image.find_first(
+        where={"OR": [{"source_hash": source_hash}, {"content_hash": source_hash}]},
+    )
+    if stored:
+        return PreparedImage(content_hash=stored.content_hash, source_hash=source_hash, normalize=normalize)
+
+    image = normalize()
+    return PreparedImage(content_hash=hash_data_url(image), image=image, source_hash=source_hash)
+
+
+def prepare_base64_image(connection: Prisma, image: str) -> PreparedImage:
+    """
+    Method to prepare an image sent as a base64 data URL (or bare base64 string)
+    Args:
+        connection (Prisma connection)
+        image (str): Received image
+    Returns:
+        PreparedImage
+    Raises:
+        APIException: INVALID_IMAGE_FORMAT
+    """
+    data = decode_base64_image(image)
+    return prepare_image(connection, hash_image(data), lambda: to_data_url(*normalize_image(BytesIO(data))))
+
+
+def prepare_upload_image(connection: Prisma, buffer: ImageUploadBuffer) -> PreparedImage:
+    """
+    Method to prepare an image received in an upload buffer.
+    Acquire the image before the buffer is closed.
+    Args:
+        connection (Prisma connection)
+        buffer (ImageUploadBuffer): Received image
+    Returns:
+        PreparedImage
+    Raises:
+        APIException: INVALID_IMAGE_FORMAT
+    """
+    return prepare_image(connection, buffer.source_hash, buffer.to_data_url)
+
+
+def acquire_image(connection: Prisma, prepared: PreparedImage) -> int:
+    """
+    Method to add a reference to an image, storing it if needed.
+    Use the transaction writing the review / device type as connection.
+    Args:
+        connection (Prisma connection / transaction)
+        prepared (PreparedImage): Image to reference
+    Returns:
+        int: Image ID
+    """
+    if prepared.image is None:
+        stored = connection.image.update(
+            where={"content_hash": prepared.content_hash}, data={"ref_count": {"increment": 1}}
+        )
+        if stored:
+            return stored.id
+        # Released since it was prepared
+        prepared.image = prepared.normalize()
+        prepared.content_hash = hash_data_url(prepared.image)
+
+    try:
+        stored = connection.image.upsert(
+            where={"content_hash": prepared.content_hash},
+            data={
+                "create": {
+                    "content_hash": prepared.content_hash,
+                    "source_hash": prepared.source_hash,
+                    "image_blob": prepared.image,
+                    "ref_count": 1,
+                },
+                "update": {"ref_count": {"increment": 1}},
+            },
+        )
+    except UniqueViolationError:
+        # Same image stored by a concurrent request between the read and the insert of the upsert.
+        # Postgres runs the upsert as a single INSERT ... ON CONFLICT, SQL Server reads then inserts and
+        # keeps the transaction usable after the failed statement, so the reference is added to that row
+        stored = connection.image.update(
+            where={"content_hash": prepared.content_hash}, data={"ref_count": {"increment": 1}}
+        )
+    return stored.id
+
+
+def release_image(connection: Prisma, image_id: int | None, count: int = 1):
+    """
+    Method to remove references to an image and delete it once unreferenced
+    Args:
+        connection (Prisma connection / transaction)
+        image_id (int): Image ID, nothing is done for None (image stored in the legacy column)
+        count (int): Number of references removed
+    """
+    if image_id is None:
+        return
+
+    connection.image.update_many(where={"id": image_id}, data={"ref_count": {"decrement": count}})
+    connection.image.delete_many(where={"id": image_id, "ref_count": {"lte": 0}})
+
+
+def release_review_images(connection: Prisma, where: Dict):
+    """
+    Method to release the images of the reviews about to be deleted
+    Args:
+        connection (Prisma connection / transaction)
+        where (dict): Prisma where condition of the deleted reviews
+    """
+    rows = connection.review.group_by(by=["image_id"], where={**where, "image_id": {"not": None}}, count={"_all": True})
+    for row in rows:
+        release_image(connection, row["image_id"], row["_count"]["_all"])
+
+
+def get_image_blob(image, legacy_blob: str | None = None) -> str | None:
+    """
+    Method to get the image of a review / device type
+    Args:
+        image: Loaded `image` / `sample_image` relation
+        legacy_blob (str): `image_blob` / `sample_image_blob` column
+    Returns:
+        str: base64 data URL
+    """
+    return image.image_blob if image else legacy_blob
+
+
+def reference_image_url(content_hash: str) -> str:
+    """
+    Method to get the URL of a reference image
+    Args:
+        content_hash (str): Content hash of the image
+    Returns:
+        str: URL path, relative to the API base URL
+    """
+    return url_for("device-types.get_reference_image", content_hash=content_hash)
+
+
+def add_reference_image_urls(connection: Prisma, device_types: List[Dict | None]) -> List[Dict | None]:
+    """
+    Method to set `sample_image_url` of device types read from the DB, with one query for all of them.
+    The URL is None for the device types whose image is still in the legacy column.
+    Args:
+        connection (Prisma connection)
+        device_types (list): Dumped device types, with or without the `sample_image` relation
+    Returns:
+        list: device_types, updated in place
+    """
+    pending = {
+        device_type["sample_image_id"]
+        for device_type in device_types
+        if device_type and device_type.get("sample_image_id") and not device_type.get("sample_image")
+    }
+    content_hashes = {}
+    if pending:
+        rows = ImageWithoutBlob.prisma(connection).find_many(where={"id": {"in": sorted(pending)}})
+        content_hashes = {row.id: row.content_hash for row in rows}
+
+    for device_type in device_types:
+        if not device_type:
+            continue
+        if device_type.get("sample_image"):
+            content_hash = device_type["sample_image"]["content_hash"]
+        else:
+            content_hash = content_hashes.get(device_type.get("sample_image_id"))
+        device_type["sample_image_url"] = reference_image_url(content_hash) if content_hash else None
+    return device_types
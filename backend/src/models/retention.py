@@ -0,0 +1,117 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/models/retention.py
+Description: Retention of the review images (see the retention_policy model).
+
+The latest review of a device and reviews waiting for approval always keep their image.
+Each review is archived in its own short transaction, the image is read and written to the archive before it.
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+
+from prisma import Prisma
+from prisma.models import retention_policy
+from prisma.partials import ReviewWithoutImage
+from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS
+from src.models.images import hash_data_url, release_image
+from src.schemas.customers import RetentionActionEnum
+from src.schemas.reviews import DeviceReviewAllowedEnums
+from src.services.archive_service import ImageArchive
+
+
+def find_retention_candidates(connection: Prisma, policy: retention_policy, now: datetime) -> List:
+    """
+    Method to find the reviews of a customer whose image is not retained
+    Args:
+        connection (Prisma connection)
+        policy (retention_policy): Retention policy of the customer
+        now (datetime): Reference time of the max_age_days policy (UTC)
+    Returns:
+        List of ReviewWithoutImage, oldest first
+    """
+    if not policy.max_age_days and not policy.keep_latest:
+        return []
+
+    cutoff = now - timedelta(days=policy.max_age_days) if policy.max_age_days else None
+    # The latest review is always kept
+    keep_latest = max(policy.keep_latest, 1) if policy.keep_latest else None
+
+    candidates = []
+    devices = connection.device.find_many(where={"facility": {"customer_id": policy.customer_id}})
+    for device in devices:
+        # Metadata only, ordered like the review history
+        reviews = ReviewWithoutImage.prisma(connection).find_many(
+            where={"device_id": device.id},
+            order=[{"created_at_utc": "desc"}, {"id": "desc"}],
+        )
+        for position, review in enumerate(reviews):
+            if position == 0 or review.archived_at_utc:
+                continue
+            if review.result == DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value:
+                continue
+
+            expired = cutoff is not None and review.created_at_utc.replace(tzinfo=None) < cutoff
+            superseded = keep_latest is not None and position >= keep_latest
+            if expired or superseded:
+                candidates.append(review)
+
+    candidates.sort(key=lambda review: (review.created_at_utc, review.id))
+    return candidates
+
+
+def apply_review_retention(connection: Prisma, archive: ImageArchive, review, action: str) -> bool:
+    """
+    Method to archive or drop the image of a review, the review row is kept
+    Args:
+        connection (Prisma connection)
+        archive (ImageArchive): Image archive
+        review (ReviewWithoutImage): Review returned by find_retention_candidates
+        action (str): RetentionActionEnum value
+    Returns:
+        bool: False if the review was deleted or already archived meanwhile
+    """
+    archive_key = None
+    if action == RetentionActionEnum.ARCHIVE.value:
+        if review.image_id:
+            image = connection.image.find_unique(where={"id": review.image_id})
+            if image:
+                archive_key = archive.put(image.content_hash, image.image_blob)
+        else:
+            # Image in the legacy column
+            legacy = connection.review.find_unique(where={"id": review.id})
+            if legacy and legacy.image_blob:
+                archive_key = archive.put(hash_data_url(legacy.image_blob), legacy.image_blob)
+
+    with connection.tx(
+        max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+        timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+    ) as transaction:
+        updated = transaction.review.update_many(
+            where={"id": review.id, "archived_at_utc": None},
+            data={
+                "archived_at_utc": datetime.utcnow(),
+                "archive_key": archive_key,
+                "image_id": None,
+                "image_blob": "",
+            },
+        )
+        if updated:
+            release_image(transaction, review.image_id)
+
+    return bool(updated)
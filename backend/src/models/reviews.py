@@ -14,10 +14,18 @@
 # limitations under the License.
 # ------------------------------------------------------------------------
 
+import base64
+import binascii
 from datetime import datetime, timedelta, timezone
 from typing import List
 
 from prisma import Prisma
+from prisma.partials import ReviewWithoutImage
+from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS
+from src.models.dialect import get_sql_dialect, sql_param, sql_table, sql_timestamp_param
+from src.models.facility_search import get_facility_search
+from src.models.images import release_image
+from src.models.status_counters import get_status_counts
 from src.schemas import *
 from src.utils import to_list
 from werkzeug.exceptions import BadRequest
@@ -122,19 +130,16 @@ def build_device_query(connection: Prisma, customer_id: int, parameters: ReviewL
     ):
         and_conditions = []
 
-        # Filter by facility name
-        if parameters.facility_name:
-            facility_names = to_list(parameters.facility_name, split_char=" ")
-            for facility_name in facility_names:
-                and_conditions.append({"facility": {"facility_name": {"contains": facility_name}}})
-
-        # Filter by prefecture
-        if parameters.prefecture:
-            and_conditions.append({"facility": {"prefecture": {"contains": parameters.prefecture}}})
-
-        # Filter by municipality
-        if parameters.municipality:
-            and_conditions.append({"facility": {"municipality": {"contains": parameters.municipality}}})
+        # Filter by facility name, prefecture and municipality (index backed, see facility_search)
+        and_conditions.extend(
+            get_facility_search().build_conditions(
+                connection,
+                customer_id=customer_id,
+                facility_names=to_list(parameters.facility_name, split_char=" ") if parameters.facility_name else [],
+                prefecture=parameters.prefecture,
+                municipality=parameters.municipality,
+            )
+        )
 
         # Set the result count conditions
         status_count_filters = and_conditions.copy()
@@ -147,68 +152,136 @@ def build_device_query(connection: Prisma, customer_id: int, parameters: ReviewL
 
     # Query with the given parameters
     data = connection.device.find_many(take=take, skip=skip, where=where, include=include)
-    _where = {"facility": {"customer_id": customer_id}}
 
-    # Check if the any filters are provided by user
-    if status_count_filters:
-        _where["AND"] = status_count_filters
-
-    # Get the status count with user provided condition
-    status_counts = connection.device.group_by(
-        by=["result"],
-        where=_where,
-        count={"result": True},
-    )
+    # Without facility filters, read the maintained counters instead of counting the devices
+    counts = {} if status_count_filters else get_status_counts(connection, customer_id)
+    if counts:
+        statuses = status_to_list(parameters.status) if parameters.status else counts.keys()
+        total_records = sum(counts.get(status, 0) for status in statuses)
+    else:
+        _where = {"facility": {"customer_id": customer_id}}
+
+        # Check if the any filters are provided by user
+        if status_count_filters:
+            _where["AND"] = status_count_filters
+
+        # Get the status count with user provided condition
+        status_counts = connection.device.group_by(
+            by=["result"],
+            where=_where,
+            count={"result": True},
+        )
+        counts = {status_count["result"]: status_count["_count"]["result"] for status_count in status_counts}
+        total_records = connection.device.count(where=where)
 
     # Set status count
     result_count = {}
-    for status_count in status_counts:
-        if status_count["result"] == DeviceReviewAllowedEnums.INITIAL_STATE.value:
+    for result, count in counts.items():
+        if result == DeviceReviewAllowedEnums.INITIAL_STATE.value:
             # 1
-            result_count["initial_state"] = status_count["_count"]["result"]
-        if status_count["result"] == DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value:
+            result_count["initial_state"] = count
+        if result == DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value:
             # 2
-            result_count["requesting"] = status_count["_count"]["result"]
-        if status_count["result"] == DeviceReviewAllowedEnums.REJECTED.value:
+            result_count["requesting"] = count
+        if result == DeviceReviewAllowedEnums.REJECTED.value:
             # 3
-            result_count["rejected"] = status_count["_count"]["result"]
-        if status_count["result"] == DeviceReviewAllowedEnums.APPROVED.value:
+            result_count["rejected"] = count
+        if result == DeviceReviewAllowedEnums.APPROVED.value:
             # 4
-            result_count["approved"] = status_count["_count"]["result"]
+            result_count["approved"] = count
 
-    total_records = connection.device.count(where=where)
     return data, total_records, result_count
 
 
-def get_checking_reviews_info(data: List[ReviewSchema], late_minutes: int) -> dict:
+def get_review_sla_summary(
+    connection: Prisma,
+    admin_id: int,
+    customer_id: int | None,
+    sla_minutes: int,
+    bucket_minutes: List[int],
+) -> List[dict]:
     """
-    Calculates the number of current and late reviews based on the provided data.
+    Method to count the pending (requesting for review) reviews per customer and facility in a single query,
+    served by the (result, created_at_utc) index.
 
     Args:
-        data (List[ReviewSchema]): A list of review objects conforming to the ReviewSchema.
-        late_minutes (int): The threshold in minutes to determine if a review is late.
+        connection (Prisma connection)
+        admin_id (int): Admin ID, all customers of the admin are counted if customer_id is None
+        customer_id (int): Customer ID
+        sla_minutes (int): Pending reviews older than this are overdue
+        bucket_minutes (List[int]): Age bucket boundaries in minutes, e.g. [10, 60] -> 0-10, 10-60, 60-
+    Returns:
+        List of {customer_id, facility_id, pending, overdue, ages: [count per bucket]}
+    """
+    dialect = get_sql_dialect()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    boundaries = sorted(set(bucket_minutes))
+
+    params = [DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value]
+    conditions = [f"r.result = {sql_param(dialect, 1)}"]
+    if customer_id:
+        params.append(customer_id)
+        conditions.append(f"r.customer_id = {sql_param(dialect, len(params))}")
+    else:
+        params.append(admin_id)
+        conditions.append(
+            f"r.customer_id IN (SELECT c.id FROM {sql_table(dialect, 'customer')} c "
+            f"WHERE c.admin_id = {sql_param(dialect, len(params))})"
+        )
+
+    # Creation time cutoff of each age in minutes
+    cutoffs = {}
+    for minutes in [sla_minutes, *boundaries]:
+        if minutes not in cutoffs:
+            params.append((now - timedelta(minutes=minutes)).isoformat())
+            cutoffs[minutes] = sql_timestamp_param(dialect, len(params))
+
+    columns = [f"SUM(CASE WHEN r.created_at_utc <= {cutoffs[sla_minutes]} THEN 1 ELSE 0 END) AS overdue"]
+    for index in range(len(boundaries) + 1):
+        bucket_conditions = []
+        if index > 0:
+            bucket_conditions.append(f"r.created_at_utc <= {cutoffs[boundaries[index - 1]]}")
+        if index < len(boundaries):
+            bucket_conditions.append(f"r.created_at_utc > {cutoffs[boundaries[index]]}")
+        columns.append(f"SUM(CASE WHEN {' AND '.join(bucket_conditions)} THEN 1 ELSE 0 END) AS age_{index}")
+
+    query = (
+        f"SELECT r.customer_id, r.facility_id, COUNT(*) AS pending, {', '.join(columns)} "
+        f"FROM {sql_table(dialect, 'review')} r WHERE {' AND '.join(conditions)} "
+        "GROUP BY r.customer_id, r.facility_id ORDER BY r.customer_id, r.facility_id"
+    )
+    rows = connection.query_raw(query, *params)
 
+    return [
+        {
+            "customer_id": row["customer_id"],
+            "facility_id": row["facility_id"],
+            "pending": int(row["pending"] or 0),
+            "overdue": int(row["overdue"] or 0),
+            "ages": [int(row[f"age_{index}"] or 0) for index in range(len(boundaries) + 1)],
+        }
+        for row in rows
+    ]
+
+
+def get_checking_reviews_info(connection: Prisma, admin_id: int, customer_id: int, late_minutes: int) -> dict:
+    """
+    Calculates the number of pending reviews of the customer and how many of them were requested
+    within the last `late_minutes`.
+
+    Args:
+        connection (Prisma connection)
+        admin_id (int): Admin ID
+        customer_id (int): Customer ID
+        late_minutes (int): The threshold in minutes
     Returns:
         dict: A dictionary containing the count of late reviews, current reviews, and the late minutes threshold.
     """
-    late = 0
-    current = 0
-    for review in data:
-        result = review.result
-        # If the device review status is applied, skip.
-        if result != DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value:
-            continue
-
-        current = current + 1
-        # Difference bw the created datetime and the current time
-        diff = datetime.now(tz=timezone.utc) - review.created_at_utc
-        # Check if the difference is less than the late minutes
-        if review.created_at_utc and diff.seconds < late_minutes * 60:
-            late = late + 1
+    rows = get_review_sla_summary(connection, admin_id, customer_id, late_minutes, [late_minutes])
 
     info = {
-        "late": late,
-        "current": current,
+        "late": sum(row["ages"][0] for row in rows),
+        "current": sum(row["pending"] for row in rows),
         "minutes": late_minutes,
     }
 
@@ -234,3 +307,135 @@ def status_to_list(status_parameter: str) -> List[int]:
         return [int(element) for element in temp_list]
     except ValueError:
         raise BadRequest("Bad request parameter: status")
+
+
+def encode_history_cursor(created_at_utc: datetime, review_id: int) -> str:
+    """
+    Encodes the position of a review in the device history into an opaque cursor.
+
+    Args:
+        created_at_utc (datetime): Creation time of the last review returned.
+        review_id (int): ID of the last review returned. Used as tie breaker.
+
+    Returns:
+        str: URL safe cursor string.
+    """
+    raw = f"{created_at_utc.isoformat()}|{review_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8")
+
+
+def decode_history_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decodes a cursor created by `encode_history_cursor`.
+
+    Args:
+        cursor (str): Cursor string received from the client.
+
+    Returns:
+        tuple[datetime, int]: Creation time and ID of the last review returned.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
+        created_at, review_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(review_id)
+    except (binascii.Error, UnicodeDecodeError) as _exec:
+        raise ValueError("Invalid cursor") from _exec
+
+
+def find_device_review_history(
+    connection: Prisma, device_id: int, limit: int, cursor: str | None = None, include_images: bool = False
+):
+    """
+    Keyset paginated query of the reviews of a device, newest first.
+
+    Reviews are ordered by (created_at_utc, id) descending and the page starts right after
+    the position encoded in `cursor`, so the cost does not depend on how deep the page is.
+    The image column is not selected unless `include_images` is set.
+
+    Args:
+        connection (Prisma connection)
+        device_id (int): Database ID of the device
+        limit (int): Maximum number of reviews to return
+        cursor (str): Cursor returned with the previous page, None for the first page
+        include_images (bool): Whether to select the `image_blob` column and the `image` relation
+
+    Returns:
+        tuple: List of reviews and the cursor of the next page (None on the last page)
+    """
+    where = {"device_id": device_id}
+    if cursor:
+        created_at_utc, review_id = decode_history_cursor(cursor)
+        where["OR"] = [
+            {"created_at_utc": {"lt": created_at_utc}},
+            {"created_at_utc": created_at_utc, "id": {"lt": review_id}},
+        ]
+
+    actions = connection.review if include_images else ReviewWithoutImage.prisma(connection)
+    # Fetch one extra row to know if there is a next page
+    rows = actions.find_many(
+        where=where,
+        include={"image": include_images, "facility": {"include": {"facility_type": True}}},
+        order=[{"created_at_utc": "desc"}, {"id": "desc"}],
+        take=limit + 1,
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_history_cursor(rows[-1].created_at_utc, rows[-1].id)
+
+    return rows, next_cursor
+
+
+def find_latest_reviews(connection: Prisma, device_ids: List[int], include_image: bool = False) -> dict:
+    """
+    Method to get the latest review of each device, with two queries whatever the number of devices:
+    the latest creation time of each device (index on device_id, created_at_utc), then the reviews created then.
+    Args:
+        connection (Prisma connection)
+        device_ids (List[int]): Database IDs of the devices
+        include_image (bool): Whether to select the `image_blob` column and the `image` relation
+    Returns:
+        dict: Device ID -> latest review, devices without reviews are missing
+    """
+    if not device_ids:
+        return {}
+
+    latest = connection.review.group_by(
+        by=["device_id"], where={"device_id": {"in": device_ids}}, max={"created_at_utc": True}
+    )
+    if not latest:
+        return {}
+
+    actions = connection.review if include_image else ReviewWithoutImage.prisma(connection)
+    rows = actions.find_many(
+        where={
+            "OR": [{"device_id": row["device_id"], "created_at_utc": row["_max"]["created_at_utc"]} for row in latest]
+        },
+        include={"image": include_image, "facility": {"include": {"facility_type": True}}},
+        # Reviews created at the same time are ordered by ID, as in the history
+        order=[{"created_at_utc": "desc"}, {"id": "desc"}],
+    )
+
+    reviews = {}
+    for row in rows:
+        reviews.setdefault(row.device_id, row)
+    return reviews
+
+
+def delete_review(connection: Prisma, review):
+    """
+    Method to delete a review and release its image
+    Args:
+        connection (Prisma connection)
+        review: Review to delete, `ReviewWithoutImage` is enough
+    """
+    with connection.tx(
+        max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+        timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+    ) as transaction:
+        transaction.review.delete(where={"id": review.id})
+        release_image(transaction, review.image_id)
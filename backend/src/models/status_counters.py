@@ -0,0 +1,223 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/models/status_counters.py
+Description: Per customer / per facility device result counters.
+
+Every change of `device.result` (or of the device's facility) goes through these helpers
+with the same connection (transaction) as the device write.
+Counters of a customer are built by reconcile_status_counters (scripts/reconcile_status_counters.py),
+until then the counts are read from the device table.
+"""
+
+from datetime import timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from prisma import Prisma
+from src.config import DB_TRANSACTION_MAX_WAIT_SECONDS, DB_TRANSACTION_TIMEOUT_SECONDS
+from src.schemas.reviews import DeviceReviewAllowedEnums
+
+# facility_id of the customer wide counter rows
+CUSTOMER_WIDE = 0
+
+
+def _increment_status_counter(connection: Prisma, customer_id: int, facility_id: int, result: int, delta: int):
+    """
+    Method to add `delta` to a single counter row, creating it if needed
+    """
+    connection.status_counter.upsert(
+        where={
+            "customer_id_facility_id_result": {
+                "customer_id": customer_id,
+                "facility_id": facility_id,
+                "result": result,
+            }
+        },
+        data={
+            "create": {
+                "customer_id": customer_id,
+                "facility_id": facility_id,
+                "result": result,
+                "count": delta,
+            },
+            "update": {"count": {"increment": delta}},
+        },
+    )
+
+
+def _is_initialized(connection: Prisma, customer_id: int) -> bool:
+    """
+    Counters of a customer are only maintained once built by reconcile_status_counters,
+    which always creates the customer wide INITIAL_STATE row
+    """
+    return bool(connection.status_counter.find_first(where={"customer_id": customer_id, "facility_id": CUSTOMER_WIDE}))
+
+
+def adjust_status_counters(connection: Prisma, changes: Iterable[Tuple[int, int, int, int]]):
+    """
+    Method to add deltas to the facility and customer wide counters, for all the devices moved by a transaction.
+    The counter rows are updated in (customer_id, facility_id, result) order, whatever the direction of the
+    changes: transactions moving devices of a customer in opposite directions lock its customer wide rows in
+    the same order and do not deadlock.
+    Nothing is written for customers whose counters were not built yet, their counts are read from the device table.
+    Args:
+        connection (Prisma connection / transaction)
+        changes (Iterable): (customer_id, facility_id, result, delta) of each change, delta +1 / -1
+    """
+    initialized = {}
+    deltas = {}
+    for customer_id, facility_id, result, delta in changes:
+        if customer_id not in initialized:
+            initialized[customer_id] = _is_initialized(connection, customer_id)
+        if not initialized[customer_id]:
+            continue
+        for key in [(customer_id, facility_id, result), (customer_id, CUSTOMER_WIDE, result)]:
+            deltas[key] = deltas.get(key, 0) + delta
+
+    for (customer_id, facility_id, result), delta in sorted(deltas.items()):
+        if delta:
+            _increment_status_counter(connection, customer_id, facility_id, result, delta)
+
+
+def adjust_status_counter(connection: Prisma, customer_id: int, facility_id: int, result: int, delta: int):
+    """
+    Method to add `delta` to the facility and customer wide counters of a result, see adjust_status_counters.
+    Args:
+        connection (Prisma connection / transaction)
+        customer_id (int): Customer ID of the device facility
+        facility_id (int): Facility ID of the device
+        result (int): Device result
+        delta (int): +1 / -1
+    """
+    adjust_status_counters(connection, [(customer_id, facility_id, result, delta)])
+
+
+def move_facility_status_counters(connection: Prisma, facility_id: int, from_customer_id: int, to_customer_id: int):
+    """
+    Method to move the counters of a facility assigned to another customer.
+    The rows are locked in the order of adjust_status_counters (customer wide rows before the facility rows).
+    Args:
+        connection (Prisma connection / transaction)
+        facility_id (int): Facility ID
+        from_customer_id (int): Previous customer ID of the facility
+        to_customer_id (int): New customer ID of the facility
+    """
+    rows = connection.device.group_by(by=["result"], where={"facility_id": facility_id}, count={"_all": True})
+    counts = sorted((row["result"], row["_count"]["_all"]) for row in rows)
+
+    for customer_id, sign in sorted([(from_customer_id, -1), (to_customer_id, 1)]):
+        if not _is_initialized(connection, customer_id):
+            continue
+
+        for result, count in counts:
+            _increment_status_counter(connection, customer_id, CUSTOMER_WIDE, result, sign * count)
+        # Facility rows of the new customer are rebuilt from the device table
+        connection.status_counter.delete_many(where={"customer_id": customer_id, "facility_id": facility_id})
+        if sign > 0:
+            for result, count in counts:
+                _increment_status_counter(connection, customer_id, facility_id, result, count)
+
+
+def lock_device(connection: Prisma, device_id: int) -> bool:
+    """
+    Method to lock the device row until the end of the transaction, with a no-op update (portable across
+    Postgres and SQL Server). Concurrent transactions writing the reviews / result of the device wait for it,
+    and their next statements see what it committed.
+    Args:
+        connection (Prisma transaction)
+        device_id (int): Device DB ID
+    Returns:
+        bool: False if the device does not exist
+    """
+    return connection.device.update_many(where={"id": device_id}, data={"result": {"increment": 0}}) > 0
+
+
+def set_device_result(connection: Prisma, device_id: int, result: int):
+    """
+    Method to update the device result and the status counters.
+    The device row is locked before its result is read, so the counters move from the committed result.
+    Args:
+        connection (Prisma connection / transaction)
+        device_id (int): Device DB ID
+        result (int): New device result
+    Returns:
+        Updated device or None
+    """
+    if not lock_device(connection, device_id):
+        return None
+
+    device = connection.device.find_unique(where={"id": device_id}, include={"facility": True})
+    if not device:
+        return None
+
+    updated_device = connection.device.update(where={"id": device_id}, data={"result": result})
+    if device.result != result:
+        customer_id = device.facility.customer_id
+        adjust_status_counters(
+            connection,
+            [(customer_id, device.facility_id, device.result, -1), (customer_id, device.facility_id, result, 1)],
+        )
+
+    return updated_device
+
+
+def get_status_counts(connection: Prisma, customer_id: int, facility_id: int = CUSTOMER_WIDE) -> Dict[int, int]:
+    """
+    Method to read the counters of a customer (or of one facility)
+    Args:
+        connection (Prisma connection)
+        customer_id (int): Customer ID
+        facility_id (int): Facility ID, customer wide counts by default
+    Returns:
+        dict: result -> count, empty if the counters were not built for the customer
+    """
+    counters = connection.status_counter.find_many(where={"customer_id": customer_id, "facility_id": facility_id})
+    return {counter.result: counter.count for counter in counters}
+
+
+def reconcile_status_counters(connection: Prisma, customer_ids: List[int]):
+    """
+    Method to rebuild the counters of the given customers from the device table
+    Args:
+        connection (Prisma connection)
+        customer_ids (List[int]): Customer IDs
+    """
+    for customer_id in customer_ids:
+        with connection.tx(
+            max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+            timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+        ) as transaction:
+            rows = transaction.device.group_by(
+                by=["facility_id", "result"],
+                where={"facility": {"customer_id": customer_id}},
+                count={"_all": True},
+            )
+
+            # The customer wide INITIAL_STATE row marks the counters as built, even without devices
+            counts = {(CUSTOMER_WIDE, DeviceReviewAllowedEnums.INITIAL_STATE.value): 0}
+            for row in rows:
+                for _facility_id in [row["facility_id"], CUSTOMER_WIDE]:
+                    key = (_facility_id, row["result"])
+                    counts[key] = counts.get(key, 0) + row["_count"]["_all"]
+
+            transaction.status_counter.delete_many(where={"customer_id": customer_id})
+            transaction.status_counter.create_many(
+                data=[
+                    {"customer_id": customer_id, "facility_id": _facility_id, "result": result, "count": count}
+                    for (_facility_id, result), count in counts.items()
+                ]
+            )
@@ -0,0 +1,173 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/models/uploads.py
+Description: Resumable (chunked) image uploads of the contractor app.
+
+Chunks are appended in order: a chunk is only accepted at the offset equal to the received size,
+so a client resumes an interrupted upload from the `received_bytes` of the session.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+from prisma import Base64, Prisma
+from prisma.models import upload_session
+from src.config import (
+    DB_TRANSACTION_MAX_WAIT_SECONDS,
+    DB_TRANSACTION_TIMEOUT_SECONDS,
+    UPLOAD_SESSION_TTL_SECONDS,
+)
+from src.exceptions import APIException, ErrorCodes
+from src.services.image_service import HEADER_BYTES, detect_image_mime_type
+from src.services.review_image_service import ImageUploadBuffer
+
+
+def create_upload_session(connection: Prisma, device_id: int, facility_id: int, total_bytes: int) -> upload_session:
+    """
+    Method to create an upload session and purge the expired ones
+    Args:
+        connection (Prisma connection)
+        device_id (int): Device DB ID
+        facility_id (int): Facility ID of the contractor token
+        total_bytes (int): Size of the image to upload
+    Returns:
+        upload_session: Created session
+    """
+    now = datetime.utcnow()
+    # Chunks are deleted along with their session
+    connection.upload_session.delete_many(where={"expires_at_utc": {"lt": now}})
+
+    return connection.upload_session.create(
+        data={
+            "upload_uuid": str(uuid.uuid4()),
+            "device_id": device_id,
+            "facility_id": facility_id,
+            "total_bytes": total_bytes,
+            "expires_at_utc": now + timedelta(seconds=UPLOAD_SESSION_TTL_SECONDS),
+        }
+    )
+
+
+def get_upload_session(connection: Prisma, upload_id: str, facility_id: int) -> upload_session:
+    """
+    Method to get a not expired upload session of the facility
+    Args:
+        connection (Prisma connection)
+        upload_id (str): Upload ID
+        facility_id (int): Facility ID of the contractor token
+    Returns:
+        upload_session
+    Raises:
+        APIException: UPLOAD_NOT_FOUND
+    """
+    session = connection.upload_session.find_unique(where={"upload_uuid": upload_id})
+    if (
+        not session
+        or session.facility_id != facility_id
+        or session.expires_at_utc.replace(tzinfo=None) < datetime.utcnow()
+    ):
+        raise APIException(ErrorCodes.UPLOAD_NOT_FOUND)
+
+    return session
+
+
+def append_upload_chunk(connection: Prisma, session: upload_session, offset: int, data: bytes) -> int:
+    """
+    Method to store a chunk at the end of the received data
+    Args:
+        connection (Prisma connection)
+        session (upload_session): Upload session
+        offset (int): Offset of the chunk in the image
+        data (bytes): Chunk data
+    Returns:
+        int: Received size after the chunk
+    Raises:
+        APIException: UPLOAD_OFFSET_MISMATCH, IMAGE_TOO_LARGE or INVALID_IMAGE_FORMAT
+    """
+    if offset != session.received_bytes:
+        raise APIException(ErrorCodes.UPLOAD_OFFSET_MISMATCH)
+
+    if offset + len(data) > session.total_bytes:
+        raise APIException(ErrorCodes.IMAGE_TOO_LARGE)
+
+    # Check the image header with the first chunk
+    if offset == 0 and (len(data) >= HEADER_BYTES or len(data) == session.total_bytes):
+        detect_image_mime_type(data[:HEADER_BYTES])
+
+    with connection.tx(
+        max_wait=timedelta(seconds=DB_TRANSACTION_MAX_WAIT_SECONDS),
+        timeout=timedelta(seconds=DB_TRANSACTION_TIMEOUT_SECONDS),
+    ) as transaction:
+        # Conditional increment, a concurrent request with the same offset updates nothing
+        updated = transaction.upload_session.update_many(
+            where={"id": session.id, "received_bytes": offset},
+            data={"received_bytes": {"increment": len(data)}},
+        )
+        if not updated:
+            raise APIException(ErrorCodes.UPLOAD_OFFSET_MISMATCH)
+
+        transaction.upload_chunk.create(data={"session_id": session.id, "offset": offset, "data": Base64.encode(data)})
+
+    return offset + len(data)
+
+
+def assemble_upload(connection: Prisma, session: upload_session) -> ImageUploadBuffer:
+    """
+    Method to join the chunks of a complete upload, one chunk in memory at a time
+    Args:
+        connection (Prisma connection)
+        session (upload_session): Upload session
+    Returns:
+        ImageUploadBuffer: Validated image, to be closed by the caller
+    Raises:
+        APIException: UPLOAD_INCOMPLETE, IMAGE_TOO_LARGE or INVALID_IMAGE_FORMAT
+    """
+    if session.received_bytes != session.total_bytes:
+        raise APIException(ErrorCodes.UPLOAD_INCOMPLETE)
+
+    buffer = ImageUploadBuffer()
+    try:
+        offset = 0
+        while offset < session.total_bytes:
+            chunk = connection.upload_chunk.find_unique(
+                where={"session_id_offset": {"session_id": session.id, "offset": offset}}
+            )
+            if not chunk:
+                raise APIException(ErrorCodes.UPLOAD_INCOMPLETE)
+
+            data = chunk.data.decode()
+            buffer.write(data)
+            offset += len(data)
+    except Exception:
+        buffer.close()
+        raise
+
+    return buffer
+
+
+def complete_upload_session(connection: Prisma, session: upload_session, review_id: int):
+    """
+    Method to record the review created from an upload session and delete its chunks.
+    The session is kept until it expires, so a repeated complete request gets the same review.
+    Args:
+        connection (Prisma connection / transaction)
+        session (upload_session): Upload session
+        review_id (int): Created review ID
+    """
+    connection.upload_session.update_many(where={"id": session.id}, data={"review_id": review_id})
+    connection.upload_chunk.delete_many(where={"session_id": session.id})
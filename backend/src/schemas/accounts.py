@@ -19,7 +19,7 @@ from typing import Annotated
 
 from pydantic import BaseModel, StringConstraints, field_validator
 from src.config import REGEX_FOR_LOGIN_ID, REGEX_FOR_LOGIN_PASSWORD
-from src.exceptions import APIException, ErrorCodes
+from src.exceptions import APIException, ErrorCodes, with_message
 
 from .reviews import BaseGetResponseSchema
 
@@ -87,9 +87,7 @@ class AdminCreateRequestSchema(BaseModel):
                 "3. Digits (0-9)\n"
                 "4. Special characters (_, -, !, $, #, %, @)"
             )
-            _ec = ErrorCodes.VALUE_ERROR.copy()
-            _ec["message"] = error_message
-            raise APIException(_ec)
+            raise APIException(with_message(ErrorCodes.VALUE_ERROR, error_message))
         return password
 
 
@@ -15,9 +15,10 @@
 # ------------------------------------------------------------------------
 
 from datetime import datetime
+from enum import Enum
 from typing import Annotated, List
 
-from pydantic import BaseModel, StringConstraints, field_serializer
+from pydantic import BaseModel, Field, StringConstraints, field_serializer
 from src.config import REGEX_FOR_NAME, REGEX_FOR_URL
 from src.utils import serialize_datetime
 
@@ -137,3 +138,34 @@ class CreateCustomerResponseSchema(BaseModel):
 
     id: int
     customer_name: str
+
+
+class RetentionActionEnum(str, Enum):
+    """
+    What happens to the review images not retained
+    """
+
+    ARCHIVE = "archive"
+    DROP = "drop"
+
+
+class RetentionPolicyRequestSchema(BaseModel):
+    """
+    Request schema for PUT /customers/{customer_id}/retention-policy.
+    Images are retained indefinitely when both max_age_days and keep_latest are null.
+    """
+
+    max_age_days: Annotated[int, Field(gt=0)] | None = None
+    keep_latest: Annotated[int, Field(gt=0)] | None = None
+    action: RetentionActionEnum = RetentionActionEnum.ARCHIVE
+
+
+class RetentionPolicyGetResponseSchema(BaseGetResponseSchema):
+    """
+    Response schema for GET / PUT /customers/{customer_id}/retention-policy
+    """
+
+    customer_id: int
+    max_age_days: int | None = None
+    keep_latest: int | None = None
+    action: RetentionActionEnum = RetentionActionEnum.ARCHIVE
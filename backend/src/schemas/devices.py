@@ -18,7 +18,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field, StringConstraints, field_serializer
+from pydantic import BaseModel, Field, StringConstraints, field_serializer, model_validator
 from src.config import REGEX_FOR_NAME
 from src.utils import serialize_datetime
 
@@ -40,6 +40,18 @@ class DeviceTypeSchema(BaseModel):
     last_updated_by: str | None = "system"
     last_updated_at_utc: datetime
     sample_image_blob: str | None = ""
+    # Cacheable URL of the reference image, see add_reference_image_urls
+    sample_image_url: str | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_sample_image(cls, data):
+        """
+        Uses the deduplicated image (`sample_image` relation) when it is loaded
+        """
+        if isinstance(data, dict) and data.get("sample_image"):
+            data = {**data, "sample_image_blob": data["sample_image"]["image_blob"]}
+        return data
 
     @field_serializer("created_at_utc", "last_updated_at_utc")
     def serialize_datetime(self, datetime_field: datetime):
@@ -185,14 +197,16 @@ class DeviceTypeResponseSchema(BaseModel):
 
     id: int
     name: str
+    sample_image_url: str | None = None
 
 
 class DeviceTypeListResponseSchema(ListResponseHTTPSchema):
     """
-    Response schema for GET /device-types
+    Response schema for GET /device-types, items are DeviceTypeSchema restricted to the selected fields
+    (DeviceTypeResponseSchema by default)
     """
 
-    data: List[DeviceTypeResponseSchema] = []
+    data: List[dict] = []
 
 
 class EditDeviceTypeRequestSchema(BaseModel):
@@ -84,9 +84,13 @@ class FacilityImageListRequestSchema(BaseModel):
 class FacilityImageGetResponseSchema(BaseModel):
     device_id: int
     device_image: str | None = None
+    # Inline only for the reference images not moved to the image table yet, sample_image_url otherwise
     sample_image: str | None = None
+    sample_image_url: str | None = None
     retrieved_date: datetime
     comment: str | None = None
+    # Capture ID of device_image, to create the review without uploading the image
+    capture_id: str | None = None
 
 
 class FacilityQRResponseSchema(BaseModel):
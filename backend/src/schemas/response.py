@@ -48,8 +48,12 @@ class ListResponseHTTPSchema(BaseModel):
     size: int | None = None
     total: int | None = None
 
-    def make_response(self):
-        return self.model_dump(), self.status_code
+    def make_response(self, fields=None):
+        """
+        Args:
+            fields (FieldSelection): Sparse fieldset of the response (src/libs/fields.py), all fields if None
+        """
+        return (fields.dump(self) if fields else self.model_dump()), self.status_code
 
 
 class BaseListResponseSchema(BaseModel):
@@ -18,10 +18,11 @@ from datetime import datetime
 from enum import Enum, IntEnum
 from typing import Annotated, List
 
-from pydantic import BaseModel, Field, StringConstraints, field_serializer
+from pydantic import BaseModel, Field, StringConstraints, field_serializer, model_validator
+from src.config import MAX_IMAGE_UPLOAD_BYTES
 from src.utils import serialize_datetime
 
-from .devices import DeviceGetResponseSchema
+from .devices import DeviceGetResponseSchema, DeviceSchema
 from .facilities import FacilityGetResponseSchema
 from .response import BaseGetResponseSchema, ListResponseHTTPSchema, PaginationReviewSchema
 
@@ -44,8 +45,19 @@ class ReviewSchema(BaseModel):
     created_at_utc: datetime
     last_updated_by: str
     last_updated_at_utc: datetime
+    archived_at_utc: datetime | None = None
 
-    @field_serializer("image_date_utc", "created_at_utc", "last_updated_at_utc")
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_image(cls, data):
+        """
+        Uses the deduplicated image (`image` relation) when it is loaded
+        """
+        if isinstance(data, dict) and data.get("image"):
+            data = {**data, "image_blob": data["image"]["image_blob"]}
+        return data
+
+    @field_serializer("image_date_utc", "created_at_utc", "last_updated_at_utc", "archived_at_utc")
     def serialize_datetime(self, datetime_field: datetime):
         """
         Serializes datetime fields to ISO format
@@ -94,6 +106,15 @@ class ReviewGetSchema(ReviewSchema):
     image_blob: str | None = None
 
 
+class DeviceLatestReviewSchema(BaseModel):
+    """
+    Item of GET /reviews/latest
+    """
+
+    device: DeviceSchema
+    latest_review: ReviewSchema | dict = {}
+
+
 class ReviewListResponseSchema(ListResponseHTTPSchema):
     """
     Response schema for GET /reviews
@@ -104,6 +125,42 @@ class ReviewListResponseSchema(ListResponseHTTPSchema):
     status_count: dict | None = None
 
 
+class ReviewSlaBucketSchema(BaseModel):
+    """
+    Age bucket of GET /reviews/sla, max_minutes is None for the last bucket
+    """
+
+    min_minutes: int
+    max_minutes: int | None = None
+
+
+class ReviewSlaCountSchema(BaseModel):
+    pending: int = 0
+    overdue: int = 0
+    # Pending review count per age bucket
+    ages: List[int] = []
+
+
+class ReviewSlaFacilitySchema(ReviewSlaCountSchema):
+    facility_id: int
+    facility_name: str | None = None
+
+
+class ReviewSlaCustomerSchema(ReviewSlaCountSchema):
+    customer_id: int
+    facilities: List[ReviewSlaFacilitySchema] = []
+
+
+class ReviewSlaGetResponseSchema(BaseGetResponseSchema):
+    """
+    Response schema for GET /reviews/sla
+    """
+
+    sla_minutes: int
+    buckets: List[ReviewSlaBucketSchema] = []
+    customers: List[ReviewSlaCustomerSchema] = []
+
+
 class ReviewGetResponseSchema(BaseGetResponseSchema, ReviewSchema):
     """
     Response schema for GET /reviews/{id}
@@ -189,10 +246,51 @@ class CreateReviewRequestSchema(BaseModel):
     """
 
     device_id: Annotated[int, Field(gt=0)]
-    image: Annotated[
-        str,
-        StringConstraints(strip_whitespace=True, strict=True, min_length=1),
-    ]
+    image: (
+        Annotated[
+            str,
+            StringConstraints(strip_whitespace=True, strict=True, min_length=1),
+        ]
+        | None
+    ) = None
+    # Capture ID of GET /facility/devices/<id>/images, `image` is used if the capture has expired
+    capture_id: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=36)] | None = None
+
+    @model_validator(mode="after")
+    def check_image_or_capture(self):
+        if not self.image and not self.capture_id:
+            raise ValueError("image or capture_id is required")
+        return self
+
+
+class CreateUploadRequestSchema(BaseModel):
+    """
+    Request schema for POST /reviews/uploads
+    """
+
+    device_id: Annotated[int, Field(gt=0)]
+    total_bytes: Annotated[int, Field(gt=0, le=MAX_IMAGE_UPLOAD_BYTES)]
+
+
+class UploadGetResponseSchema(BaseGetResponseSchema):
+    """
+    Response schema for POST /reviews/uploads, GET and PUT /reviews/uploads/{upload_id}
+    """
+
+    upload_id: str
+    device_id: int
+    total_bytes: int
+    received_bytes: int
+    chunk_size: int
+    expires_at_utc: datetime
+    review_id: int | None = None
+
+    @field_serializer("expires_at_utc")
+    def serialize_datetime(self, datetime_field: datetime):
+        """
+        Serializes datetime fields to ISO format
+        """
+        return serialize_datetime(datetime_field=datetime_field)
 
 
 class UpdateReviewRequestSchema(BaseModel):
@@ -214,3 +312,23 @@ class DeviceReviewHistorySchema(ListResponseHTTPSchema):
     reviews: List[ReviewGetResponseSchema] | None = []
     device: DeviceGetResponseSchema
     total: int | None = 0
+
+
+class DeviceReviewHistoryCursorSchema(ListResponseHTTPSchema):
+    """
+    Response schema for GET /reviews/devices/{device_id}/history/cursor
+    """
+
+    reviews: List[ReviewSchema] | None = []
+    device: DeviceGetResponseSchema
+    next_cursor: str | None = None
+    has_more: bool = False
+
+
+class ReviewImageGetResponseSchema(BaseGetResponseSchema):
+    """
+    Response schema for GET /reviews/{id}/image
+    """
+
+    id: int
+    image_blob: str | None = None
@@ -19,8 +19,11 @@ File: backend/src/services/aitrios_service.py
 """
 import msal
 import requests
+from opentelemetry.trace import SpanKind
 from src.config import HTTP_TIMEOUT
 from src.exceptions import APIException, ErrorCodes, InvalidAuthTokenException
+from src.libs.metrics import observe_aitrios_call
+from src.libs.tracing import traced
 from src.logger import get_json_logger
 from src.schemas.devices import AitriosDeviceSchema, DeviceStatusSchema
 from src.services.aitrios_service_v1 import AitriosServiceV1
@@ -84,6 +87,8 @@ def fetch_images_by_device_id(device_id: str, customer: dict):
     return None
 
 
+@traced("aitrios get_access_token", kind=SpanKind.CLIENT)
+@observe_aitrios_call("-", "get_access_token")
 def get_aitrios_access_token(customer: dict) -> str:
     """
     Method to get the AITRIOS access token
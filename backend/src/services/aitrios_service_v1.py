@@ -19,9 +19,12 @@ File: backend/src/services/aitrios_service_v1.py
 """
 
 import requests
+from opentelemetry.trace import SpanKind
 from retry import retry
 from src.config import HTTP_TIMEOUT, SSL_VERIFICATION
 from src.exceptions import APIException, ErrorCodes, InvalidBaseURLException, RetryAPIException
+from src.libs.metrics import observe_aitrios_call
+from src.libs.tracing import traced
 from src.logger import get_json_logger
 from src.schemas.devices import AitriosDeviceSchema
 from src.services.aitrios_strategy import AitriosServiceStrategy
@@ -39,7 +42,10 @@ class AitriosServiceV1(AitriosServiceStrategy):
     Service class that interacts with the AITRIOS V1 API to retrieve device images and device information.
     """
 
+    @traced("aitrios get_device_image", {"aitrios.api_version": "v1"})
     @retry(exceptions=(RetryAPIException,), tries=RETRIES, delay=DELAY_SECS, backoff=BACKOFF_SECS)
+    @traced("aitrios get_device_image attempt", {"aitrios.api_version": "v1"}, SpanKind.CLIENT)
+    @observe_aitrios_call("v1", "get_device_image")
     def get_device_image(self, device_id: str, base_url: str, access_token: str):
         """
         Method to get the images by device ID
@@ -85,7 +91,10 @@ class AitriosServiceV1(AitriosServiceStrategy):
         # Aitrios always return jpeg image
         return content
 
+    @traced("aitrios get_devices", {"aitrios.api_version": "v1"})
     @retry(exceptions=(RetryAPIException,), tries=RETRIES, delay=DELAY_SECS, backoff=BACKOFF_SECS)
+    @traced("aitrios get_devices attempt", {"aitrios.api_version": "v1"}, SpanKind.CLIENT)
+    @observe_aitrios_call("v1", "get_devices")
     def get_devices(self, base_url: str, access_token: str, device_ids: str):
         """
         Method to get devices
@@ -20,9 +20,12 @@ File: backend/src/services/aitrios_service_v2.py
 import json
 
 import requests
+from opentelemetry.trace import SpanKind
 from retry import retry
 from src.config import HTTP_TIMEOUT, SSL_VERIFICATION
 from src.exceptions import APIException, ErrorCodes, InvalidBaseURLException, RetryAPIException
+from src.libs.metrics import observe_aitrios_call
+from src.libs.tracing import traced
 from src.logger import get_json_logger
 from src.schemas.devices import AitriosDeviceSchema
 from src.services.aitrios_strategy import AitriosServiceStrategy
@@ -40,7 +43,10 @@ class AitriosServiceV2(AitriosServiceStrategy):
     Service class that interacts with the AITRIOS V2 API to retrieve device images and device information.
     """
 
+    @traced("aitrios get_device_image", {"aitrios.api_version": "v2"})
     @retry(exceptions=(RetryAPIException,), tries=RETRIES, delay=DELAY_SECS, backoff=BACKOFF_SECS)
+    @traced("aitrios get_device_image attempt", {"aitrios.api_version": "v2"}, SpanKind.CLIENT)
+    @observe_aitrios_call("v2", "get_device_image")
     def get_device_image(self, device_id: str, base_url: str, access_token: str):
         """
         Method to get the images by device ID
@@ -94,7 +100,10 @@ class AitriosServiceV2(AitriosServiceStrategy):
         # Aitrios always return jpeg image
         return image
 
+    @traced("aitrios get_devices", {"aitrios.api_version": "v2"})
     @retry(exceptions=(RetryAPIException,), tries=RETRIES, delay=DELAY_SECS, backoff=BACKOFF_SECS)
+    @traced("aitrios get_devices attempt", {"aitrios.api_version": "v2"}, SpanKind.CLIENT)
+    @observe_aitrios_call("v2", "get_devices")
     def get_devices(self, base_url: str, access_token: str, device_ids: str):
         """
         Method to get devices
@@ -0,0 +1,106 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/services/archive_service.py
+Description: Cold storage of the review images removed from the DB by the retention policies.
+
+Images are keyed by their content hash, so an image shared by several reviews is archived once.
+"""
+
+import gzip
+import os
+import tempfile
+from abc import ABC, abstractmethod
+
+from src.config import ARCHIVE_DIR
+
+
+# Strategy Interface
+class ImageArchive(ABC):
+    @abstractmethod
+    def put(self, content_hash: str, image: str) -> str:
+        """
+        Stores an image, nothing is written if the image is already archived
+        Args:
+            content_hash (str): Content hash of the image
+            image (str): base64 data URL of the image
+        Returns:
+            str: Archive key of the image
+        """
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """
+        Reads an archived image
+        Args:
+            key (str): Archive key returned by put
+        Returns:
+            str: base64 data URL of the image, None if not found
+        """
+        pass
+
+
+class FileImageArchive(ImageArchive):
+    """
+    gzip compressed files under ARCHIVE_DIR (a mounted volume / file share in the cloud deployments),
+    as <first 2 chars of the hash>/<hash>.gz
+    """
+
+    def __init__(self, root: str = ARCHIVE_DIR):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        path = os.path.realpath(os.path.join(self.root, key))
+        if not path.startswith(os.path.realpath(self.root) + os.sep):
+            raise ValueError(f"Invalid archive key {key}")
+        return path
+
+    def put(self, content_hash, image):
+        key = f"{content_hash[:2]}/{content_hash}.gz"
+        path = self._path(key)
+        if os.path.exists(path):
+            return key
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written to a temporary file first, so a partially written archive is never read
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(gzip.compress(image.encode("ascii"), compresslevel=9))
+            os.replace(temp_path, path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+        return key
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "rb") as file:
+                return gzip.decompress(file.read()).decode("ascii")
+        except FileNotFoundError:
+            return None
+
+
+def get_image_archive() -> ImageArchive:
+    """
+    Method to get the image archive
+    Returns:
+        ImageArchive
+    """
+    return FileImageArchive()
@@ -0,0 +1,163 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/services/image_service.py
+Description: Ingest time normalization of the stored images (review images, captures and device type
+sample images).
+
+Images are checked from their header, rotated by their EXIF orientation, downscaled to IMAGE_MAX_DIMENSION
+and re-encoded as IMAGE_FORMAT at IMAGE_QUALITY. EXIF, ICC profiles and other metadata are not kept.
+"""
+
+import base64
+import binascii
+from io import BytesIO
+from typing import BinaryIO, Tuple
+
+from PIL import Image, ImageOps, features
+from src.config import IMAGE_FORMAT, IMAGE_MAX_DIMENSION, IMAGE_QUALITY
+from src.exceptions import APIException, ErrorCodes
+
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# PNG signature followed by the IHDR chunk length (13) and type
+PNG_HEADER = PNG_SIGNATURE + b"\x00\x00\x00\x0dIHDR"
+# RIFF container (followed by the 4 bytes of its size) of a WEBP image, as stored after normalization
+RIFF_SIGNATURE = b"RIFF"
+WEBP_FORM_TYPE = b"WEBP"
+HEADER_BYTES = len(PNG_HEADER)
+
+# Base64 characters decoded to check the header of a data URL before decoding the whole image
+HEADER_BASE64_CHARS = 4 * ((HEADER_BYTES + 2) // 3)
+
+
+def detect_image_mime_type(header: bytes) -> str:
+    """
+    Method to check the image header
+    Args:
+        header (bytes): First HEADER_BYTES bytes of the image (or the whole image if shorter)
+    Returns:
+        str: image/jpeg, image/png or image/webp
+    Raises:
+        APIException: INVALID_IMAGE_FORMAT if the header is neither JPEG, PNG nor WEBP
+    """
+    if header.startswith(JPEG_SIGNATURE):
+        return "image/jpeg"
+
+    if header.startswith(PNG_HEADER):
+        return "image/png"
+
+    # Stored images are sent back as is (device type edit dialog, data migration export)
+    if header.startswith(RIFF_SIGNATURE) and header[8:12] == WEBP_FORM_TYPE:
+        return "image/webp"
+
+    raise APIException(ErrorCodes.INVALID_IMAGE_FORMAT)
+
+
+def _get_output_format() -> str:
+    # WEBP needs Pillow built with libwebp, JPEG is always available
+    if IMAGE_FORMAT == "WEBP" and not features.check("webp"):
+        return "JPEG"
+    return IMAGE_FORMAT
+
+
+def normalize_image(file: BinaryIO) -> Tuple[bytes, str]:
+    """
+    Method to re-encode an image without metadata and with the resolution capped
+    Args:
+        file (BinaryIO): JPEG, PNG or WEBP image, positioned at the start
+    Returns:
+        bytes: Encoded image
+        str: MIME type of the encoded image
+    Raises:
+        APIException: INVALID_IMAGE_FORMAT if the image is not a readable JPEG, PNG or WEBP
+    """
+    output_format = _get_output_format()
+    try:
+        image = Image.open(file)
+        if image.format not in ("JPEG", "PNG", "WEBP"):
+            raise APIException(ErrorCodes.INVALID_IMAGE_FORMAT)
+
+        # JPEG images are decoded at a reduced scale (DCT scaling), still at least the target size
+        image.draft("RGB", (IMAGE_MAX_DIMENSION, IMAGE_MAX_DIMENSION))
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((IMAGE_MAX_DIMENSION, IMAGE_MAX_DIMENSION), Image.Resampling.LANCZOS)
+
+        if output_format == "JPEG" and image.mode != "RGB":
+            # JPEG has no alpha channel, transparent areas become white
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel("A"))
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or "A" in image.mode else "RGB")
+
+        output = BytesIO()
+        # exif / icc_profile are not passed to save, so no metadata is written
+        image.save(output, format=output_format, quality=IMAGE_QUALITY, optimize=True)
+    except APIException:
+        raise
+    except Exception as _exec:
+        raise APIException(ErrorCodes.INVALID_IMAGE_FORMAT) from _exec
+
+    return output.getvalue(), f"image/{output_format.lower()}"
+
+
+def to_data_url(data: bytes, mime_type: str) -> str:
+    """
+    Method to encode an image in the format stored in the DB
+    Args:
+        data (bytes): Encoded image
+        mime_type (str): MIME type of the image
+    Returns:
+        str: data:<mime type>;base64,<data>
+    """
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def decode_base64_image(image: str) -> bytes:
+    """
+    Method to decode an image sent as a base64 data URL (or bare base64 string)
+    Args:
+        image (str): data:image/<type>;base64,<data> or base64 data
+    Returns:
+        bytes: JPEG, PNG or WEBP image
+    Raises:
+        APIException: INVALID_IMAGE_FORMAT
+    """
+    header, _, encoded = image.rpartition(",")
+    if header and not header.startswith("data:image/"):
+        raise APIException(ErrorCodes.INVALID_IMAGE_FORMAT)
+
+    try:
+        # Reject other formats before decoding the whole image
+        detect_image_mime_type(base64.b64decode(encoded[:HEADER_BASE64_CHARS]))
+        return base64.b64decode(encoded)
+    except (binascii.Error, ValueError) as _exec:
+        raise APIException(ErrorCodes.INVALID_IMAGE_FORMAT) from _exec
+
+
+def normalize_base64_image(image: str) -> str:
+    """
+    Method to normalize an image sent as a base64 data URL (or bare base64 string)
+    Args:
+        image (str): data:image/<type>;base64,<data> or base64 data
+    Returns:
+        str: Normalized image as data URL
+    Raises:
+        APIException: INVALID_IMAGE_FORMAT
+    """
+    return to_data_url(*normalize_image(BytesIO(decode_base64_image(image))))
@@ -0,0 +1,216 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+"""
+File: backend/src/services/review_image_service.py
+Description: Streaming upload of review images (raw body or multipart/form-data).
+
+The request body is read in IMAGE_UPLOAD_CHUNK_BYTES chunks, the image header is checked as soon as
+enough bytes are received and the upload is rejected once it exceeds MAX_IMAGE_UPLOAD_BYTES.
+Received bytes are kept in a spooled temporary file, so only IMAGE_UPLOAD_SPOOL_BYTES stay in memory
+until the image is normalized for the DB (see image_service.py).
+"""
+
+import hashlib
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Dict, Tuple
+
+from src.config import IMAGE_UPLOAD_CHUNK_BYTES, IMAGE_UPLOAD_SPOOL_BYTES, MAX_IMAGE_UPLOAD_BYTES
+from src.exceptions import APIException, ErrorCodes
+from src.services.image_service import HEADER_BYTES, detect_image_mime_type, normalize_image, to_data_url
+from werkzeug.sansio.multipart import Data, Epilogue, Field, File, MultipartDecoder, NeedData
+
+# Allowance for the multipart boundaries, part headers and form fields
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+MAX_FORM_FIELD_BYTES = 1024
+
+
+class ImageUploadBuffer:
+    """
+    Receives an image in chunks, validates it incrementally and encodes it normalized as a base64 data URL.
+    """
+
+    def __init__(self, max_bytes: int = MAX_IMAGE_UPLOAD_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.mime_type = None
+        self._header = b""
+        self._sha256 = hashlib.sha256()
+        self._file = SpooledTemporaryFile(max_size=IMAGE_UPLOAD_SPOOL_BYTES)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, chunk: bytes):
+        """
+        Method to append a chunk of the image
+        Args:
+            chunk (bytes): Image bytes
+        Raises:
+            APIException: IMAGE_TOO_LARGE or INVALID_IMAGE_FORMAT
+        """
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise APIException(ErrorCodes.IMAGE_TOO_LARGE)
+
+        if self.mime_type is None:
+            self._header += chunk[: HEADER_BYTES - len(self._header)]
+            if len(self._header) == HEADER_BYTES:
+                self.mime_type = detect_image_mime_type(self._header)
+
+        self._sha256.update(chunk)
+        self._file.write(chunk)
+
+    @property
+    def source_hash(self) -> str:
+        """
+        SHA-256 of the received bytes, to find an already stored copy of the image
+        """
+        return self._sha256.hexdigest()
+
+    def to_data_url(self) -> str:
+        """
+        Method to normalize the complete image and encode it in the format stored in the DB
+        Returns:
+            str: data:image/<type>;base64,<data>
+        Raises:
+            APIException: INVALID_IMAGE_FORMAT if the image is empty, truncated or not readable
+        """
+        if self.mime_type is None:
+            self.mime_type = detect_image_mime_type(self._header)
+
+        self._file.seek(0)
+        return to_data_url(*normalize_image(self._file))
+
+    def close(self):
+        self._file.close()
+
+
+def _check_content_length(content_length: int | None, max_bytes: int):
+    # Reject before reading the body when the client announced the size
+    if content_length is not None and content_length > max_bytes:
+        raise APIException(ErrorCodes.IMAGE_TOO_LARGE)
+
+
+def read_raw_image(stream: BinaryIO, content_length: int | None) -> ImageUploadBuffer:
+    """
+    Method to read an image sent as the raw request body
+    Args:
+        stream (BinaryIO): Request body stream
+        content_length (int): Content-Length of the request, None for chunked requests
+    Returns:
+        ImageUploadBuffer: Received image, to be closed by the caller
+    """
+    _check_content_length(content_length, MAX_IMAGE_UPLOAD_BYTES)
+
+    buffer = ImageUploadBuffer()
+    try:
+        while True:
+            chunk = stream.read(IMAGE_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            buffer.write(chunk)
+    except Exception:
+        buffer.close()
+        raise
+
+    return buffer
+
+
+def read_multipart_image(
+    stream: BinaryIO, boundary: str | None, content_length: int | None, file_field: str = "image"
+) -> Tuple[ImageUploadBuffer, Dict[str, str]]:
+    """
+    Method to read an image sent as a multipart/form-data file part
+    Args:
+        stream (BinaryIO): Request body stream
+        boundary (str): Multipart boundary of the Content-Type header
+        content_length (int): Content-Length of the request, None for chunked requests
+        file_field (str): Name of the file part with the image
+    Returns:
+        ImageUploadBuffer: Received image, to be closed by the caller
+        dict: Other (non file) form fields
+    """
+    if not boundary:
+        raise APIException(ErrorCodes.INVALID_INPUT)
+
+    max_body_bytes = MAX_IMAGE_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES
+    _check_content_length(content_length, max_body_bytes)
+
+    # max_form_memory_size of the decoder applies to its whole receive buffer (a chunk of the image), the size
+    # of the form fields is checked below
+    decoder = MultipartDecoder(boundary.encode("latin-1"))
+    buffer = ImageUploadBuffer()
+    fields = {}
+    field_name = None
+    field_value = b""
+    in_image = False
+    has_image = False
+    received = 0
+    try:
+        complete = False
+        while not complete:
+            chunk = stream.read(IMAGE_UPLOAD_CHUNK_BYTES)
+            received += len(chunk)
+            if received > max_body_bytes:
+                raise APIException(ErrorCodes.IMAGE_TOO_LARGE)
+
+            decoder.receive_data(chunk or None)
+            event = decoder.next_event()
+            while not isinstance(event, NeedData):
+                if isinstance(event, File):
+                    # Only the first file part with the expected name is kept
+                    in_image = event.name == file_field and not has_image
+                    has_image = has_image or in_image
+                    field_name = None
+                elif isinstance(event, Field):
+                    in_image = False
+                    field_name = event.name
+                    field_value = b""
+                elif isinstance(event, Data):
+                    if in_image:
+                        buffer.write(event.data)
+                    elif field_name is not None:
+                        field_value += event.data
+                        if len(field_value) > MAX_FORM_FIELD_BYTES:
+                            raise APIException(ErrorCodes.INVALID_INPUT)
+                        if not event.more_data:
+                            fields[field_name] = field_value.decode("utf-8")
+                elif isinstance(event, Epilogue):
+                    complete = True
+                    break
+                event = decoder.next_event()
+
+            if not chunk:
+                break
+
+        if not complete or not has_image:
+            raise APIException(ErrorCodes.INVALID_INPUT)
+    except APIException:
+        buffer.close()
+        raise
+    except ValueError as _exec:
+        # Malformed multipart body or form field not UTF-8
+        buffer.close()
+        raise APIException(ErrorCodes.INVALID_INPUT) from _exec
+    except Exception:
+        buffer.close()
+        raise
+
+    return buffer, fields
@@ -0,0 +1,96 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/conftest.py
+Description: Fixtures of the regression tests.
+"""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# src.exceptions and src.schemas import each other, src.schemas is loaded first (as through src.app)
+import src.schemas  # noqa: F401  # isort: skip
+import src.app
+from prisma import partials
+from src import core
+from tests.fake_prisma import FakePrisma
+from tests.seed import make_admin, make_noise_image
+
+# Partial types used with `<partial>.prisma(connection)`, and the table they read
+PARTIAL_MODELS = {
+    "ReviewWithoutImage": "review",
+    "DeviceWithoutImage": "device",
+    "DeviceTypeWithoutImage": "device_type",
+    "ImageWithoutBlob": "image",
+}
+
+
+@pytest.fixture(scope="session")
+def large_png() -> bytes:
+    """
+    PNG image of about 190KB, several upload chunks (IMAGE_UPLOAD_CHUNK_BYTES)
+    """
+    return make_noise_image(256)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Flask app of the endpoint tests, its DB is replaced by the `fake_db` of each test
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("DATABASE_URL", "file:unused")
+        monkeypatch.setattr(src.app, "db", FakePrisma())
+        app = src.app.create_app()
+    app.testing = True
+    return app
+
+
+@pytest.fixture
+def fake_db(app, monkeypatch) -> FakePrisma:
+    """
+    In-memory DB (tests/fake_prisma.py) used by all the src modules instead of the Prisma client
+    """
+    fake = FakePrisma()
+    prisma_client = core.db
+    for name, module in list(sys.modules.items()):
+        if name.startswith("src") and getattr(module, "db", None) is prisma_client:
+            monkeypatch.setattr(module, "db", fake)
+    for partial_name, model in PARTIAL_MODELS.items():
+        monkeypatch.setattr(
+            getattr(partials, partial_name),
+            "prisma",
+            classmethod(lambda cls, client, model=model: getattr(client, model)),
+        )
+    return fake
+
+
+@pytest.fixture
+def client(app, fake_db):
+    return app.test_client()
+
+
+@pytest.fixture
+def admin(fake_db):
+    """
+    Logged in admin, `admin.headers` are the headers of its requests
+    """
+    row, headers = make_admin(fake_db)
+    return SimpleNamespace(id=row.id, row=row, headers=headers)
@@ -0,0 +1,651 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/fake_prisma.py
+Description: In-memory stand-in of the Prisma client, for the tests of the endpoints and models.
+
+Implements the part of the Prisma Client Python API used by the backend (model actions, group_by, interactive
+transactions) over dict rows, with the relations, unique constraints and defaults of prisma/schema.prisma.
+Every action is reported to the query listeners of src/libs/prisma_instrumentation.py like the instrumented
+client does, so assert_max_queries counts the queries the endpoints would run.
+"""
+
+import builtins
+import copy
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from prisma.errors import UniqueViolationError
+from src.libs import prisma_instrumentation
+from src.libs.prisma_instrumentation import QueryEvent
+
+# Relation name -> (related model, foreign key, is a list). The foreign key is a column of the model for the
+# single relations, and a column of the related model for the lists.
+RELATIONS = {
+    "admin": {
+        "customers": ("customer", "admin_id", True),
+        "facility_types": ("facility_type", "admin_id", True),
+        "devices_types": ("device_type", "admin_id", True),
+        "devices": ("device", "admin_id", True),
+    },
+    "customer": {
+        "admin": ("admin", "admin_id", False),
+        "facilities": ("facility", "customer_id", True),
+        "review": ("review", "customer_id", True),
+    },
+    "facility": {
+        "facility_type": ("facility_type", "facility_type_id", False),
+        "customer": ("customer", "customer_id", False),
+        "devices": ("device", "facility_id", True),
+        "review": ("review", "facility_id", True),
+    },
+    "facility_type": {
+        "admin": ("admin", "admin_id", False),
+        "facilities": ("facility", "facility_type_id", True),
+    },
+    "device": {
+        "device_type": ("device_type", "device_type_id", False),
+        "facility": ("facility", "facility_id", False),
+        "admin": ("admin", "admin_id", False),
+        "review": ("review", "device_id", True),
+    },
+    "device_type": {
+        "admin": ("admin", "admin_id", False),
+        "sample_image": ("image", "sample_image_id", False),
+        "devices": ("device", "device_type_id", True),
+    },
+    "review": {
+        "image": ("image", "image_id", False),
+        "customer": ("customer", "customer_id", False),
+        "facility": ("facility", "facility_id", False),
+        "device": ("device", "device_id", False),
+    },
+    "image": {
+        "reviews": ("review", "image_id", True),
+        "device_types": ("device_type", "sample_image_id", True),
+    },
+    "upload_session": {"chunks": ("upload_chunk", "session_id", True)},
+    "upload_chunk": {"session": ("upload_session", "session_id", False)},
+}
+
+UNIQUE_CONSTRAINTS = {
+    "admin": [("login_id",)],
+    "image": [("content_hash",)],
+    "status_counter": [("customer_id", "facility_id", "result")],
+    "change_counter": [("table_name", "admin_id")],
+    "idempotency_record": [("scope", "idempotency_key")],
+    "upload_session": [("upload_uuid",)],
+    "upload_chunk": [("session_id", "offset")],
+    "device_capture": [("capture_uuid",), ("device_id", "facility_id")],
+    "retention_policy": [("customer_id",)],
+}
+
+_AUDIT = {"created_by": "system", "last_updated_by": "system"}
+DEFAULTS = {
+    "admin": {**_AUDIT},
+    "customer": {
+        "auth_url": None,
+        "base_url": None,
+        "client_id": None,
+        "client_secret": None,
+        "application_id": None,
+        **_AUDIT,
+    },
+    "facility": {"status": 1, "prefecture": None, "municipality": None, **_AUDIT},
+    "facility_type": {**_AUDIT},
+    "device": {"result": 1},
+    "device_type": {"sample_image_blob": "", "sample_image_id": None, **_AUDIT},
+    "review": {
+        "image_blob": "",
+        "image_id": None,
+        "archived_at_utc": None,
+        "archive_key": None,
+        "result": 0,
+        "review_comment": "",
+        **_AUDIT,
+    },
+    "image": {"source_hash": None, "ref_count": 0},
+    "status_counter": {"facility_id": 0, "count": 0},
+    "change_counter": {"version": 0},
+    "idempotency_record": {"status_code": None, "response_body": None},
+    "upload_session": {"received_bytes": 0, "review_id": None},
+    "retention_policy": {"max_age_days": None, "keep_latest": None, "action": "archive"},
+}
+
+# @default(now()) and @updatedAt columns
+CREATED_AT = {
+    "admin": ["created_at_utc"],
+    "customer": ["created_at_utc"],
+    "facility": ["created_at_utc"],
+    "facility_type": ["created_at_utc"],
+    "device_type": ["created_at_utc"],
+    "review": ["created_at_utc", "image_date_utc"],
+    "device_capture": ["created_at_utc"],
+    "upload_session": ["created_at_utc"],
+    "idempotency_record": ["created_at_utc"],
+    "image": ["created_at_utc"],
+    "retention_policy": ["created_at_utc"],
+}
+UPDATED_AT = {
+    "admin",
+    "customer",
+    "facility",
+    "facility_type",
+    "device_type",
+    "review",
+    "retention_policy",
+    "change_counter",
+}
+
+# Rows deleted along with their parent (onDelete: Cascade)
+CASCADES = {"upload_session": [("upload_chunk", "session_id")]}
+
+MODELS = set(RELATIONS) | set(UNIQUE_CONSTRAINTS) | set(DEFAULTS) | {"device_capture"}
+
+
+class Record(SimpleNamespace):
+    """
+    Row returned by the actions, with the relations not included set to None like the Prisma models
+    """
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        return {name: _dump(value) for name, value in vars(self).items()}
+
+
+def _dump(value):
+    if isinstance(value, Record):
+        return value.model_dump()
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    return value
+
+
+def _comparable(value):
+    # Naive datetimes sent by the code are UTC, as with the DB
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _match_value(value, condition) -> bool:
+    if not isinstance(condition, dict):
+        return _comparable(value) == _comparable(condition)
+
+    value = _comparable(value)
+    for operator, argument in condition.items():
+        argument = _comparable(argument)
+        if operator == "equals":
+            matched = value == argument
+        elif operator == "in":
+            matched = value in argument
+        elif operator == "not_in":
+            matched = value not in argument
+        elif operator == "not":
+            matched = not _match_value(value, argument)
+        elif operator in ("lt", "lte", "gt", "gte"):
+            if value is None or argument is None:
+                matched = False
+            else:
+                matched = {
+                    "lt": value < argument,
+                    "lte": value <= argument,
+                    "gt": value > argument,
+                    "gte": value >= argument,
+                }[operator]
+        elif operator == "contains":
+            matched = value is not None and argument in value
+        elif operator == "startswith":
+            matched = value is not None and value.startswith(argument)
+        elif operator == "endswith":
+            matched = value is not None and value.endswith(argument)
+        elif operator == "mode":
+            matched = True
+        else:
+            raise NotImplementedError(f"Filter operator {operator}")
+        if not matched:
+            return False
+    return True
+
+
+class FakeModelActions:
+    """
+    `client.<model>` actions of a table
+    """
+
+    def __init__(self, client: "FakePrisma", model: str):
+        self._client = client
+        self._model = model
+
+    # Rows and filters
+
+    @property
+    def _rows(self) -> List[dict]:
+        return self._client.tables.setdefault(self._model, [])
+
+    def _compound_keys(self) -> Dict[str, tuple]:
+        return {"_".join(fields): fields for fields in UNIQUE_CONSTRAINTS.get(self._model, []) if len(fields) > 1}
+
+    def _matches(self, row: dict, where: dict | None) -> bool:
+        return self._client.matches(self._model, row, where)
+
+    def _select(self, where=None, order=None, take=None, skip=None, distinct=None) -> List[dict]:
+        rows = [row for row in self._rows if self._matches(row, where)]
+        rows = self._client.sort(self._model, rows, order)
+        if distinct:
+            seen = set()
+            unique_rows = []
+            for row in rows:
+                key = tuple(row.get(field) for field in distinct)
+                if key not in seen:
+                    seen.add(key)
+                    unique_rows.append(row)
+            rows = unique_rows
+        if skip:
+            rows = rows[skip:]
+        if take is not None:
+            rows = rows[:take]
+        return rows
+
+    def _check_unique(self, row: dict, current: dict | None = None):
+        # `current` is the stored row being updated, which the new values may keep
+        for fields in UNIQUE_CONSTRAINTS.get(self._model, []):
+            key = tuple(row.get(field) for field in fields)
+            if any(value is None for value in key):
+                continue
+            for other in self._rows:
+                if other is not row and other is not current and tuple(other.get(field) for field in fields) == key:
+                    raise UniqueViolationError(
+                        {
+                            "user_facing_error": {
+                                "error_code": "P2002",
+                                "message": f"Unique constraint failed on the fields: {fields}",
+                                "meta": {"target": list(fields)},
+                            }
+                        }
+                    )
+
+    def _apply(self, row: dict, data: dict):
+        relations = RELATIONS.get(self._model, {})
+        for name, value in data.items():
+            if name in relations:
+                _, foreign_key, _ = relations[name]
+                if "connect" in value:
+                    row[foreign_key] = value["connect"]["id"]
+                elif value.get("disconnect"):
+                    row[foreign_key] = None
+            elif isinstance(value, dict):
+                current = row.get(name) or 0
+                if "set" in value:
+                    row[name] = value["set"]
+                elif "increment" in value:
+                    row[name] = current + value["increment"]
+                elif "decrement" in value:
+                    row[name] = current - value["decrement"]
+                elif "multiply" in value:
+                    row[name] = current * value["multiply"]
+                else:
+                    raise NotImplementedError(f"Update operation {value}")
+            else:
+                # Enums are sent as their value
+                row[name] = value.value if isinstance(value, Enum) else value
+
+    def _insert(self, data: dict) -> dict:
+        now = self._client.now()
+        row = {"id": self._client.next_id(self._model)}
+        row.update({name: now for name in CREATED_AT.get(self._model, [])})
+        if self._model in UPDATED_AT:
+            row["last_updated_at_utc"] = now
+        row.update(copy.deepcopy(DEFAULTS.get(self._model, {})))
+        self._apply(row, data)
+        self._check_unique(row)
+        self._rows.append(row)
+        return row
+
+    def _update_row(self, row: dict, data: dict):
+        updated = dict(row)
+        self._apply(updated, data)
+        if self._model in UPDATED_AT and "last_updated_at_utc" not in data:
+            updated["last_updated_at_utc"] = self._client.now()
+        self._check_unique(updated, current=row)
+        row.update(updated)
+
+    def _remove(self, rows: List[dict]):
+        ids = {id(row) for row in rows}
+        self._client.tables[self._model] = [row for row in self._rows if id(row) not in ids]
+        for child_model, foreign_key in CASCADES.get(self._model, []):
+            parent_ids = {row["id"] for row in rows}
+            self._client.tables[child_model] = [
+                child for child in self._client.tables.get(child_model, []) if child[foreign_key] not in parent_ids
+            ]
+
+    def _record(self, row: dict, include: dict | None = None) -> Record:
+        return self._client.record(self._model, row, include)
+
+    def _run(self, method: str, arguments: dict, action: Callable[[], Any]):
+        return self._client.run(self._model, method, arguments, action)
+
+    # Prisma actions
+
+    def create(self, data: dict, include: dict | None = None):
+        return self._run(
+            "create", {"data": data, "include": include}, lambda: self._record(self._insert(data), include)
+        )
+
+    def create_many(self, data: List[dict], skip_duplicates: bool = False):
+        def action():
+            count = 0
+            for item in data:
+                try:
+                    self._insert(item)
+                    count += 1
+                except UniqueViolationError:
+                    if not skip_duplicates:
+                        raise
+            return count
+
+        return self._run("create_many", {"data": data, "skip_duplicates": skip_duplicates}, action)
+
+    def find_many(self, where=None, include=None, order=None, take=None, skip=None, distinct=None):
+        arguments = {"where": where, "include": include, "order": order, "take": take, "skip": skip}
+
+        def action():
+            rows = self._select(where, order, take, skip, distinct)
+            return [self._record(row, include) for row in rows]
+
+        return self._run("find_many", arguments, action)
+
+    def find_first(self, where=None, include=None, order=None, skip=None):
+        def action():
+            rows = self._select(where, order, 1, skip)
+            return self._record(rows[0], include) if rows else None
+
+        return self._run("find_first", {"where": where, "include": include, "order": order, "skip": skip}, action)
+
+    def find_unique(self, where: dict, include=None):
+        def action():
+            rows = self._select(where)
+            return self._record(rows[0], include) if rows else None
+
+        return self._run("find_unique", {"where": where, "include": include}, action)
+
+    def count(self, where=None):
+        return self._run("count", {"where": where}, lambda: len(self._select(where)))
+
+    def update(self, where: dict, data: dict, include=None):
+        def action():
+            rows = self._select(where)
+            if not rows:
+                return None
+            self._update_row(rows[0], data)
+            return self._record(rows[0], include)
+
+        return self._run("update", {"where": where, "data": data, "include": include}, action)
+
+    def update_many(self, data: dict, where=None):
+        def action():
+            rows = self._select(where)
+            for row in rows:
+                self._update_row(row, data)
+            return len(rows)
+
+        return self._run("update_many", {"where": where, "data": data}, action)
+
+    def upsert(self, where: dict, data: dict, include=None):
+        def action():
+            rows = self._select(where)
+            if rows:
+                self._update_row(rows[0], data["update"])
+                return self._record(rows[0], include)
+            return self._record(self._insert(data["create"]), include)
+
+        return self._run("upsert", {"where": where, "data": data, "include": include}, action)
+
+    def delete(self, where: dict, include=None):
+        def action():
+            rows = self._select(where)
+            if not rows:
+                return None
+            record = self._record(rows[0], include)
+            self._remove(rows[:1])
+            return record
+
+        return self._run("delete", {"where": where, "include": include}, action)
+
+    def delete_many(self, where=None):
+        def action():
+            rows = self._select(where)
+            self._remove(rows)
+            return len(rows)
+
+        return self._run("delete_many", {"where": where}, action)
+
+    def group_by(self, by: List[str], where=None, count=None, sum=None, min=None, max=None, order=None):
+        def action():
+            groups: Dict[tuple, List[dict]] = {}
+            for row in self._select(where):
+                groups.setdefault(tuple(row.get(field) for field in by), []).append(row)
+
+            results = []
+            for key, rows in groups.items():
+                result = dict(zip(by, key))
+                if count:
+                    result["_count"] = {
+                        field: (
+                            len(rows)
+                            if field == "_all"
+                            else builtins.sum(1 for row in rows if row.get(field) is not None)
+                        )
+                        for field in count
+                    }
+                if sum:
+                    result["_sum"] = {field: builtins.sum(row.get(field) or 0 for row in rows) for field in sum}
+                for name, fields, aggregate in (("_min", min, builtins.min), ("_max", max, builtins.max)):
+                    if fields:
+                        result[name] = {
+                            field: aggregate((row[field] for row in rows if row.get(field) is not None), default=None)
+                            for field in fields
+                        }
+                results.append(result)
+            return results
+
+        return self._run(
+            "group_by",
+            {"by": by, "where": where, "count": count, "sum": sum, "min": min, "max": max, "order": order},
+            action,
+        )
+
+
+class FakePrisma:
+    """
+    In-memory Prisma client. `client.<model>` returns the actions of a table, `tx()` runs an interactive
+    transaction rolled back on error, `query_raw` answers with `raw_handler(query, *params)`.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, List[dict]] = {}
+        self._next_ids: Dict[str, int] = {}
+        self._last_now = None
+        self.raw_handler: Callable[..., List[dict]] = lambda query, *params: []
+        # (model, method) -> callback run before the action, e.g. to simulate a concurrent request
+        self.before_action: Dict[tuple, Callable[[dict], None]] = {}
+
+    def __getattr__(self, name: str) -> FakeModelActions:
+        if name in MODELS:
+            return FakeModelActions(self, name)
+        raise AttributeError(name)
+
+    # Client
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def is_connected(self) -> bool:
+        return True
+
+    @contextmanager
+    def tx(self, max_wait=None, timeout=None):
+        snapshot = copy.deepcopy((self.tables, self._next_ids))
+        try:
+            yield self
+        except BaseException:
+            self.tables, self._next_ids = snapshot
+            raise
+
+    def query_raw(self, query: str, *params):
+        return self.run(
+            None, "query_raw", {"query": query, "parameters": list(params)}, lambda: self.raw_handler(query, *params)
+        )
+
+    def execute_raw(self, query: str, *params):
+        return self.run(None, "execute_raw", {"query": query, "parameters": list(params)}, lambda: 0)
+
+    # Helpers of the actions
+
+    def now(self) -> datetime:
+        # Strictly increasing, so the rows created by a test are ordered by creation time
+        now = datetime.now(timezone.utc)
+        if self._last_now and now <= self._last_now:
+            now = self._last_now + timedelta(microseconds=1)
+        self._last_now = now
+        return now
+
+    def next_id(self, model: str) -> int:
+        self._next_ids[model] = self._next_ids.get(model, 0) + 1
+        return self._next_ids[model]
+
+    def get(self, model: str, row_id) -> dict | None:
+        if row_id is None:
+            return None
+        return next((row for row in self.tables.get(model, []) if row["id"] == row_id), None)
+
+    def run(self, model: str | None, method: str, arguments: dict, action: Callable[[], Any]):
+        callback = self.before_action.pop((model, method), None)
+        if callback:
+            callback(arguments)
+
+        start_time_ns = time.time_ns()
+        started = time.perf_counter()
+        error = None
+        try:
+            return action()
+        except BaseException as _exec:
+            error = _exec
+            raise
+        finally:
+            event = QueryEvent(
+                model=model or "-",
+                method=method,
+                arguments={name: value for name, value in arguments.items() if value is not None},
+                start_time_ns=start_time_ns,
+                duration=time.perf_counter() - started,
+                error=error,
+            )
+            for listener in list(prisma_instrumentation._query_listeners):
+                listener(event)
+
+    def matches(self, model: str, row: dict, where: dict | None) -> bool:
+        relations = RELATIONS.get(model, {})
+        compound_keys = {"_".join(fields): fields for fields in UNIQUE_CONSTRAINTS.get(model, []) if len(fields) > 1}
+        for name, condition in (where or {}).items():
+            if name in ("AND", "OR", "NOT"):
+                conditions = condition if isinstance(condition, list) else [condition]
+                results = [self.matches(model, row, item) for item in conditions]
+                matched = {"AND": all, "OR": any, "NOT": lambda values: not any(values)}[name](results)
+            elif name in relations:
+                related_model, foreign_key, is_list = relations[name]
+                if is_list:
+                    children = [
+                        child for child in self.tables.get(related_model, []) if child[foreign_key] == row["id"]
+                    ]
+                    matched = True
+                    for operator, child_where in condition.items():
+                        child_matches = [self.matches(related_model, child, child_where) for child in children]
+                        matched = matched and {"some": any, "every": all, "none": lambda v: not any(v)}[operator](
+                            child_matches
+                        )
+                else:
+                    parent = self.get(related_model, row.get(foreign_key))
+                    if condition is None:
+                        matched = parent is None
+                    else:
+                        matched = parent is not None and self.matches(related_model, parent, condition)
+            elif name in compound_keys:
+                matched = all(row.get(field) == condition[field] for field in compound_keys[name])
+            else:
+                matched = _match_value(row.get(name), condition)
+            if not matched:
+                return False
+        return True
+
+    def sort(self, model: str, rows: List[dict], order) -> List[dict]:
+        if not order:
+            return sorted(rows, key=lambda row: row["id"])
+
+        rows = sorted(rows, key=lambda row: row["id"])
+        for item in reversed(order if isinstance(order, list) else [order]):
+            for name, direction in reversed(list(item.items())):
+                if isinstance(direction, dict):
+                    related_model, foreign_key, _ = RELATIONS[model][name]
+                    ((field, direction),) = direction.items()
+
+                    def key(row, related_model=related_model, foreign_key=foreign_key, field=field):
+                        parent = self.get(related_model, row.get(foreign_key)) or {}
+                        return _sort_key(parent.get(field))
+
+                else:
+
+                    def key(row, name=name):
+                        return _sort_key(row.get(name))
+
+                rows = sorted(rows, key=key, reverse=direction == "desc")
+        return rows
+
+    def record(self, model: str, row: dict, include: dict | None = None) -> Record:
+        values = copy.deepcopy(row)
+        relations = RELATIONS.get(model, {})
+        for name in relations:
+            values.setdefault(name, None)
+
+        for name, spec in (include or {}).items():
+            if spec is False or spec is None:
+                continue
+            related_model, foreign_key, is_list = relations[name]
+            nested = spec if isinstance(spec, dict) else {}
+            if is_list:
+                actions = FakeModelActions(self, related_model)
+                where = {**nested.get("where", {}), foreign_key: row["id"]}
+                children = actions._select(where, nested.get("order_by"), nested.get("take"), nested.get("skip"))
+                values[name] = [self.record(related_model, child, nested.get("include")) for child in children]
+            else:
+                parent = self.get(related_model, row.get(foreign_key))
+                values[name] = self.record(related_model, parent, nested.get("include")) if parent else None
+
+        return Record(**values)
+
+
+def _sort_key(value):
+    # None first in ascending order
+    value = _comparable(value)
+    return (value is not None, value)
@@ -0,0 +1,113 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/seed.py
+Description: Rows and tokens of the endpoint tests, created in the FakePrisma DB (tests/fake_prisma.py).
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from types import SimpleNamespace
+
+import jwt
+from PIL import Image
+from src.config import APP_SECRET_KEY
+from tests.fake_prisma import FakePrisma
+
+
+def make_noise_image(size: int, image_format: str = "PNG") -> bytes:
+    """
+    Method to create an image of random pixels, which does not compress (about 3 * size * size bytes as PNG)
+    """
+    rng = random.Random(size)
+    image = Image.frombytes("RGB", (size, size), bytes(rng.getrandbits(8) for _ in range(3 * size * size)))
+    output = BytesIO()
+    image.save(output, format=image_format)
+    return output.getvalue()
+
+
+def seed_customer(connection: FakePrisma, admin_id: int, name: str = "Customer", facilities: int = 1):
+    """
+    Method to create a customer with its facilities, and a facility type / device type of the admin
+    Returns:
+        SimpleNamespace: customer, facilities, facility_type and device_type rows
+    """
+    customer = connection.customer.create(
+        data={"customer_uuid": f"uuid-{name}", "customer_name": name, "admin_id": admin_id}
+    )
+    facility_type = connection.facility_type.create(data={"name": f"{name} type", "admin_id": admin_id})
+    device_type = connection.device_type.create(data={"name": f"{name} camera", "admin_id": admin_id})
+    created_facilities = [
+        connection.facility.create(
+            data={
+                "customer_id": customer.id,
+                "facility_type_id": facility_type.id,
+                "facility_name": f"{name} facility {index}",
+                "prefecture": "Tokyo",
+                "municipality": "Minato",
+                "effective_start_utc": "2020-01-01T00:00:00+00:00",
+                "effective_end_utc": "2099-12-31T23:59:59+00:00",
+            }
+        )
+        for index in range(facilities)
+    ]
+    return SimpleNamespace(
+        customer=customer, facilities=created_facilities, facility_type=facility_type, device_type=device_type
+    )
+
+
+def seed_device(connection: FakePrisma, admin_id: int, facility, device_type, device_id: str, result: int = 1):
+    """
+    Method to create a device directly in the table, without the status counters
+    """
+    return connection.device.create(
+        data={
+            "device_id": device_id,
+            "device_name": f"Camera {device_id}",
+            "facility_id": facility.id,
+            "device_type_id": device_type.id,
+            "admin_id": admin_id,
+            "result": result,
+        }
+    )
+
+
+def make_admin(connection: FakePrisma, login_id: str = "admin"):
+    """
+    Method to create an admin, with the headers of its login token
+    Returns:
+        tuple: admin row, request headers
+    """
+    admin = connection.admin.create(data={"login_id": login_id, "admin_password": "unused"})
+    token = jwt.encode(
+        {"login_id": login_id, "exp": datetime.now(timezone.utc) + timedelta(minutes=10)}, APP_SECRET_KEY
+    )
+    return admin, {"Authorization": f"Bearer {token}"}
+
+
+def contractor_headers(facility) -> dict:
+    """
+    Method to build the headers of a contractor token (QR code) of the facility
+    """
+    now = int(datetime.now().timestamp())
+    token = jwt.encode(
+        {"customer_id": facility.customer_id, "facility_id": facility.id, "start_time": now - 60, "exp": now + 600},
+        APP_SECRET_KEY,
+    )
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,243 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/test_etag.py
+Description: Conditional GET of the master data endpoints (src/libs/etag.py) and the change counters bumped by
+their write paths (src/models/change_counters.py).
+"""
+
+import base64
+import json
+from io import BytesIO
+
+import pytest
+from prisma.errors import UniqueViolationError
+from src.api import customers as customers_api
+from src.models.change_counters import (
+    CUSTOMER,
+    DEVICE_TYPE,
+    FACILITY,
+    FACILITY_TYPE,
+    MASTER_DATA_TABLES,
+    bump_change_counter,
+    get_change_versions,
+)
+from tests.seed import make_admin, make_noise_image, seed_customer
+
+CREDENTIALS = {
+    "auth_url": "https://auth.example.com",
+    "base_url": "https://api.example.com",
+    "client_id": "client",
+    "client_secret": "secret",
+    "application_id": "application",
+}
+
+
+@pytest.fixture
+def seeded(fake_db, admin, monkeypatch):
+    monkeypatch.setattr(customers_api, "verify_customer_credentials", lambda customer_data: True)
+    return seed_customer(fake_db, admin.id)
+
+
+def versions(connection, admin_id: int) -> dict:
+    return {
+        table_name: int(version.split(".")[0])
+        for table_name, version in get_change_versions(connection, MASTER_DATA_TABLES, admin_id).items()
+    }
+
+
+def facility_body(seeded, name: str) -> dict:
+    return {
+        "customer_id": seeded.customer.id,
+        "facility_name": name,
+        "facility_type_id": seeded.facility_type.id,
+        "prefecture": "Tokyo",
+        "municipality": "Minato",
+        "effective_start_utc": "2020-01-01T00:00:00+00:00",
+        "effective_end_utc": "2099-12-31T23:59:59+00:00",
+    }
+
+
+def image() -> str:
+    return base64.b64encode(make_noise_image(16)).decode()
+
+
+# Write path -> (tables bumped, request)
+WRITE_PATHS = {
+    "create customer": (
+        [CUSTOMER],
+        lambda seeded: ("POST", "/customers", {"json": {"customer_name": "New customer", **CREDENTIALS}}),
+    ),
+    "update customer": (
+        [CUSTOMER],
+        lambda seeded: (
+            "PUT",
+            f"/customers/{seeded.customer.id}/console_credentials",
+            {"json": {"customer_name": "Renamed customer", **CREDENTIALS}},
+        ),
+    ),
+    "create facility": (
+        [FACILITY],
+        lambda seeded: ("POST", "/facilities/0", {"json": facility_body(seeded, "New facility")}),
+    ),
+    "update facility": (
+        [FACILITY],
+        lambda seeded: (
+            "POST",
+            f"/facilities/{seeded.facilities[0].id}",
+            {"json": facility_body(seeded, "Renamed facility")},
+        ),
+    ),
+    "create facility type": (
+        [FACILITY_TYPE],
+        lambda seeded: ("POST", "/facility-types", {"json": {"name": "New type"}}),
+    ),
+    "create device type": (
+        [DEVICE_TYPE],
+        lambda seeded: ("POST", "/device-types", {"json": {"name": "New camera", "reference_image": image()}}),
+    ),
+    "update device type": (
+        [DEVICE_TYPE],
+        lambda seeded: ("PUT", f"/device-types/{seeded.device_type.id}", {"json": {"reference_image": image()}}),
+    ),
+    "import": (
+        list(MASTER_DATA_TABLES),
+        lambda seeded: (
+            "POST",
+            "/data-migration/import",
+            {
+                "data": {
+                    "json_file": (
+                        BytesIO(
+                            json.dumps(
+                                {
+                                    "admin": [
+                                        {
+                                            "facility_types": [{"name": "Imported type"}],
+                                            "device_types": [],
+                                            "customers": [],
+                                        }
+                                    ]
+                                }
+                            ).encode()
+                        ),
+                        "import.json",
+                    )
+                }
+            },
+        ),
+    ),
+}
+
+# Table -> GET endpoint answering 304 while it is unchanged
+GET_PATHS = {
+    CUSTOMER: lambda seeded: "/customers",
+    FACILITY: lambda seeded: f"/facilities?customer_id={seeded.customer.id}",
+    FACILITY_TYPE: lambda seeded: "/facility-types",
+    DEVICE_TYPE: lambda seeded: "/device-types",
+}
+
+
+@pytest.mark.parametrize("write_path", list(WRITE_PATHS))
+def test_write_path_bumps_its_tables(client, fake_db, admin, seeded, write_path):
+    bumped_tables, build_request = WRITE_PATHS[write_path]
+    urls = {table_name: get_url(seeded) for table_name, get_url in GET_PATHS.items()}
+    etags = {}
+    for table_name, url in urls.items():
+        response = client.get(url, headers=admin.headers)
+        assert response.status_code == 200, response.get_json()
+        etags[table_name] = response.headers["ETag"]
+    before = versions(fake_db, admin.id)
+
+    method, url, kwargs = build_request(seeded)
+    response = client.open(url, method=method, headers=admin.headers, **kwargs)
+    assert response.status_code in (200, 201), response.get_json()
+
+    after = versions(fake_db, admin.id)
+    for table_name, url in urls.items():
+        response = client.get(url, headers={**admin.headers, "If-None-Match": etags[table_name]})
+        if table_name in bumped_tables:
+            assert after[table_name] == before[table_name] + 1
+            # The import also replaces the customer of the facility list (404)
+            assert response.status_code in (200, 404)
+            assert response.headers.get("ETag") != etags[table_name]
+        else:
+            # Other tables keep their ETag
+            assert after[table_name] == before[table_name]
+            assert response.status_code == 304
+            assert response.headers["ETag"] == etags[table_name]
+
+
+def test_not_modified_until_the_table_changes(client, fake_db, admin, seeded):
+    response = client.get("/facility-types", headers=admin.headers)
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    for _ in range(2):
+        response = client.get("/facility-types", headers={**admin.headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+    bump_change_counter(fake_db, FACILITY_TYPE, admin.id)
+    response = client.get("/facility-types", headers={**admin.headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["total"] == 1
+
+
+def test_etag_differs_per_user_and_url(client, fake_db, admin, seeded):
+    other_admin, other_headers = make_admin(fake_db, "other")
+    seed_customer(fake_db, other_admin.id)
+
+    etag = client.get("/facility-types", headers=admin.headers).headers["ETag"]
+    other_etag = client.get("/facility-types", headers=other_headers).headers["ETag"]
+    assert other_etag != etag
+    # The ETag of another admin is not a match, even with the same versions
+    assert client.get("/facility-types", headers={**other_headers, "If-None-Match": etag}).status_code == 200
+
+    facilities_etag = client.get(f"/facilities?customer_id={seeded.customer.id}", headers=admin.headers).headers["ETag"]
+    facility_etag = client.get(f"/facilities/{seeded.facilities[0].id}", headers=admin.headers).headers["ETag"]
+    assert facilities_etag != facility_etag
+
+
+def test_errors_have_no_etag(client, admin, seeded):
+    response = client.get("/facilities?customer_id=999", headers=admin.headers)
+
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+
+
+def test_bump_change_counter(fake_db, admin):
+    bump_change_counter(fake_db, CUSTOMER, admin.id)
+    bump_change_counter(fake_db, CUSTOMER, admin.id)
+
+    assert versions(fake_db, admin.id) == {CUSTOMER: 2, FACILITY: 0, FACILITY_TYPE: 0, DEVICE_TYPE: 0}
+    # Counters of another admin are separate
+    assert versions(fake_db, admin.id + 1)[CUSTOMER] == 0
+
+
+def test_missing_counter_created_concurrently(fake_db, admin):
+    def concurrent_create(arguments):
+        # Another request creates the counter between the read and the create
+        fake_db.change_counter.create(data={**arguments["data"], "version": 3})
+        raise UniqueViolationError({"user_facing_error": {"error_code": "P2002", "message": "Unique constraint"}})
+
+    fake_db.before_action[("change_counter", "create")] = concurrent_create
+
+    assert get_change_versions(fake_db, [CUSTOMER], admin.id)[CUSTOMER].startswith("3.")
@@ -0,0 +1,139 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/test_idempotency.py
+Description: Idempotency-Key of the review creation and admin decision (src/libs/idempotency.py).
+"""
+
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+from src.config import IDEMPOTENCY_LOCK_SECONDS
+from src.schemas.reviews import DeviceReviewAllowedEnums
+from tests.seed import contractor_headers, make_noise_image, seed_customer, seed_device
+
+KEY = "3f0c9a52-7d1e-4b8a-9c55-2a6f0e4d1b7c"
+
+
+@pytest.fixture
+def device(fake_db, admin):
+    seeded = seed_customer(fake_db, admin.id)
+    return seed_device(fake_db, admin.id, seeded.facilities[0], seeded.device_type, "cam-1")
+
+
+@pytest.fixture
+def contractor(fake_db, device):
+    facility = fake_db.facility.find_unique(where={"id": device.facility_id})
+    return {**contractor_headers(facility), "Idempotency-Key": KEY}
+
+
+def create_review(client, headers: dict, device, image_size: int = 16):
+    image = base64.b64encode(make_noise_image(image_size)).decode()
+    return client.post("/reviews", headers=headers, json={"device_id": device.id, "image": image})
+
+
+def test_replay_returns_the_stored_response(client, fake_db, device, contractor):
+    first = create_review(client, contractor, device)
+    assert first.status_code == 201
+
+    replayed = create_review(client, contractor, device)
+
+    assert replayed.status_code == 201
+    assert replayed.get_json() == first.get_json()
+    assert replayed.headers["Idempotent-Replayed"] == "true"
+    assert fake_db.review.count() == 1
+    # Without the key, the repeated request is answered by the endpoint itself
+    headers = {name: value for name, value in contractor.items() if name != "Idempotency-Key"}
+    assert create_review(client, headers, device).status_code == 200
+
+
+def test_key_reused_for_another_request(client, device, contractor):
+    assert create_review(client, contractor, device).status_code == 201
+
+    response = create_review(client, contractor, device, image_size=24)
+
+    assert response.status_code == 400
+    assert response.get_json()["error_code"] == 40019
+
+
+def test_concurrent_duplicate_is_rejected(client, fake_db, device, contractor):
+    duplicates = []
+    # The duplicate arrives while the first request is writing the review
+    fake_db.before_action[("review", "create")] = lambda arguments: duplicates.append(
+        create_review(client, contractor, device)
+    )
+
+    response = create_review(client, contractor, device)
+
+    assert response.status_code == 201
+    assert [duplicate.status_code for duplicate in duplicates] == [409]
+    assert duplicates[0].get_json()["error_code"] == 40902
+    assert fake_db.review.count() == 1
+    assert create_review(client, contractor, device).headers["Idempotent-Replayed"] == "true"
+
+
+def test_stale_request_is_taken_over(client, fake_db, device, contractor):
+    assert create_review(client, contractor, device).status_code == 201
+    # Record of a request whose worker was killed before storing the response
+    fake_db.review.delete_many()
+    fake_db.idempotency_record.update_many(
+        data={
+            "status_code": None,
+            "response_body": None,
+            "created_at_utc": datetime.utcnow() - timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS + 1),
+        }
+    )
+
+    response = create_review(client, contractor, device)
+
+    assert response.status_code == 201
+    assert "Idempotent-Replayed" not in response.headers
+    assert fake_db.review.count() == 1
+
+
+def test_record_is_removed_when_the_request_fails(client, fake_db, admin, device, contractor):
+    review_id = create_review(client, contractor, device).get_json()["data"]["review_id"]
+    headers = {**admin.headers, "Idempotency-Key": KEY}
+
+    response = client.put(
+        f"/reviews/{review_id}", headers=headers, json={"result": DeviceReviewAllowedEnums.REJECTED.value}
+    )
+
+    assert response.status_code == 400
+    assert fake_db.idempotency_record.count(where={"scope": f"admin:{admin.id}"}) == 0
+
+    # The client retries with the same key once the request is fixed
+    body = {"result": DeviceReviewAllowedEnums.REJECTED.value, "comment": "Camera is tilted"}
+    response = client.put(f"/reviews/{review_id}", headers=headers, json=body)
+    assert response.status_code == 200
+    assert client.put(f"/reviews/{review_id}", headers=headers, json=body).headers["Idempotent-Replayed"] == "true"
+
+
+def test_record_is_removed_on_unexpected_errors(client, fake_db, device, contractor):
+    def fail(arguments):
+        raise RuntimeError("connection lost")
+
+    fake_db.before_action[("review", "create")] = fail
+
+    response = create_review(client, contractor, device)
+
+    assert response.status_code == 500
+    assert fake_db.idempotency_record.count() == 0
+    assert fake_db.review.count() == 0
+    assert create_review(client, contractor, device).status_code == 201
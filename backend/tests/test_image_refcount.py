@@ -0,0 +1,110 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/test_image_refcount.py
+Description: Reference counts of the deduplicated images (acquire_image / release_image in src/models/images.py).
+"""
+
+import base64
+
+import pytest
+from prisma.errors import UniqueViolationError
+from src.models.images import acquire_image, prepare_base64_image, release_image, release_review_images
+from tests.seed import contractor_headers, make_noise_image, seed_customer, seed_device
+
+
+@pytest.fixture(scope="module")
+def image() -> str:
+    return base64.b64encode(make_noise_image(16)).decode()
+
+
+@pytest.fixture
+def devices(fake_db, admin):
+    seeded = seed_customer(fake_db, admin.id)
+    return [
+        seed_device(fake_db, admin.id, seeded.facilities[0], seeded.device_type, f"cam-{index}") for index in range(2)
+    ]
+
+
+def create_review(client, fake_db, device, image: str):
+    facility = fake_db.facility.find_unique(where={"id": device.facility_id})
+    return client.post("/reviews", headers=contractor_headers(facility), json={"device_id": device.id, "image": image})
+
+
+def acquire_image_blob(connection, image: str) -> str:
+    image_id = acquire_image(connection, prepare_base64_image(connection, image))
+    return connection.image.find_unique(where={"id": image_id}).image_blob
+
+
+def test_acquire_and_release(fake_db, image):
+    image_id = acquire_image(fake_db, prepare_base64_image(fake_db, image))
+    # Prepared again once stored, the payload is found by its hash and not normalized again
+    prepared = prepare_base64_image(fake_db, image)
+    assert prepared.image is None
+    assert acquire_image(fake_db, prepared) == image_id
+    assert fake_db.image.find_unique(where={"id": image_id}).ref_count == 2
+
+    release_image(fake_db, image_id)
+    assert fake_db.image.find_unique(where={"id": image_id}).ref_count == 1
+
+    release_image(fake_db, image_id)
+    assert fake_db.image.find_unique(where={"id": image_id}) is None
+    release_image(fake_db, None)
+
+
+def test_image_released_before_the_write(fake_db, image):
+    prepared = prepare_base64_image(fake_db, acquire_image_blob(fake_db, image))
+    release_image(fake_db, fake_db.image.find_first().id)
+
+    image_id = acquire_image(fake_db, prepared)
+
+    assert fake_db.image.find_unique(where={"id": image_id}).ref_count == 1
+
+
+def test_reviews_share_the_image(client, fake_db, admin, devices, image):
+    for device in devices:
+        assert create_review(client, fake_db, device, image).status_code == 201
+
+    (stored,) = fake_db.image.find_many()
+    assert stored.ref_count == 2
+    assert {review.image_id for review in fake_db.review.find_many()} == {stored.id}
+
+    response = client.delete(f"/reviews/devices/{devices[0].id}", headers=admin.headers)
+    assert response.status_code == 200
+    assert fake_db.image.find_unique(where={"id": stored.id}).ref_count == 1
+
+    release_review_images(fake_db, {"device_id": devices[1].id})
+    assert fake_db.image.count() == 0
+
+
+def test_same_new_image_uploaded_concurrently(client, fake_db, devices, image):
+    def concurrent_upload(arguments):
+        # The other review stores the image between the read and the insert of the upsert
+        assert create_review(client, fake_db, devices[0], image).status_code == 201
+        raise UniqueViolationError(
+            {"user_facing_error": {"error_code": "P2002", "message": "Unique constraint failed on content_hash"}}
+        )
+
+    fake_db.before_action[("image", "upsert")] = concurrent_upload
+
+    response = create_review(client, fake_db, devices[1], image)
+
+    assert response.status_code == 201, response.get_json()
+    (stored,) = fake_db.image.find_many()
+    assert stored.ref_count == 2
+    assert {review.image_id for review in fake_db.review.find_many()} == {stored.id}
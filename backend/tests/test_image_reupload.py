@@ -0,0 +1,70 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/test_image_reupload.py
+Description: Stored (normalized) images sent back as is, as by the device type edit dialog and the data
+migration import.
+"""
+
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+from src.exceptions import APIException
+from src.models.images import hash_data_url, prepare_base64_image
+from src.services.image_service import decode_base64_image, normalize_base64_image, normalize_image, to_data_url
+
+
+class StoredImages:
+    """
+    `connection.image` of prepare_image, holding the stored images by content hash
+    """
+
+    def __init__(self, *images: str):
+        self.rows = {hash_data_url(image): image for image in images}
+
+    def find_first(self, where: dict):
+        for condition in where["OR"]:
+            content_hash = condition.get("content_hash")
+            if content_hash in self.rows:
+                return SimpleNamespace(content_hash=content_hash, image_blob=self.rows[content_hash])
+        return None
+
+
+@pytest.fixture(scope="module")
+def stored_image(large_png) -> str:
+    return to_data_url(*normalize_image(BytesIO(large_png)))
+
+
+def test_stored_image_is_accepted(stored_image):
+    assert decode_base64_image(stored_image)
+    assert normalize_base64_image(stored_image).startswith("data:image/")
+
+
+def test_stored_image_reupload_is_not_normalized_again(stored_image):
+    connection = SimpleNamespace(image=StoredImages(stored_image))
+
+    prepared = prepare_base64_image(connection, stored_image)
+
+    assert prepared.image is None
+    assert prepared.content_hash == hash_data_url(stored_image)
+
+
+def test_other_formats_are_rejected():
+    with pytest.raises(APIException):
+        decode_base64_image("data:image/gif;base64,R0lGODlhAQABAAAAACw=")
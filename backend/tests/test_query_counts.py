@@ -0,0 +1,147 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/test_query_counts.py
+Description: Number of queries of the device list and review endpoints (assert_max_queries of
+src/libs/query_accounting.py), which must not grow with the number of devices or reviews.
+"""
+
+import base64
+from types import SimpleNamespace
+
+import pytest
+from src.api import devices as devices_api
+from src.libs.query_accounting import assert_max_queries
+from src.models.images import acquire_image, prepare_base64_image
+from src.models.status_counters import reconcile_status_counters
+from tests.seed import make_noise_image, seed_customer, seed_device
+
+IMAGE = base64.b64encode(make_noise_image(16)).decode()
+
+
+def seed_reviews(connection, admin_id: int, device_count: int, reviews_per_device: int = 3):
+    """
+    Method to create a customer with `device_count` devices, each with its reviews
+    Returns:
+        SimpleNamespace: seed_customer rows, devices and the latest review of each device
+    """
+    seeded = seed_customer(connection, admin_id, facilities=2)
+    # Reference image of the device type, sent as its URL
+    sample_image_id = acquire_image(connection, prepare_base64_image(connection, IMAGE))
+    connection.device_type.update(where={"id": seeded.device_type.id}, data={"sample_image_id": sample_image_id})
+    seeded.devices = []
+    seeded.latest_reviews = {}
+    for index in range(device_count):
+        facility = seeded.facilities[index % 2]
+        device = seed_device(connection, admin_id, facility, seeded.device_type, f"cam-{index}", result=2)
+        seeded.devices.append(device)
+        for result in [3] * (reviews_per_device - 1) + [2]:
+            review = connection.review.create(
+                data={
+                    "customer_id": seeded.customer.id,
+                    "facility_id": facility.id,
+                    "device_id": device.id,
+                    "result": result,
+                }
+            )
+        seeded.latest_reviews[device.id] = review.id
+    connection.customer.update(
+        where={"id": seeded.customer.id},
+        data={"auth_url": "auth", "base_url": "base", "client_id": "id", "client_secret": "secret"},
+    )
+    return seeded
+
+
+def query_count(client, url: str, headers: dict, max_count: int) -> int:
+    with assert_max_queries(max_count) as queries:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    assert response.headers["X-DB-Query-Count"] == str(len(queries))
+    return len(queries)
+
+
+@pytest.fixture
+def aitrios(monkeypatch):
+    """
+    AITRIOS console of GET /devices, listing the devices set in `aitrios.devices`
+    """
+    console = SimpleNamespace(devices=[])
+    monkeypatch.setattr(devices_api, "decrypt_customer_details", lambda customer: customer)
+    monkeypatch.setattr(devices_api, "get_aitrios_access_token", lambda customer: "token")
+    monkeypatch.setattr(devices_api, "get_aitrios_devices", lambda customer, access_token, device_ids: console.devices)
+    return console
+
+
+@pytest.mark.parametrize("device_count", [2, 20])
+@pytest.mark.parametrize("with_counters", [False, True])
+def test_latest_reviews(client, fake_db, admin, device_count, with_counters):
+    seeded = seed_reviews(fake_db, admin.id, device_count)
+    if with_counters:
+        reconcile_status_counters(fake_db, [seeded.customer.id])
+    url = f"/reviews/latest?customer_id={seeded.customer.id}&page=1&page_size=50"
+
+    # Without counters, the status count falls back to a group by and a count of the devices
+    query_count(client, url, admin.headers, 8 if with_counters else 10)
+
+    body = client.get(url, headers=admin.headers).get_json()
+    assert body["size"] == device_count
+    assert {item["device"]["id"]: item["latest_review"]["id"] for item in body["data"]} == seeded.latest_reviews
+    assert {name: count for name, count in body["status_count"].items() if count} == {"requesting": device_count}
+
+
+def test_latest_reviews_of_devices_without_reviews(client, fake_db, admin):
+    seeded = seed_customer(fake_db, admin.id)
+    seed_device(fake_db, admin.id, seeded.facilities[0], seeded.device_type, "cam-1")
+
+    query_count(client, f"/reviews/latest?customer_id={seeded.customer.id}", admin.headers, 9)
+
+    body = client.get(f"/reviews/latest?customer_id={seeded.customer.id}", headers=admin.headers).get_json()
+    assert body["data"][0]["latest_review"] == {}
+
+
+@pytest.mark.parametrize("device_count", [2, 20])
+def test_device_list(client, fake_db, admin, aitrios, device_count):
+    seeded = seed_reviews(fake_db, admin.id, device_count, reviews_per_device=1)
+    # Half of the devices are registered in the console, plus a device not registered in the application
+    aitrios.devices = [
+        SimpleNamespace(device_id=device_id, device_name="Console name", group_name="", connection_status="Connected")
+        for device_id in [device.device_id for device in seeded.devices[::2]] + ["console-only"]
+    ]
+
+    query_count(client, f"/devices?customer_id={seeded.customer.id}", admin.headers, 4)
+
+    devices = client.get(f"/devices?customer_id={seeded.customer.id}", headers=admin.headers).get_json()["devices"]
+    assert len(devices) == device_count + 1
+    registered = {device["device_id"]: device for device in devices if device["registered_flag"]}
+    assert len(registered) == device_count
+    assert registered["cam-1"]["facility_name"] == seeded.facilities[1].facility_name
+    assert registered["cam-1"]["device_type_name"] == seeded.device_type.name
+
+
+@pytest.mark.parametrize("review_count", [2, 30])
+def test_review_history(client, fake_db, admin, review_count):
+    seeded = seed_reviews(fake_db, admin.id, 1, reviews_per_device=review_count)
+    device_id = seeded.devices[0].id
+
+    query_count(client, f"/reviews/devices/{device_id}/history?page=1&page_size=50", admin.headers, 6)
+    query_count(client, f"/reviews/devices/{device_id}/history/cursor?limit=50", admin.headers, 5)
+    query_count(client, f"/reviews/devices/{device_id}/history/cursor?limit=50&include_images=true", admin.headers, 5)
+
+    body = client.get(f"/reviews/devices/{device_id}/history/cursor?limit=50", headers=admin.headers).get_json()
+    assert body["reviews"][0]["id"] == seeded.latest_reviews[device_id]
+    assert body["size"] == review_count
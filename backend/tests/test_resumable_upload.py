@@ -0,0 +1,118 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/test_resumable_upload.py
+Description: Completion of the resumable uploads (POST /reviews/uploads/<upload_id>/complete).
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from prisma import Base64
+from src.api import reviews as reviews_api
+from src.schemas.response import ResponseHTTPSchema
+
+UPLOAD_ID = "6f1c2a8e-1111-4c3b-9d7e-000000000001"
+FACILITY_ID = 3
+CHUNK_BYTES = 64 * 1024
+
+
+class UploadSessions:
+    def __init__(self, session):
+        self.session = session
+
+    def find_unique(self, where: dict):
+        return self.session if self.session.upload_uuid == where["upload_uuid"] else None
+
+    def update_many(self, where: dict, data: dict):
+        for name, value in data.items():
+            setattr(self.session, name, value)
+        return 1
+
+
+class UploadChunks:
+    def __init__(self, image: bytes):
+        self.rows = {
+            offset: SimpleNamespace(data=Base64.encode(image[offset : offset + CHUNK_BYTES]))
+            for offset in range(0, len(image), CHUNK_BYTES)
+        }
+
+    def find_unique(self, where: dict):
+        return self.rows.get(where["session_id_offset"]["offset"])
+
+    def delete_many(self, where: dict):
+        count = len(self.rows)
+        self.rows.clear()
+        return count
+
+
+@pytest.fixture
+def connection(monkeypatch, large_png):
+    session = SimpleNamespace(
+        id=1,
+        upload_uuid=UPLOAD_ID,
+        device_id=12,
+        facility_id=FACILITY_ID,
+        total_bytes=len(large_png),
+        received_bytes=len(large_png),
+        expires_at_utc=datetime.utcnow() + timedelta(minutes=10),
+        review_id=None,
+    )
+    connection = SimpleNamespace(upload_session=UploadSessions(session), upload_chunk=UploadChunks(large_png))
+    monkeypatch.setattr(reviews_api, "db", connection)
+    return connection
+
+
+@pytest.fixture
+def created_reviews(monkeypatch):
+    created = []
+
+    def create_review(device_id, payload, get_image, capture_id=None):
+        created.append(device_id)
+        return ResponseHTTPSchema(
+            status_code=201, message="Create successfully", data={"review_id": 41}
+        ).make_response()
+
+    monkeypatch.setattr(reviews_api, "create_review", create_review)
+    return created
+
+
+def complete(upload_id: str = UPLOAD_ID):
+    # The contractor token is checked by `validate_auth_token`, which passes its payload
+    return reviews_api.complete_upload_by_contractor.__wrapped__(upload_id, payload={"facility_id": FACILITY_ID})
+
+
+def test_complete_creates_the_review_and_keeps_the_session(connection, created_reviews):
+    body, status_code = complete()
+
+    assert status_code == 201
+    assert body["data"] == {"review_id": 41}
+    assert created_reviews == [12]
+    assert connection.upload_session.session.review_id == 41
+    assert connection.upload_chunk.rows == {}
+
+
+def test_repeated_complete_returns_the_created_review(connection, created_reviews):
+    complete()
+
+    body, status_code = complete()
+
+    assert status_code == 200
+    assert body["data"] == {"review_id": 41}
+    assert created_reviews == [12]
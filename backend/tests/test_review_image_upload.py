@@ -0,0 +1,76 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/test_review_image_upload.py
+Description: Streaming review image upload (src/services/review_image_service.py).
+"""
+
+from io import BytesIO
+
+import pytest
+from src.config import IMAGE_UPLOAD_CHUNK_BYTES
+from src.exceptions import APIException, ErrorCodes
+from src.services.review_image_service import MAX_FORM_FIELD_BYTES, read_multipart_image, read_raw_image
+
+BOUNDARY = "caat-test-boundary"
+
+
+def multipart_body(fields: dict, image: bytes) -> bytes:
+    parts = [
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        for name, value in fields.items()
+    ]
+    parts.append(
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="image"; filename="image.png"\r\n'
+        "Content-Type: image/png\r\n\r\n".encode() + image + b"\r\n"
+    )
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+def test_multipart_upload_larger_than_a_chunk(large_png):
+    assert len(large_png) > 2 * IMAGE_UPLOAD_CHUNK_BYTES
+    body = multipart_body({"device_id": "12"}, large_png)
+
+    buffer, fields = read_multipart_image(BytesIO(body), BOUNDARY, len(body))
+    with buffer:
+        assert fields == {"device_id": "12"}
+        assert buffer.size == len(large_png)
+        assert buffer.mime_type == "image/png"
+        assert buffer.to_data_url().startswith("data:image/")
+
+
+def test_multipart_upload_without_content_length(large_png):
+    body = multipart_body({"device_id": "12"}, large_png)
+
+    buffer, _ = read_multipart_image(BytesIO(body), BOUNDARY, None)
+    with buffer:
+        assert buffer.size == len(large_png)
+
+
+def test_multipart_form_field_too_large(large_png):
+    body = multipart_body({"device_id": "1" * (MAX_FORM_FIELD_BYTES + 1)}, large_png)
+
+    with pytest.raises(APIException) as raised:
+        read_multipart_image(BytesIO(body), BOUNDARY, len(body))
+    assert raised.value.error_code == ErrorCodes.INVALID_INPUT["error_code"]
+
+
+def test_raw_upload_larger_than_a_chunk(large_png):
+    with read_raw_image(BytesIO(large_png), len(large_png)) as buffer:
+        assert buffer.size == len(large_png)
+        assert buffer.to_data_url().startswith("data:image/")
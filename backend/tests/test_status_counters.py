@@ -0,0 +1,272 @@
+# ------------------------------------------------------------------------
+# Copyright 2025 Sony Semiconductor Solutions Corp. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------
+
+
+"""
+File: backend/tests/test_status_counters.py
+Description: Device result counters (src/models/status_counters.py) compared with the device table after each
+write path, and the device count fallback of the customers without counters.
+"""
+
+import base64
+import json
+from io import BytesIO
+
+import pytest
+from src.models.status_counters import CUSTOMER_WIDE, get_status_counts, reconcile_status_counters
+from src.schemas.reviews import DeviceReviewAllowedEnums
+from tests.seed import contractor_headers, make_noise_image, seed_customer, seed_device
+
+
+def device_counts(connection, customer_id: int, facility_id: int = CUSTOMER_WIDE) -> dict:
+    """
+    Method to count the devices by result with a group by, as the counters are not maintained
+    """
+    where = {"facility": {"customer_id": customer_id}}
+    if facility_id != CUSTOMER_WIDE:
+        where["facility_id"] = facility_id
+    rows = connection.device.group_by(by=["result"], where=where, count={"_all": True})
+    return {row["result"]: row["_count"]["_all"] for row in rows}
+
+
+def assert_counters_match(connection, *customer_ids: int):
+    for customer_id in customer_ids:
+        facilities = connection.facility.find_many(where={"customer_id": customer_id})
+        for facility_id in [CUSTOMER_WIDE] + [facility.id for facility in facilities]:
+            counters = {
+                result: count
+                for result, count in get_status_counts(connection, customer_id, facility_id).items()
+                if count
+            }
+            assert counters == device_counts(connection, customer_id, facility_id), (customer_id, facility_id)
+
+
+@pytest.fixture
+def customers(fake_db, admin):
+    first = seed_customer(fake_db, admin.id, "Customer A", facilities=2)
+    second = seed_customer(fake_db, admin.id, "Customer B")
+    reconcile_status_counters(fake_db, [first.customer.id, second.customer.id])
+    return first, second
+
+
+def save_devices(client, admin, customer, *devices):
+    response = client.post(
+        "/devices",
+        headers=admin.headers,
+        json={
+            "customer_id": customer.customer.id,
+            "devices": [
+                {
+                    "device_id": device_id,
+                    "device_name": f"Camera {device_id}",
+                    "facility_id": facility.id,
+                    "device_type_id": customer.device_type.id,
+                }
+                for device_id, facility in devices
+            ],
+        },
+    )
+    assert response.status_code == 200, response.get_json()
+
+
+def test_device_create_update_and_delete(client, fake_db, admin, customers):
+    first, second = customers
+    facility, other_facility = first.facilities
+
+    save_devices(client, admin, first, ("cam-1", facility), ("cam-2", facility), ("cam-3", other_facility))
+    assert get_status_counts(fake_db, first.customer.id)[DeviceReviewAllowedEnums.INITIAL_STATE.value] == 3
+    assert_counters_match(fake_db, first.customer.id)
+
+    # Moved to another facility, then to a facility of the other customer
+    fake_db.device.update_many(where={"device_id": "cam-1"}, data={"result": DeviceReviewAllowedEnums.APPROVED.value})
+    reconcile_status_counters(fake_db, [first.customer.id])
+    save_devices(client, admin, first, ("cam-1", other_facility))
+    assert_counters_match(fake_db, first.customer.id)
+    save_devices(client, admin, first, ("cam-2", second.facilities[0]))
+    assert_counters_match(fake_db, first.customer.id, second.customer.id)
+
+    response = client.delete(
+        "/devices", headers=admin.headers, json={"devices": [{"device_id": "cam-3", "facility_id": other_facility.id}]}
+    )
+    assert response.status_code == 200
+    assert fake_db.device.count(where={"device_id": "cam-3"}) == 0
+    assert_counters_match(fake_db, first.customer.id, second.customer.id)
+
+
+def test_review_create_update_and_delete(client, fake_db, admin, customers):
+    first, _ = customers
+    facility = first.facilities[0]
+    save_devices(client, admin, first, ("cam-1", facility), ("cam-2", facility))
+    device = fake_db.device.find_first(where={"device_id": "cam-1"})
+    image = base64.b64encode(make_noise_image(16)).decode()
+
+    response = client.post(
+        "/reviews", headers=contractor_headers(facility), json={"device_id": device.id, "image": image}
+    )
+    assert response.status_code == 201, response.get_json()
+    review_id = response.get_json()["data"]["review_id"]
+    assert get_status_counts(fake_db, first.customer.id, facility.id) == {
+        DeviceReviewAllowedEnums.INITIAL_STATE.value: 1,
+        DeviceReviewAllowedEnums.REQUESTING_FOR_REVIEW.value: 1,
+    }
+    assert_counters_match(fake_db, first.customer.id)
+
+    response = client.put(
+        f"/reviews/{review_id}", headers=admin.headers, json={"result": DeviceReviewAllowedEnums.APPROVED.value}
+    )
+    assert response.status_code == 200, response.get_json()
+    assert fake_db.device.find_unique(where={"id": device.id}).result == DeviceReviewAllowedEnums.APPROVED.value
+    assert_counters_match(fake_db, first.customer.id)
+
+    response = client.delete(f"/reviews/devices/{device.id}", headers=admin.headers)
+    assert response.status_code == 200, response.get_json()
+    assert fake_db.device.find_unique(where={"id": device.id}).result == DeviceReviewAllowedEnums.INITIAL_STATE.value
+    assert_counters_match(fake_db, first.customer.id)
+
+
+def test_facility_moved_to_another_customer(client, fake_db, admin, customers):
+    first, second = customers
+    facility = first.facilities[0]
+    save_devices(client, admin, first, ("cam-1", facility), ("cam-2", facility), ("cam-3", first.facilities[1]))
+    fake_db.device.update_many(where={"device_id": "cam-1"}, data={"result": DeviceReviewAllowedEnums.REJECTED.value})
+    reconcile_status_counters(fake_db, [first.customer.id])
+
+    response = client.post(
+        f"/facilities/{facility.id}",
+        headers=admin.headers,
+        json={
+            "customer_id": second.customer.id,
+            "facility_name": "Moved facility",
+            "facility_type_id": first.facility_type.id,
+            "prefecture": "Tokyo",
+            "municipality": "Minato",
+            "effective_start_utc": facility.effective_start_utc,
+            "effective_end_utc": facility.effective_end_utc,
+        },
+    )
+    assert response.status_code == 200, response.get_json()
+    assert get_status_counts(fake_db, second.customer.id, facility.id) == {
+        DeviceReviewAllowedEnums.INITIAL_STATE.value: 1,
+        DeviceReviewAllowedEnums.REJECTED.value: 1,
+    }
+    assert_counters_match(fake_db, first.customer.id, second.customer.id)
+
+
+def test_import_builds_the_counters(client, fake_db, admin, customers):
+    first, _ = customers
+    save_devices(client, admin, first, ("cam-1", first.facilities[0]))
+    facility = {
+        "facility_type_name": "Imported type",
+        "prefecture": "Tokyo",
+        "municipality": "Minato",
+        "effective_start_utc": "2020-01-01T00:00:00+00:00",
+        "effective_end_utc": "2099-12-31T23:59:59+00:00",
+    }
+    data = {
+        "admin": [
+            {
+                "facility_types": [{"name": "Imported type"}],
+                "device_types": [
+                    {
+                        "name": "Imported camera",
+                        "sample_image_blob": base64.b64encode(make_noise_image(16)).decode(),
+                    }
+                ],
+                "customers": [
+                    {
+                        "customer_name": "Imported customer",
+                        "auth_url": "https://auth.example.com",
+                        "base_url": "https://api.example.com",
+                        "client_id": "client",
+                        "client_secret": "secret",
+                        "application_id": None,
+                        "facilities": [
+                            {
+                                **facility,
+                                "facility_name": f"Imported facility {index}",
+                                "devices": [
+                                    {
+                                        "device_id": f"imported-{index}-{number}",
+                                        "device_name": f"Camera {number}",
+                                        "device_type_name": "Imported camera",
+                                    }
+                                    for number in range(index + 1)
+                                ],
+                            }
+                            for index in range(2)
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+    response = client.post(
+        "/data-migration/import",
+        headers=admin.headers,
+        data={"json_file": (BytesIO(json.dumps(data).encode()), "import.json")},
+    )
+    assert response.status_code == 200, response.get_json()
+
+    customer = fake_db.customer.find_first(where={"customer_name": "Imported customer"})
+    assert get_status_counts(fake_db, customer.id) == {DeviceReviewAllowedEnums.INITIAL_STATE.value: 3}
+    assert_counters_match(fake_db, customer.id)
+    # The counters of the replaced customers are removed
+    assert fake_db.status_counter.count(where={"customer_id": first.customer.id}) == 0
+
+
+def test_reconcile_rebuilds_the_counters(fake_db, admin):
+    seeded = seed_customer(fake_db, admin.id, facilities=2)
+    for index, result in enumerate([1, 1, 2, 3, 4, 4]):
+        seed_device(fake_db, admin.id, seeded.facilities[index % 2], seeded.device_type, f"cam-{index}", result)
+    customer_id = seeded.customer.id
+    assert get_status_counts(fake_db, customer_id) == {}
+
+    reconcile_status_counters(fake_db, [customer_id])
+    assert get_status_counts(fake_db, customer_id) == {1: 2, 2: 1, 3: 1, 4: 2}
+    assert_counters_match(fake_db, customer_id)
+
+    # Drifted counters are rebuilt
+    fake_db.status_counter.update_many(where={"customer_id": customer_id}, data={"count": {"increment": 5}})
+    reconcile_status_counters(fake_db, [customer_id])
+    assert_counters_match(fake_db, customer_id)
+
+
+def test_reconcile_without_devices_marks_the_counters_built(fake_db, admin):
+    seeded = seed_customer(fake_db, admin.id)
+
+    reconcile_status_counters(fake_db, [seeded.customer.id])
+
+    assert get_status_counts(fake_db, seeded.customer.id) == {DeviceReviewAllowedEnums.INITIAL_STATE.value: 0}
+
+
+@pytest.mark.parametrize("with_counters", [False, True])
+def test_latest_reviews_status_count(client, fake_db, admin, with_counters):
+    seeded = seed_customer(fake_db, admin.id)
+    for index, result in enumerate([1, 2, 2, 4]):
+        seed_device(fake_db, admin.id, seeded.facilities[0], seeded.device_type, f"cam-{index}", result)
+    if with_counters:
+        reconcile_status_counters(fake_db, [seeded.customer.id])
+
+    response = client.get(f"/reviews/latest?customer_id={seeded.customer.id}", headers=admin.headers)
+
+    assert response.status_code == 200, response.get_json()
+    body = response.get_json()
+    # Customers without counters are counted from the device table
+    assert body["status_count"] == {"initial_state": 1, "requesting": 2, "approved": 1}
+    assert body["total"] == 4
+    if not with_counters:
+        assert fake_db.status_counter.count() == 0
@@ -42,6 +42,7 @@ from src.db.data_manager import (
     clear_all_data,
     get_admin_by_login_id,
     get_admin_data_from_db,
+    reset_change_counters,
     update_admin_by_id,
 )
 from src.utils.logger import get_json_logger
@@ -151,6 +152,10 @@ def db_populate(excel_path: str, csv_dir_path: str):
         logger.info(f"Device data is successfully added in Database")
         tables_added.add("device")
 
+    # Cached master data lists of the admin app are revalidated against these versions
+    if tables_added & {"customer", "facility", "facility_type", "device_type"}:
+        reset_change_counters()
+
     return {"is_valid": True}, tables_added
 
 
@@ -30,6 +30,9 @@ from werkzeug.security import generate_password_hash
 
 logger = get_json_logger()
 
+# facility_id of the customer wide rows of the status_counter table
+CUSTOMER_WIDE_FACILITY_ID = 0
+
 
 def create_admin_cli(login_id: str, admin_password: str) -> bool:
     """
@@ -467,6 +470,43 @@ def add_facility_data(facility_dataframe: pd.DataFrame) -> bool:
     return True
 
 
+def add_to_status_counters(connection, customer_id: int, facility_id: int, result: int):
+    """Counts a new device in the status counters of the backend (status_counter table).
+    Nothing is written for customers whose counters were not built by the backend reconcile script,
+    their counts are read from the device table. The customer wide row is updated first, as by the backend.
+
+    Args:
+        connection: Prisma client or transaction creating the device
+        customer_id (int): Customer ID of the device facility
+        facility_id (int): Facility ID of the device
+        result (int): Result of the new device
+    """
+    if not connection.status_counter.find_first(
+        where={"customer_id": customer_id, "facility_id": CUSTOMER_WIDE_FACILITY_ID}
+    ):
+        return
+
+    for counter_facility_id in [CUSTOMER_WIDE_FACILITY_ID, facility_id]:
+        connection.status_counter.upsert(
+            where={
+                "customer_id_facility_id_result": {
+                    "customer_id": customer_id,
+                    "facility_id": counter_facility_id,
+                    "result": result,
+                }
+            },
+            data={
+                "create": {
+                    "customer_id": customer_id,
+                    "facility_id": counter_facility_id,
+                    "result": result,
+                    "count": 1,
+                },
+                "update": {"count": {"increment": 1}},
+            },
+        )
+
+
 def add_device_data(device_dataframe: pd.DataFrame) -> bool:
     """Adds device data in Database
 
@@ -550,15 +590,17 @@ def add_device_data(device_dataframe: pd.DataFrame) -> bool:
             )
 
             if not existing_device:
-                db.device.create(
-                    {
-                        "device_id": row["device_id"],
-                        "device_name": row["device_name"],
-                        "facility_id": facility_id_for_device,
-                        "device_type_id": devicetype_id_for_device,
-                        "admin_id": admin_id_for_device,
-                    }
-                )
+                with db.tx() as transaction:
+                    new_device = transaction.device.create(
+                        {
+                            "device_id": row["device_id"],
+                            "device_name": row["device_name"],
+                            "facility_id": facility_id_for_device,
+                            "device_type_id": devicetype_id_for_device,
+                            "admin_id": admin_id_for_device,
+                        }
+                    )
+                    add_to_status_counters(transaction, customer_id_for_row, facility_id_for_device, new_device.result)
 
                 logger.info(f"Device '{row['device_name']}' added to the DB.")
                 new_devices_added = True
@@ -573,6 +615,23 @@ def add_device_data(device_dataframe: pd.DataFrame) -> bool:
     return True
 
 
+def reset_change_counters() -> bool:
+    """Resets the master data versions of the backend (change_counter table),
+    so that the admin app reloads the customers, facilities, facility types and device types.
+
+    Returns:
+        bool: True if success otherwise False
+    """
+    db = get_db_instance()
+
+    try:
+        db.change_counter.delete_many()
+    except errors.PrismaError as e:
+        logger.exception(f"Failed to reset the change counters. Error: {e}")
+        return False
+    return True
+
+
 async def clear_all_data() -> bool:
     """Clears All table data from database if tables exist.
 
@@ -582,8 +641,24 @@ async def clear_all_data() -> bool:
     db = get_db_instance()
 
     try:
-        # List of tables to clear
-        tables = ["review", "device", "device_type", "facility", "facility_type", "customer", "admin"]
+        # List of tables to clear, referencing tables first
+        tables = [
+            "review",
+            "device_capture",
+            "upload_chunk",
+            "upload_session",
+            "idempotency_record",
+            "device",
+            "device_type",
+            "image",
+            "retention_policy",
+            "facility",
+            "facility_type",
+            "customer",
+            "admin",
+            "change_counter",
+            "status_counter",
+        ]
 
         for table in tables:
             try:
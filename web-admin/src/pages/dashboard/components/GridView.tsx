@@ -29,7 +29,9 @@ import {
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
 import { useTranslation } from "react-i18next";
+import { useInView } from "react-intersection-observer";
 import { statusToString } from "../../../utils";
+import { getReviewImage } from "../../../services";
 import { ImageWithFallback } from "../../../components/ImageWithFallback";
 import { DeviceConnectionState } from "../../../components/DeviceConnectionState";
 
@@ -44,7 +46,6 @@ interface TableRow {
   };
   latestReviewId: number;
   result: number;
-  imageBlob: string;
   imageDate: string;
   requested: string;
   answered: string;
@@ -64,6 +65,46 @@ interface GridViewProps {
   isLastPage: boolean,
 }
 
+// Interface for LatestReviewImage component properties
+interface LatestReviewImageProps {
+  reviewId: number;
+  result: number;
+  alt: string;
+  fallbackIconSize: number;
+}
+
+// Image of the latest review, fetched once the card is scrolled into view
+const LatestReviewImage = ({ reviewId, result, alt, fallbackIconSize }: LatestReviewImageProps) => {
+  const { ref, inView } = useInView({ triggerOnce: true });
+  const [imageBlob, setImageBlob] = useState<string>();
+
+  useEffect(() => {
+    // Only the submitted reviews have an image
+    if (!inView || !reviewId || ![2, 3, 4].includes(result)) return;
+
+    let cancelled = false;
+    getReviewImage(reviewId)
+      .then((image) => !cancelled && setImageBlob(image))
+      .catch(() => !cancelled && setImageBlob(undefined));
+    return () => {
+      cancelled = true;
+    };
+  }, [inView, reviewId, result]);
+
+  return (
+    <Box ref={ref} sx={{ display: "flex", width: "100%", height: "100%" }}>
+      <ImageWithFallback
+        src={imageBlob}
+        alt={alt}
+        height="100%"
+        aspectRatio={4 / 3}
+        fallbackIconSize={fallbackIconSize}
+        fallbackWithIconOnly
+      />
+    </Box>
+  );
+};
+
 export const GridView = ({
   data,
   deviceStatus,
@@ -182,16 +223,12 @@ export const GridView = ({
                 </Typography>
               </Tooltip>
               <AspectRatio variant="plain" ratio="4/3" sx={{ borderRadius: 0 }}>
-                <Box sx={{ display: "flex" }}>
-                  <ImageWithFallback
-                    src={row.imageBlob}
-                    alt={t("reviewRequestPage.submittedImage") + row.id}
-                    height="100%"
-                    aspectRatio={4 / 3}
-                    fallbackIconSize={view === "small" ? 50 : view === "medium" ? 75 : 100}
-                    fallbackWithIconOnly
-                  />
-                </Box>
+                <LatestReviewImage
+                  reviewId={row.latestReviewId}
+                  result={row.result}
+                  alt={t("reviewRequestPage.submittedImage") + row.id}
+                  fallbackIconSize={view === "small" ? 50 : view === "medium" ? 75 : 100}
+                />
               </AspectRatio>
               <Box sx={{
                 display: "flex",
@@ -44,7 +44,6 @@ interface TableRow {
   municipality: string;
   latestReviewId: number;
   result: number;
-  imageBlob: string;
   imageDate: string;
   requested: string;
   answered: string;
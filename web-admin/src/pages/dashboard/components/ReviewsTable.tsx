@@ -59,7 +59,6 @@ interface DeviceLatestReviewDetails {
   latest_review: {
     result: number;
     id: number;
-    image_blob: string;
     image_date_utc: string;
     created_at_utc: string;
     last_updated_at_utc: string;
@@ -79,7 +78,6 @@ interface TableRow {
   municipality: string;
   latestReviewId: number;
   result: number;
-  imageBlob: string;
   imageDate: string;
   requested: string;
   answered: string;
@@ -216,7 +214,6 @@ export default function ReviewsTable() {
             municipality: value.device?.facility?.municipality,
             latestReviewId: value.latest_review?.id,
             result: value.latest_review?.result,
-            imageBlob: value.latest_review?.image_blob,
             imageDate: value.latest_review?.image_date_utc,
             requested: value.latest_review?.created_at_utc,
             answered: value.latest_review?.last_updated_at_utc,
@@ -34,7 +34,12 @@ import { ArrowBackIosRounded, ImageSearch } from "@mui/icons-material";
 import { useEffect, useState } from "react";
 import { useParams, useNavigate } from "react-router-dom";
 import { formatDatetime, statusToString } from "../../utils";
-import { getDeviceReviewsHistory } from "../../services";
+import {
+  getDeviceReviewsHistory,
+  getDeviceTypeById,
+  getReferenceImageUrl,
+  getReviewImage,
+} from "../../services";
 import { NotFound } from "../../components/NotFound";
 import { TableCell } from "../../components/TableCell";
 import { useTranslation } from "react-i18next";
@@ -55,7 +60,6 @@ interface TableRow {
   requested: string;
   answered: string;
   reviewComment: string;
-  imageBlob: string;
 }
 
 // Interface for Device details from Response payload
@@ -63,8 +67,9 @@ interface DeviceInfo {
   id: number;
   deviceId: string;
   deviceName: string;
+  deviceTypeId: number;
   deviceType: string;
-  sampleImageBlob: string;
+  sampleImageUrl: string | null;
 }
 
 // Interface for Review details from Response payload
@@ -79,7 +84,6 @@ interface Review {
   created_at_utc: string;
   last_updated_at_utc: string;
   review_comment: string;
-  image_blob: string;
 }
 
 const IMAGE_NOT_SUBMITTED = "NoImageSubmitted";
@@ -108,15 +112,46 @@ export const ReviewHistoryPage = () => {
   const [openModal, setOpenModal] = useState<boolean>(false);
   const [selectedRow, setSelectedRow] = useState<TableRow | null>(null);
   const [errorMessage, setErrorMessage] = useState("");
-  const [totalReviews, setTotalReviews] = useState<number>(0);
-  const [totalPages, setTotalPages] = useState<number>(0);
+  // Cursor of each page, the first page has none and the next one is known once a page is loaded
+  const [pageCursors, setPageCursors] = useState<(string | null)[]>([null]);
   const [currentPage, setCurrentPage] = useState<number>(1);
   const [deviceNotFound, setDeviceNotFound] = useState(false);
+  // Images are fetched only when the preview is opened
+  const [submittedImages, setSubmittedImages] = useState<Record<number, string>>({});
+  const [referenceImage, setReferenceImage] = useState<string>();
+  const [isImageLoading, setIsImageLoading] = useState<boolean>(false);
+
+  // Fetches the images of the preview which were not fetched yet
+  const fetchPreviewImages = async (row: TableRow) => {
+    const fetchSubmittedImage = async () => {
+      if (!(row.id in submittedImages)) {
+        const imageBlob = await getReviewImage(row.id).catch(() => undefined);
+        setSubmittedImages((images) => ({ ...images, [row.id]: imageBlob ?? "" }));
+      }
+    };
+    const fetchReferenceImage = async () => {
+      if (referenceImage === undefined && deviceInfo) {
+        // The reference image is still stored in the device type when it has no URL
+        const url = deviceInfo.sampleImageUrl
+          ? getReferenceImageUrl(deviceInfo.sampleImageUrl)
+          : (await getDeviceTypeById(deviceInfo.deviceTypeId).catch(() => null))?.sample_image_blob;
+        setReferenceImage(url ?? "");
+      }
+    };
+
+    setIsImageLoading(true);
+    try {
+      await Promise.all([fetchSubmittedImage(), fetchReferenceImage()]);
+    } finally {
+      setIsImageLoading(false);
+    }
+  };
 
   // Handles showing image preview
   const handleOpenModal = (row: TableRow) => {
     setSelectedRow(row);
     setOpenModal(true);
+    fetchPreviewImages(row);
   };
 
   // Handles hiding image preview
@@ -125,17 +160,14 @@ export const ReviewHistoryPage = () => {
     setSelectedRow(null);
   };
 
-  // Fetches review history for a device
+  // Fetches the current page of the review history of a device
   const fetchDeviceReviewsHistory = async (deviceId: number) => {
     if (isLoading) return;
     setIsLoading(true);
     try {
-      const reviewsHistory = await getDeviceReviewsHistory(deviceId, currentPage, PER_PAGE);
+      const reviewsHistory = await getDeviceReviewsHistory(deviceId, PER_PAGE, pageCursors[currentPage - 1]);
       if (reviewsHistory) {
         setData(reviewsHistory?.reviews.map((value: Review) => {
-          const submittedImageBlob = [2, 3, 4].includes(value?.result)
-            ? (value?.image_blob ?? "") : IMAGE_NOT_SUBMITTED;
-
           return {
             id: value.id,
             result: value.result,
@@ -146,7 +178,6 @@ export const ReviewHistoryPage = () => {
             imageDate: value.image_date_utc,
             requested: value.created_at_utc,
             answered: value.last_updated_at_utc,
-            imageBlob: submittedImageBlob,
             reviewComment: value.review_comment,
           }
         }));
@@ -154,13 +185,14 @@ export const ReviewHistoryPage = () => {
           id: reviewsHistory.device.id,
           deviceId: reviewsHistory.device.device_id,
           deviceName: reviewsHistory.device.device_name,
+          deviceTypeId: reviewsHistory.device.device_type.id,
           deviceType: reviewsHistory.device.device_type.name,
-          sampleImageBlob: reviewsHistory.device.device_type.sample_image_blob,
+          sampleImageUrl: reviewsHistory.device.device_type.sample_image_url ?? null,
         });
-        setTotalReviews(reviewsHistory.total);
-        const newTotalPages = Math.ceil(reviewsHistory.total / PER_PAGE);
-        setTotalPages(newTotalPages);
-        setCurrentPage(Math.max(Math.min(currentPage, newTotalPages), 1));
+        // Keeps the cursors of the loaded pages, and the cursor of the next page if there is one
+        setPageCursors((cursors) => reviewsHistory.has_more
+          ? [...cursors.slice(0, currentPage), reviewsHistory.next_cursor]
+          : cursors.slice(0, currentPage));
       }
     } catch (err) {
       handleError(err);
@@ -224,11 +256,10 @@ export const ReviewHistoryPage = () => {
 
       <Typography sx={{ marginTop: 2 }}>
         {t("dashboardPage.showing")
-          + Math.min((currentPage - 1) * PER_PAGE + 1, totalReviews)
+          + Math.min((currentPage - 1) * PER_PAGE + 1, (currentPage - 1) * PER_PAGE + data.length)
           + "-"
-          + Math.min(currentPage * PER_PAGE, totalReviews)
-          + t("dashboardPage.items") + t("dashboardPage.outOf")
-          + totalReviews + t("dashboardPage.items")}
+          + ((currentPage - 1) * PER_PAGE + data.length)
+          + t("dashboardPage.items")}
       </Typography>
 
       {data.length ? (
@@ -332,7 +363,7 @@ export const ReviewHistoryPage = () => {
             </Table>
           </Sheet>
           <Pagination
-            count={totalPages}
+            count={pageCursors.length}
             page={currentPage}
             onChange={(_, page) => setCurrentPage(page)}
             variant="outlined"
@@ -426,27 +457,40 @@ export const ReviewHistoryPage = () => {
                 <Typography sx={{ textAlign: "center", fontSize: 18, fontWeight: "bold" }}>
                   {t("reviewRequestPage.submittedImage")}
                 </Typography>
-                <ImageWithFallback
-                  src={selectedRow.imageBlob}
-                  alt={t("reviewRequestPage.submittedImage")}
-                  height="240px"
-                  aspectRatio={4 / 3}
-                  fallbackIconSize={80}
-                  data-testid="submitted-image"
-                />
+                {isImageLoading && !(selectedRow.id in submittedImages) ? (
+                  <Box sx={{ display: "flex", justifyContent: "center", alignItems: "center", height: "240px" }}>
+                    <CircularProgress variant="soft" />
+                  </Box>
+                ) : (
+                  <ImageWithFallback
+                    src={[2, 3, 4].includes(selectedRow.result)
+                      ? submittedImages[selectedRow.id] : IMAGE_NOT_SUBMITTED}
+                    alt={t("reviewRequestPage.submittedImage")}
+                    height="240px"
+                    aspectRatio={4 / 3}
+                    fallbackIconSize={80}
+                    data-testid="submitted-image"
+                  />
+                )}
               </Card>
               <Card variant="outlined" sx={{ flex: 1 }}>
                 <Typography sx={{ textAlign: "center", fontSize: 18, fontWeight: "bold" }}>
                   {t("reviewRequestPage.referenceImage")}
                 </Typography>
-                <ImageWithFallback
-                  src={deviceInfo?.sampleImageBlob}
-                  alt={t("reviewRequestPage.referenceImage")}
-                  height="240px"
-                  aspectRatio={4 / 3}
-                  fallbackIconSize={80}
-                  data-testid="reference-image"
-                />
+                {isImageLoading && referenceImage === undefined ? (
+                  <Box sx={{ display: "flex", justifyContent: "center", alignItems: "center", height: "240px" }}>
+                    <CircularProgress variant="soft" />
+                  </Box>
+                ) : (
+                  <ImageWithFallback
+                    src={referenceImage}
+                    alt={t("reviewRequestPage.referenceImage")}
+                    height="240px"
+                    aspectRatio={4 / 3}
+                    fallbackIconSize={80}
+                    data-testid="reference-image"
+                  />
+                )}
               </Card>
             </Box>
             <Card variant="outlined" sx={{ display: "flex", flexDirection: { xs: "column", md: "row" }, mx: 2 }}>
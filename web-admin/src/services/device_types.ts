@@ -22,6 +22,7 @@ export interface DeviceType {
   id: number;
   name: string;
   sample_image_blob?: string;
+  sample_image_url?: string;
 }
 
 interface BaseResponse<T> {
@@ -34,6 +35,11 @@ interface BaseResponse<T> {
 export interface DeviceTypeListResponse extends BaseResponse<DeviceType[]> {}
 export interface DeviceTypeResponse extends BaseResponse<DeviceType> {}
 
+// 参照画像URL取得 (APIの相対パスを絶対URLに変換)
+export const getReferenceImageUrl = (path: string): string => {
+  return client.getUri({ url: path.replace(/^\//, "") });
+};
+
 // デバイスタイプ一覧取得
 export const getDeviceTypes = async (): Promise<DeviceType[]> => {
   try {
@@ -51,7 +57,10 @@ export const getDeviceTypeById = async (
   deviceTypeId: number,
 ): Promise<DeviceType | null> => {
   try {
-    const res = await client.get(`device-types/${deviceTypeId}`);
+    // The edit form previews and resubmits the reference image itself
+    const res = await client.get(`device-types/${deviceTypeId}`, {
+      params: { fields: "*,sample_image_blob" },
+    });
     return res.data.data;
   } catch (err: any) {
     const error = err?.response?.data ?? err;
@@ -101,19 +101,19 @@ export const rejectReview = async (
   return submitReview(reviewId, result, comment);
 };
 
-// API call to fetch the review history of a device
+// API call to fetch one page of the review history of a device
 export const getDeviceReviewsHistory = async (
   deviceId: number,
-  currentPage: number,
-  perPage: number,
+  limit: number,
+  cursor?: string | null,
 ) => {
   try {
-    const url = "reviews/devices/" + deviceId.toString() + "/history";
-    // Pagination values are provided as params
+    const url = "reviews/devices/" + deviceId.toString() + "/history/cursor";
+    // The cursor of the previous page is provided to fetch the next one
     const res = await client.get(url, {
       params: {
-        page: currentPage,
-        page_size: perPage,
+        limit: limit,
+        cursor: cursor ?? undefined,
       },
     });
     return res.data;
@@ -124,6 +124,19 @@ export const getDeviceReviewsHistory = async (
   }
 };
 
+// API call to fetch the submitted image of a review
+export const getReviewImage = async (reviewId: number): Promise<string | undefined> => {
+  try {
+    const url = "reviews/" + reviewId.toString() + "/image";
+    const res = await client.get(url);
+    return res.data.image_blob ?? undefined;
+  } catch (err: any) {
+    const error = err?.response?.data ?? err;
+    console.warn(error.message);
+    throw error;
+  }
+};
+
 // API call to delete all the reviews of a device
 export const deleteDeviceReviews = async (deviceId: number) => {
   try {
@@ -44,6 +44,7 @@ import {
   setGridLineVisibility,
 } from "src/contexts/GlobalProvider";
 import {
+  toApiUrl,
   createReview,
   IMAGE_FETCH_TYPE,
   DEVICE_PROGRESS_STATUS,
@@ -77,6 +78,8 @@ export const ImageConfirmationPage = () => {
   const [reviewComment, setReviewComment] = useState<string>();
   const [isIntervalCapture, setIsIntervalCapture] = useState(false);
   const [cameraImageBase64, setCameraImageBase64] = useState<string>();
+  // Server side capture ID of cameraImageBase64, used instead of uploading the image
+  const [captureId, setCaptureId] = useState<string | null>(null);
   const [fetchingImage, setFetchingImage] = useState<boolean>(false);
   const [isLoading, setIsLoading] = useState<boolean>(false);
   const [reportClicked, setReportClicked] = useState<boolean>(false);
@@ -99,7 +102,11 @@ export const ImageConfirmationPage = () => {
     })
       .then((data) => {
         setReviewComment(data?.comment);
-        setSampleImage(data?.sample_image || SAMPLE_IMAGE_NOT_FOUND);
+        setSampleImage(
+          data?.sample_image_url
+            ? toApiUrl(data.sample_image_url)
+            : data?.sample_image || SAMPLE_IMAGE_NOT_FOUND,
+        );
       })
       .catch((errMsg) => {
         if (!retrySampleImageFetch) setRetrySampleImageFetch(true);
@@ -121,10 +128,13 @@ export const ImageConfirmationPage = () => {
       .then((data) => {
         if (data?.device_image) {
           setCameraImageBase64(data.device_image);
+          setCaptureId(data.capture_id || null);
         } else if (isIntervalRef.current && !cameraImageBase64) {
           setCameraImageBase64(DEVICE_IMAGE_NOT_FOUND);
+          setCaptureId(null);
         } else if (!isIntervalRef.current) {
           setCameraImageBase64(DEVICE_IMAGE_NOT_FOUND);
+          setCaptureId(null);
         }
         if (isIntervalCapture) {
           isIntervalRef.current &&
@@ -143,8 +153,10 @@ export const ImageConfirmationPage = () => {
         isIntervalRef.current = isIntervalCapture;
         if (isIntervalRef.current && !cameraImageBase64) {
           setCameraImageBase64(DEVICE_IMAGE_NOT_FOUND);
+          setCaptureId(null);
         } else if (!isIntervalRef.current) {
           setCameraImageBase64(DEVICE_IMAGE_NOT_FOUND);
+          setCaptureId(null);
         }
       })
       .finally(() => {
@@ -223,6 +235,7 @@ export const ImageConfirmationPage = () => {
           } else {
             createReview({
               image: cameraImageBase64,
+              captureId: captureId,
               deviceId: selectedDevice.id,
             })
               .then(() => navigate("/review-status"))
@@ -237,7 +250,7 @@ export const ImageConfirmationPage = () => {
           setIsLoading(false);
           setErrorMessage(e);
         });
-    }, [cameraImageBase64]); // eslint-disable-line react-hooks/exhaustive-deps
+    }, [cameraImageBase64, captureId]); // eslint-disable-line react-hooks/exhaustive-deps
 
   // Contractor is navigated back to the devices page
   const backClick = () => {
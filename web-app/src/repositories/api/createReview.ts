@@ -20,9 +20,16 @@ import { client } from "../client";
 // Type of Request Params object
 type ReqParams = {
   image: string;
+  // Capture ID of the image, the image is only uploaded if the capture has expired
+  captureId?: string | null;
   deviceId: number;
+  // Same key for the retries of one request, the server returns the first result
+  idempotencyKey?: string;
+  retried?: boolean;
 };
 
+const CAPTURE_NOT_FOUND_ERROR_CODE = 40414;
+
 // Type of Response Payload object
 type ResPayload = {
   data?: {
@@ -34,18 +41,28 @@ type ResPayload = {
 };
 
 // Create Review API
-export async function createReview(params: ReqParams) {
+export async function createReview(params: ReqParams): Promise<{ reviewId: number | null; message: string }> {
+  const idempotencyKey = params.idempotencyKey || crypto.randomUUID();
   return client
-    .post<ResPayload>("reviews", {
-      image: params.image,
-      device_id: params.deviceId,
-    })
+    .post<ResPayload>(
+      "reviews",
+      params.captureId
+        ? { capture_id: params.captureId, device_id: params.deviceId }
+        : { image: params.image, device_id: params.deviceId },
+      { headers: { "Idempotency-Key": idempotencyKey } },
+    )
     .then((response) => {
       if (response?.data?.data?.review_id)
         return { reviewId: response.data.data.review_id, message: "" };
       else return { reviewId: null, message: response.data.message };
     })
     .catch((err) => {
+      // The request body changes, so a new idempotency key is used
+      if (params.captureId && err?.response?.data?.error_code === CAPTURE_NOT_FOUND_ERROR_CODE)
+        return createReview({ ...params, captureId: null, idempotencyKey: undefined });
+      // No response (connection lost): retry once, a review created by the lost request is not duplicated
+      if (!err?.response && !params.retried)
+        return createReview({ ...params, idempotencyKey, retried: true });
       throw err.response.data.error_code || 10000;
     });
 }
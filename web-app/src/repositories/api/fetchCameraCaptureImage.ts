@@ -29,7 +29,9 @@ type ResPayload = {
   comment: string;
   device_image: string; // 画像データ
   retrieved_date: Date; // 画像取得日時
-  sample_image: string; // サンプル画像
+  sample_image: string; // サンプル画像 (sample_image_url が無い場合のみ)
+  sample_image_url?: string; // サンプル画像のURL (キャッシュ可能)
+  capture_id?: string; // device_image のキャプチャID
   status_code: number;
   error_code: number;
 };
@@ -21,3 +21,9 @@ export const client = axios.create({
   baseURL: process.env.REACT_APP_API_BASE_URL,
   timeout: 60000, // API requests timeout set to 60 seconds
 });
+
+// Absolute URL of a path returned by the API (e.g. sample_image_url), relative to the API base URL
+export function toApiUrl(path: string) {
+  const baseURL = client.defaults.baseURL ?? "";
+  return `${baseURL.replace(/\/+$/, "")}/${path.replace(/^\/+/, "")}`;
+}